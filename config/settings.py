@@ -67,6 +67,11 @@ class DetectionSettings(BaseSettings):
     bollinger_std_multiplier: float = 2.0
     min_std_threshold: float = 0.05  # Minimum volatility floor (prevents collapse)
     min_absolute_return_threshold: float = 1.0  # Minimum return % to flag (prevents noise)
+    # Quiet-tick prefilter for the combined/single-tick detectors (0 disables).
+    # Skips them when |latest return %| < min_return_prefilter and latest volume
+    # < min_volume_prefilter x lookback mean volume. Multi-timeframe always runs.
+    min_return_prefilter: float = 0.0
+    min_volume_prefilter: float = 0.0
 
     # Time windows
     lookback_window_minutes: int = 60
@@ -146,6 +151,10 @@ class DataIngestionSettings(BaseSettings):
     # Polling configuration
     poll_interval_seconds: int = 60
     request_timeout_seconds: int = 10
+    price_cache_ttl_seconds: float = 2.0  # Reuse fetched prices for this long (0 disables)
+
+    # Backfill: SQLite file caching closed historical candle windows (unset disables)
+    kline_cache_path: str | None = None
 
 
 class NewsSettings(BaseSettings):
@@ -175,6 +184,15 @@ class NewsSettings(BaseSettings):
     # Historical replay configuration
     replay_dataset_path: str = "datasets/news/"
 
+    # Sources fetched at once by the aggregator
+    max_concurrent_fetches: int = 16
+    fetch_cache_ttl_seconds: float = 60.0  # Reuse a source's results for this long (0 disables)
+    health_check_timeout_seconds: float = 3.0  # Sources not answering in time count as unhealthy
+    health_cache_ttl_seconds: float = 30.0  # Reuse the last health report for this long
+    source_timeout_seconds: float = 20.0  # Per-attempt cap on one source fetch (Grok is slowest)
+    breaker_failure_threshold: int = 3  # Consecutive failed fetches before a source is skipped
+    breaker_reset_seconds: float = 30.0  # How long a failing source is skipped before a retry
+
     # API Keys (now optional for paid providers)
     cryptopanic_api_key: str | None = None
     newsapi_api_key: str | None = None
@@ -192,6 +210,12 @@ class ClusteringSettings(BaseSettings):
     )
 
     embedding_model: str = "all-MiniLM-L6-v2"
+    embedding_batch_size: int = 128
+    # CPU inference backend: PyTorch FP32, or opt-in INT8 ONNX (needs the "onnx"
+    # extra; quantized embeddings can change cluster assignments)
+    embedding_cpu_backend: Literal["onnx_int8", "torch"] = "torch"
+    embedding_onnx_file: str = "onnx/model_quint8_avx2.onnx"  # or model_qint8_avx512_vnni.onnx
+    embedding_cache_size: int = 4096  # Cached embeddings by text hash (0 disables)
     min_cluster_size: int = 2
     clustering_algorithm: Literal["hdbscan", "dbscan"] = "hdbscan"
 
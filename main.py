@@ -310,16 +310,26 @@ async def backfill(symbol, backfill_all, days):
 
         # Determine which client to use
         from src.phase1_detector.data_ingestion import CoinbaseClient, BinanceClient
+        from src.phase1_detector.data_ingestion.kline_cache import KlineCache
+
+        # Closed candle windows are reused across runs when a cache path is set
+        kline_cache = (
+            KlineCache(settings.data_ingestion.kline_cache_path)
+            if settings.data_ingestion.kline_cache_path
+            else None
+        )
 
         if settings.data_ingestion.primary_source == "coinbase":
             client = CoinbaseClient(
                 api_key=settings.data_ingestion.coinbase_api_key,
                 api_secret=settings.data_ingestion.coinbase_api_secret,
+                kline_cache=kline_cache,
             )
         else:
             client = BinanceClient(
                 api_key=settings.data_ingestion.binance_api_key,
                 api_secret=settings.data_ingestion.binance_api_secret,
+                kline_cache=kline_cache,
             )
 
         # Determine symbols to process
@@ -413,6 +423,8 @@ async def backfill(symbol, backfill_all, days):
 
         # Close client
         await client.close()
+        if kline_cache is not None:
+            kline_cache.close()
 
         # Summary
         console.print()
@@ -4,6 +4,7 @@ from datetime import datetime
 from enum import Enum as PyEnum
 import uuid
 
+import numpy as np
 from sqlalchemy import (
     Column,
     String,
@@ -16,7 +17,10 @@ from sqlalchemy import (
     JSON,
     Boolean,
     Index,
+    LargeBinary,
+    TypeDecorator,
     UniqueConstraint,
+    func,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -24,6 +28,32 @@ from sqlalchemy.orm import relationship
 Base = declarative_base()
 
 
+class Float32Vector(TypeDecorator):
+    """Embedding vector stored as raw float32 bytes (BYTEA on PostgreSQL).
+
+    Accepts a NumPy array or any float sequence on write and returns a
+    list of floats on read.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return np.asarray(value, dtype=np.float32).tobytes()
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return np.frombuffer(value, dtype=np.float32).tolist()
+
+    def compare_values(self, x, y):
+        if x is None or y is None:
+            return x is y
+        return np.array_equal(x, y)
+
+
 class AnomalyTypeEnum(PyEnum):
     """Types of market anomalies."""
 
@@ -48,7 +78,13 @@ class Price(Base):
     bid = Column(Float)
     ask = Column(Float)
     source = Column(String(20))  # coinbase, binance
-    created_at = Column(DateTime, default=datetime.utcnow)
+    # Server default lets bulk inserts omit the column entirely; stamped in
+    # UTC like the ORM default, whatever the session TimeZone
+    created_at = Column(
+        DateTime,
+        default=datetime.utcnow,
+        server_default=func.timezone("UTC", func.now()),
+    )
 
     __table_args__ = (
         UniqueConstraint("symbol", "timestamp", name="uq_symbol_timestamp"),
@@ -116,7 +152,7 @@ class NewsArticle(Base):
 
     # Clustering info
     cluster_id = Column(Integer)  # -1 for unclustered
-    embedding = Column(JSON)  # Store as JSON array for similarity searches
+    embedding = Column(Float32Vector)  # Raw float32 bytes for similarity searches
 
     # Relationship
     anomaly = relationship("Anomaly", back_populates="news_articles")
@@ -69,11 +69,13 @@ class MarketAnomalyPipeline:
             self.crypto_client: CryptoClient = CoinbaseClient(
                 api_key=settings.data_ingestion.coinbase_api_key,
                 api_secret=settings.data_ingestion.coinbase_api_secret,
+                price_cache_ttl=settings.data_ingestion.price_cache_ttl_seconds,
             )
         else:
             self.crypto_client = BinanceClient(
                 api_key=settings.data_ingestion.binance_api_key,
                 api_secret=settings.data_ingestion.binance_api_secret,
+                price_cache_ttl=settings.data_ingestion.price_cache_ttl_seconds,
             )
 
         # Initialize Phase 1 components
@@ -153,7 +155,7 @@ class MarketAnomalyPipeline:
                 return None, stats
 
             logger.info(
-                f"[{symbol}] Anomaly detected: type={detected_anomaly.anomaly_type.value}, "
+                f"[{symbol}] Anomaly detected: type={detected_anomaly.anomaly_type}, "
                 f"confidence={detected_anomaly.confidence:.2f}, z_score={detected_anomaly.z_score:.2f}"
             )
             stats.anomaly_detected = True
@@ -334,7 +336,7 @@ class MarketAnomalyPipeline:
             Persisted Anomaly (SQLAlchemy ORM)
         """
         # Convert enum
-        anomaly_type_enum = AnomalyTypeEnum[detected.anomaly_type.value.upper()]
+        anomaly_type_enum = AnomalyTypeEnum[detected.anomaly_type.upper()]
 
         # Create ORM model
         anomaly = Anomaly(
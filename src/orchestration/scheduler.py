@@ -14,7 +14,7 @@ from src.orchestration.pipeline import MarketAnomalyPipeline, PipelineStats
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolMetrics:
     """Metrics for a single symbol."""
 
@@ -28,7 +28,7 @@ class SymbolMetrics:
     last_error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SchedulerMetrics:
     """Aggregated metrics for the scheduler."""
 
@@ -69,6 +69,11 @@ class AnomalyDetectionScheduler:
         self.scheduler = AsyncIOScheduler()
         self.metrics = SchedulerMetrics()
 
+        # High-water marks: latest stored price timestamp per symbol, and the
+        # price timestamp each symbol was last run against by detection
+        self._last_price_at: dict[str, datetime] = {}
+        self._last_detected_at: dict[str, datetime | None] = {}
+
         # Initialize symbol metrics
         for symbol in self.symbols:
             self.metrics.symbol_stats[symbol] = SymbolMetrics()
@@ -135,16 +140,13 @@ class AnomalyDetectionScheduler:
                 # Fetch current prices for all symbols
                 prices = await self.pipeline.crypto_client.get_prices(self.symbols)
 
-                # Store each price
-                for price_data in prices:
-                    try:
-                        await self.pipeline.crypto_client.store_price(price_data, session)
-                    except Exception as e:
-                        logger.warning(
-                            f"Failed to store price for {price_data.symbol}: {e}"
-                        )
+                # Store all prices in one statement; committed on leaving the context
+                await self.pipeline.crypto_client.store_prices_bulk(prices, session)
+
+            for price_data in prices:
+                self._last_price_at[price_data.symbol] = price_data.timestamp
 
-                logger.debug(f"Stored {len(prices)} price records")
+            logger.debug(f"Stored {len(prices)} price records")
 
         except Exception as e:
             logger.error(f"Price storage cycle failed: {e}", exc_info=True)
@@ -153,25 +155,46 @@ class AnomalyDetectionScheduler:
         """Run detection cycle for all symbols sequentially.
 
         Processes each symbol one at a time, tracking success/failure metrics.
+        Symbols with no new stored price since their last detection run are
+        skipped; symbols never seen by the price storage cycle always run.
         """
+        symbols = [
+            symbol
+            for symbol in self.symbols
+            if symbol not in self._last_price_at
+            or self._last_price_at[symbol] != self._last_detected_at.get(symbol)
+        ]
+        if not symbols:
+            # Still a completed cycle, so the scheduler does not look stalled
+            self.metrics.last_run_time = datetime.utcnow()
+            logger.info("Skipping detection cycle: no new prices since last run")
+            return
+
         cycle_start = datetime.utcnow()
-        logger.info(f"Starting detection cycle for {len(self.symbols)} symbols")
+        logger.info(
+            f"Starting detection cycle for {len(symbols)} symbols "
+            f"({len(self.symbols) - len(symbols)} unchanged, skipped)"
+        )
 
         success_count = 0
         failure_count = 0
         anomaly_count = 0
+        batch: list[PipelineStats] = []
+        # Prices each successful symbol was run against; recorded only once
+        # the cycle commits, so failed or rolled-back symbols are retried
+        detected_at: dict[str, datetime | None] = {}
 
         try:
             with get_db_context() as session:
-                for symbol in self.symbols:
+                for symbol in symbols:
                     try:
                         # Run pipeline for symbol
                         anomaly, stats = await self.pipeline.run_for_symbol(
                             symbol, session
                         )
 
-                        # Update metrics
-                        self._update_metrics(stats)
+                        # Collect stats; metrics are merged once after the loop
+                        batch.append(stats)
 
                         # Log result
                         self._log_result(symbol, anomaly, stats)
@@ -179,23 +202,28 @@ class AnomalyDetectionScheduler:
                         # Update counters
                         if stats.success:
                             success_count += 1
+                            detected_at[symbol] = self._last_price_at.get(symbol)
                             if stats.anomaly_detected:
                                 anomaly_count += 1
                         else:
                             failure_count += 1
 
                     except Exception as e:
-                        logger.error(
-                            f"Pipeline failed for {symbol}: {e}", exc_info=True
-                        )
+                        # Traceback only at debug: formatting it for every
+                        # symbol during an error burst costs more than the run
+                        logger.warning("Pipeline failed for %s: %s", symbol, e)
+                        logger.debug("Pipeline traceback for %s", symbol, exc_info=True)
                         self._handle_error(symbol, e)
                         failure_count += 1
 
+            self._last_detected_at.update(detected_at)
+
         except Exception as e:
             logger.error(f"Detection cycle failed: {e}", exc_info=True)
 
         finally:
             # Update cycle metrics
+            self._merge_metrics(batch)
             cycle_end = datetime.utcnow()
             cycle_duration = (cycle_end - cycle_start).total_seconds()
 
@@ -203,14 +231,14 @@ class AnomalyDetectionScheduler:
             self.metrics.last_cycle_duration = cycle_duration
 
             logger.info(
-                f"Cycle complete: {success_count}/{len(self.symbols)} successful, "
+                f"Cycle complete: {success_count}/{len(symbols)} successful, "
                 f"{anomaly_count} anomalies detected, duration={cycle_duration:.1f}s"
             )
 
             # Alert if high failure rate
-            if failure_count > len(self.symbols) * 0.5:
+            if failure_count > len(symbols) * 0.5:
                 logger.critical(
-                    f"High failure rate in cycle: {failure_count}/{len(self.symbols)} failed"
+                    f"High failure rate in cycle: {failure_count}/{len(symbols)} failed"
                 )
 
     def _update_metrics(self, stats: PipelineStats) -> None:
@@ -219,39 +247,55 @@ class AnomalyDetectionScheduler:
         Args:
             stats: Pipeline execution statistics
         """
-        # Update overall metrics
-        self.metrics.total_runs += 1
-        if stats.success:
-            self.metrics.successful_runs += 1
-        else:
-            self.metrics.failed_runs += 1
+        self._merge_metrics([stats])
 
-        if stats.anomaly_detected:
-            self.metrics.anomalies_detected += 1
+    def _merge_metrics(self, batch: list[PipelineStats]) -> None:
+        """Merge a cycle's pipeline stats into the metrics in a single pass.
 
-        if stats.narrative_validated is True:
-            self.metrics.narratives_validated += 1
-        elif stats.narrative_validated is False:
-            self.metrics.narratives_rejected += 1
+        Overall counters are summed locally and written once; each symbol's
+        metrics are touched once per stats entry.
 
-        # Update symbol-specific metrics
-        symbol_metrics = self.metrics.symbol_stats[stats.symbol]
-        symbol_metrics.total_runs += 1
-        symbol_metrics.last_run_time = datetime.utcnow()
-
-        if stats.success:
-            symbol_metrics.successful_runs += 1
-        else:
-            symbol_metrics.failed_runs += 1
-            symbol_metrics.last_error = stats.error_message
-
-        if stats.anomaly_detected:
-            symbol_metrics.anomalies_detected += 1
+        Args:
+            batch: Pipeline execution statistics collected during a cycle
+        """
+        if not batch:
+            return
+
+        now = datetime.utcnow()
+        successful = anomalies = validated = rejected = 0
+        symbol_stats = self.metrics.symbol_stats
+
+        for stats in batch:
+            symbol_metrics = symbol_stats[stats.symbol]
+            symbol_metrics.total_runs += 1
+            symbol_metrics.last_run_time = now
+
+            if stats.success:
+                successful += 1
+                symbol_metrics.successful_runs += 1
+            else:
+                symbol_metrics.failed_runs += 1
+                symbol_metrics.last_error = stats.error_message
+
+            if stats.anomaly_detected:
+                anomalies += 1
+                symbol_metrics.anomalies_detected += 1
+
+            if stats.narrative_validated is True:
+                validated += 1
+                symbol_metrics.narratives_validated += 1
+            elif stats.narrative_validated is False:
+                rejected += 1
+                symbol_metrics.narratives_rejected += 1
 
-        if stats.narrative_validated is True:
-            symbol_metrics.narratives_validated += 1
-        elif stats.narrative_validated is False:
-            symbol_metrics.narratives_rejected += 1
+        # Update overall metrics
+        metrics = self.metrics
+        metrics.total_runs += len(batch)
+        metrics.successful_runs += successful
+        metrics.failed_runs += len(batch) - successful
+        metrics.anomalies_detected += anomalies
+        metrics.narratives_validated += validated
+        metrics.narratives_rejected += rejected
 
     def _log_result(
         self,
@@ -266,19 +310,23 @@ class AnomalyDetectionScheduler:
             anomaly: Detected anomaly (if any)
             stats: Pipeline statistics
         """
+        # Lazy %-style args: nothing is formatted when the level is disabled
         if not stats.success:
             logger.info(
-                f"[{symbol}] Pipeline failed at phase '{stats.phase_reached}': "
-                f"{stats.error_message}"
+                "[%s] Pipeline failed at phase '%s': %s",
+                symbol,
+                stats.phase_reached,
+                stats.error_message,
             )
         elif not stats.anomaly_detected:
-            logger.debug(f"[{symbol}] No anomaly detected")
+            logger.debug("[%s] No anomaly detected", symbol)
         else:
             logger.info(
-                f"[{symbol}] Anomaly processed: "
-                f"narrative_validated={stats.narrative_validated}, "
-                f"news_count={stats.news_count}, "
-                f"clusters={stats.cluster_count}"
+                "[%s] Anomaly processed: narrative_validated=%s, news_count=%s, clusters=%s",
+                symbol,
+                stats.narrative_validated,
+                stats.news_count,
+                stats.cluster_count,
             )
 
     def _handle_error(self, symbol: str, error: Exception) -> None:
@@ -1,12 +1,18 @@
 """Asset profile manager for volatility-aware threshold lookup."""
 
+import functools
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
 import yaml
 
 from config.settings import settings
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 
 @dataclass
 class AssetThresholds:
@@ -30,27 +36,46 @@ class AssetProfileManager:
     3. Global defaults (settings.py fallback)
     """
 
-    def __init__(self, config_path: Optional[str] = None):
+    def __init__(self, config_path: str | None = None):
         """Initialize profile manager.
 
         Args:
             config_path: Path to thresholds.yaml (default: config/thresholds.yaml)
         """
         self.config_path = config_path or "config/thresholds.yaml"
+
+        # Global fallbacks from settings, read once instead of per lookup
+        self._global_z = settings.detection.z_score_threshold
+        self._global_vol = settings.detection.volume_z_threshold
+        self._global_bb = settings.detection.bollinger_std_multiplier
+        self._global_min_return = settings.detection.min_absolute_return_threshold
+
         self._cache: dict[str, AssetThresholds] = {}
-        self._config: Optional[dict] = None
+        self._config: dict | None = None
+        self._config_stamp: tuple[int, int] | None = None
         self._load_config()
 
     def _load_config(self) -> None:
-        """Load YAML configuration file."""
+        """Load YAML configuration file.
+
+        The parse is skipped when the file's mtime and size are unchanged
+        since the last load, so repeated reloads of an untouched file are free.
+        """
         config_file = Path(self.config_path)
         if not config_file.exists():
             # Config missing, will use global defaults
             self._config = None
+            self._config_stamp = None
+            return
+
+        stat = config_file.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if stamp == self._config_stamp:
             return
 
         with open(config_file, "r") as f:
-            self._config = yaml.safe_load(f)
+            self._config = yaml.load(f, Loader=_YamlLoader)
+        self._config_stamp = stamp
 
     def get_thresholds(self, symbol: str) -> AssetThresholds:
         """Get thresholds for a symbol with 3-tier lookup.
@@ -61,14 +86,13 @@ class AssetProfileManager:
         Returns:
             AssetThresholds with appropriate thresholds
         """
-        # Check cache
-        if symbol in self._cache:
-            return self._cache[symbol]
+        # Check cache (dict.get is atomic, no lock needed on the hit path)
+        thresholds = self._cache.get(symbol)
+        if thresholds is not None:
+            return thresholds
 
-        # Perform lookup
-        thresholds = self._lookup_thresholds(symbol)
-        self._cache[symbol] = thresholds
-        return thresholds
+        # Perform lookup; setdefault keeps the first insert if tasks race
+        return self._cache.setdefault(symbol, self._lookup_thresholds(symbol))
 
     def _lookup_thresholds(self, symbol: str) -> AssetThresholds:
         """Perform 3-tier threshold lookup.
@@ -79,10 +103,10 @@ class AssetProfileManager:
         3. Global defaults
         """
         # Fallback: Global defaults from settings
-        global_z = settings.detection.z_score_threshold
-        global_vol = settings.detection.volume_z_threshold
-        global_bb = settings.detection.bollinger_std_multiplier
-        global_min_return = settings.detection.min_absolute_return_threshold
+        global_z = self._global_z
+        global_vol = self._global_vol
+        global_bb = self._global_bb
+        global_min_return = self._global_min_return
 
         # No config file, use global defaults
         if not self._config:
@@ -146,7 +170,7 @@ class AssetProfileManager:
             source="global",
         )
 
-    def _find_tier(self, symbol: str) -> tuple[str, Optional[dict]]:
+    def _find_tier(self, symbol: str) -> tuple[str, dict | None]:
         """Find volatility tier for a symbol.
 
         Returns:
@@ -220,3 +244,18 @@ class AssetProfileManager:
         """Reload configuration from disk and clear cache."""
         self._load_config()
         self.clear_cache()
+
+
+@functools.lru_cache(maxsize=None)
+def get_profile_manager(config_path: str = "config/thresholds.yaml") -> AssetProfileManager:
+    """Get the process-wide profile manager for a config path.
+
+    Shares one parsed config and threshold cache across all callers.
+
+    Args:
+        config_path: Path to thresholds.yaml
+
+    Returns:
+        Shared AssetProfileManager instance
+    """
+    return AssetProfileManager(config_path)
@@ -1,17 +1,29 @@
 """Pydantic models for anomaly detection."""
 
 from datetime import datetime
+from typing import Literal
 from pydantic import BaseModel, Field
-from enum import Enum
 
 
-class AnomalyType(str, Enum):
-    """Types of anomalies."""
+AnomalyTypeT = Literal["price_spike", "price_drop", "volume_spike", "combined"]
 
-    PRICE_SPIKE = "price_spike"
-    PRICE_DROP = "price_drop"
-    VOLUME_SPIKE = "volume_spike"
-    COMBINED = "combined"
+PRICE_SPIKE: AnomalyTypeT = "price_spike"
+PRICE_DROP: AnomalyTypeT = "price_drop"
+VOLUME_SPIKE: AnomalyTypeT = "volume_spike"
+COMBINED: AnomalyTypeT = "combined"
+
+
+class AnomalyType:
+    """Types of anomalies.
+
+    Plain string constants (not an Enum) so Pydantic validates
+    ``anomaly_type`` with a single ``Literal`` lookup.
+    """
+
+    PRICE_SPIKE = PRICE_SPIKE
+    PRICE_DROP = PRICE_DROP
+    VOLUME_SPIKE = VOLUME_SPIKE
+    COMBINED = COMBINED
 
 
 class DetectedAnomaly(BaseModel):
@@ -19,7 +31,7 @@ class DetectedAnomaly(BaseModel):
 
     symbol: str
     detected_at: datetime
-    anomaly_type: AnomalyType
+    anomaly_type: AnomalyTypeT
 
     # Statistical metrics
     z_score: float
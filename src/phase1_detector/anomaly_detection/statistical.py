@@ -1,16 +1,87 @@
 """Statistical anomaly detection algorithms."""
 
+import math
 from datetime import datetime, timedelta
-from typing import List, Optional
 import numpy as np
-from scipy import stats
 import pandas as pd
 
 from .models import DetectedAnomaly, AnomalyType
-from .asset_profiles import AssetProfileManager
+from .asset_profiles import get_profile_manager
 from config.settings import settings
 
 
+def _sort_by_timestamp(prices: pd.DataFrame) -> pd.DataFrame:
+    """Return prices ordered by timestamp, skipping the sort if already ordered.
+
+    Detectors never modify the returned frame, so an already-sorted input
+    (e.g. from AnomalyDetector.detect_all or the database query) is shared
+    without a copy.
+    """
+    if prices["timestamp"].is_monotonic_increasing:
+        return prices
+    return prices.sort_values("timestamp", kind="mergesort")
+
+
+def _window_bounds(timestamps: pd.Series, start: datetime, end: datetime) -> tuple[int, int]:
+    """Get positional bounds of rows with start <= timestamp <= end.
+
+    Args:
+        timestamps: Timestamp column, sorted ascending
+        start: Window start (inclusive)
+        end: Window end (inclusive)
+
+    Returns:
+        Tuple (lo, hi) so that ``frame.iloc[lo:hi]`` is the window
+    """
+    lo = int(timestamps.searchsorted(start, side="left"))
+    hi = int(timestamps.searchsorted(end, side="right"))
+    return lo, hi
+
+
+def _mean_std(values: np.ndarray) -> tuple[float, float]:
+    """Get mean and sample std (ddof=1) from running sums.
+
+    Uses the sum / sum-of-squares identity instead of separate mean and
+    deviation passes. When the identity loses precision (spread tiny next
+    to magnitude, e.g. near-constant 24h volumes) it falls back to the
+    two-pass formula, which also keeps a constant series at exactly 0.
+
+    Args:
+        values: 1-D float array with at least two non-NaN values
+
+    Returns:
+        Tuple of (mean, std)
+    """
+    n = len(values)
+    s1 = values.sum()
+    s2 = np.dot(values, values)
+    mean = s1 / n
+    m2 = s2 - s1 * mean  # Sum of squared deviations
+    if m2 <= 1e-8 * s2:
+        return mean, values.std(ddof=1)
+    return mean, math.sqrt(m2 / (n - 1))
+
+
+def _rolling_window_returns(price_arr: np.ndarray, window: int) -> np.ndarray:
+    """Get percentage return of every rolling window of ``window`` rows.
+
+    Vectorized equivalent of slicing each window and comparing its first
+    and last price, without a Python-level loop.
+
+    Args:
+        price_arr: Consecutive prices
+        window: Rows per window
+
+    Returns:
+        Array of len(price_arr) - window + 1 returns (empty if window < 2)
+    """
+    if window < 2 or len(price_arr) < window:
+        return np.empty(0)
+    start_prices = price_arr[: len(price_arr) - window + 1]
+    end_prices = price_arr[window - 1 :]
+    return (end_prices - start_prices) / start_prices * 100
+
+
 class ZScoreDetector:
     """Detect anomalies using Z-score on price returns."""
 
@@ -35,8 +106,8 @@ class ZScoreDetector:
         self.min_absolute_return = min_absolute_return
 
     def detect(
-        self, prices: pd.DataFrame, current_time: Optional[datetime] = None
-    ) -> List[DetectedAnomaly]:
+        self, prices: pd.DataFrame, current_time: datetime | None = None
+    ) -> list[DetectedAnomaly]:
         """Detect price anomalies using Z-score.
 
         Args:
@@ -49,72 +120,92 @@ class ZScoreDetector:
         if len(prices) < 2:
             return []
 
-        # Calculate returns
-        prices = prices.sort_values("timestamp")
-        prices["returns"] = prices["price"].pct_change() * 100  # Percentage returns
+        prices = _sort_by_timestamp(prices)
 
         # Get window for baseline
         if current_time is None:
             current_time = prices["timestamp"].iloc[-1]
 
         window_start = current_time - timedelta(minutes=self.window_minutes)
-        window_data = prices[
-            (prices["timestamp"] >= window_start) & (prices["timestamp"] <= current_time)
+        lo, hi = _window_bounds(prices["timestamp"], window_start, current_time)
+
+        price_arr = prices["price"].to_numpy(dtype=float)
+        scored = self._score_window(price_arr, lo, hi)
+        if scored is None:
+            return []
+
+        z_score, latest_return = scored
+        latest_pos = hi - 1
+        prev_pos = hi - 2
+        volumes = prices["volume"]
+
+        anomaly_type = AnomalyType.PRICE_SPIKE if z_score > 0 else AnomalyType.PRICE_DROP
+
+        return [
+            DetectedAnomaly(
+                symbol=prices.iloc[0].get("symbol", "UNKNOWN"),
+                detected_at=prices["timestamp"].iat[latest_pos],
+                anomaly_type=anomaly_type,
+                z_score=z_score,
+                price_change_pct=latest_return,
+                confidence=min(abs(z_score) / 5.0, 1.0),  # Cap at 1.0
+                baseline_window_minutes=self.window_minutes,
+                price_before=price_arr[prev_pos],
+                price_at_detection=price_arr[latest_pos],
+                volume_before=volumes.iat[prev_pos],
+                volume_at_detection=volumes.iat[latest_pos],
+            )
         ]
 
+    def _score_window(
+        self, price_arr: np.ndarray, lo: int, hi: int
+    ) -> tuple[float, float] | None:
+        """Score the latest return of the window rows [lo, hi).
+
+        Args:
+            price_arr: Prices of the timestamp-sorted frame
+            lo: First window row
+            hi: One past the last window row
+
+        Returns:
+            Tuple of (z_score, latest_return) if the latest return is anomalous, None otherwise
+        """
         # Require minimum 60 data points for stable statistics (approx 1 hour of minute data)
         # This prevents false positives when system first starts up
-        if len(window_data) < 60:
-            return []
+        if hi - lo < 60:
+            return None
 
-        # Calculate Z-score for latest return
-        returns = window_data["returns"].dropna()
+        # Percentage returns for the window rows only; the first one is taken
+        # against the row just before the window, as a full pct_change would
+        window_prices = price_arr[max(lo - 1, 0) : hi]
+        returns = np.diff(window_prices) / window_prices[:-1] * 100
+        returns = returns[~np.isnan(returns)]
         if len(returns) < 60:
-            return []
+            return None
+
+        # Check minimum absolute return threshold (prevents flagging tiny moves).
+        # Done before the baseline statistics since most ticks stop here.
+        latest_return = float(returns[-1])
+        if math.fabs(latest_return) < self.min_absolute_return:
+            return None
 
-        latest_return = returns.iloc[-1]
-        mean_return = returns.iloc[:-1].mean()
-        std_return = returns.iloc[:-1].std()
+        # Calculate Z-score for latest return
+        mean_return, std_return = _mean_std(returns[:-1])
 
         # Apply minimum std threshold to prevent inflation during quiet periods
         # If actual std < min_std, use min_std (prevents tiny moves from getting huge Z-scores)
-        std_return = max(std_return, self.min_std)
+        std_return = max(float(std_return), self.min_std)
 
         if std_return == 0:
-            return []
-
-        z_score = (latest_return - mean_return) / std_return
+            return None
 
-        # Check minimum absolute return threshold (prevents flagging tiny moves)
-        if abs(latest_return) < self.min_absolute_return:
-            return []
+        z_score = (latest_return - float(mean_return)) / std_return
 
         # Check if anomaly
-        if abs(z_score) > self.threshold:
-            latest_idx = window_data.index[-1]
-            prev_idx = window_data.index[-2]
-
-            anomaly_type = (
-                AnomalyType.PRICE_SPIKE if z_score > 0 else AnomalyType.PRICE_DROP
-            )
-
-            return [
-                DetectedAnomaly(
-                    symbol=prices.iloc[0].get("symbol", "UNKNOWN"),
-                    detected_at=window_data.loc[latest_idx, "timestamp"],
-                    anomaly_type=anomaly_type,
-                    z_score=z_score,
-                    price_change_pct=latest_return,
-                    confidence=min(abs(z_score) / 5.0, 1.0),  # Cap at 1.0
-                    baseline_window_minutes=self.window_minutes,
-                    price_before=prices.loc[prev_idx, "price"],
-                    price_at_detection=prices.loc[latest_idx, "price"],
-                    volume_before=prices.loc[prev_idx, "volume"],
-                    volume_at_detection=prices.loc[latest_idx, "volume"],
-                )
-            ]
+        if math.fabs(z_score) > self.threshold:
+            return z_score, latest_return
 
-        return []
+        return None
 
 
 class BollingerBandDetector:
@@ -131,8 +222,8 @@ class BollingerBandDetector:
         self.std_multiplier = std_multiplier
 
     def detect(
-        self, prices: pd.DataFrame, current_time: Optional[datetime] = None
-    ) -> List[DetectedAnomaly]:
+        self, prices: pd.DataFrame, current_time: datetime | None = None
+    ) -> list[DetectedAnomaly]:
         """Detect price anomalies using Bollinger Bands.
 
         Args:
@@ -145,29 +236,34 @@ class BollingerBandDetector:
         if len(prices) < self.window:
             return []
 
-        prices = prices.sort_values("timestamp")
+        prices = _sort_by_timestamp(prices)
 
-        # Calculate Bollinger Bands
-        prices["sma"] = prices["price"].rolling(window=self.window).mean()
-        prices["std"] = prices["price"].rolling(window=self.window).std()
-        prices["upper_band"] = prices["sma"] + (self.std_multiplier * prices["std"])
-        prices["lower_band"] = prices["sma"] - (self.std_multiplier * prices["std"])
-
-        # Get current price
+        # Locate the current row; only the trailing window ending there is used
         if current_time:
-            current_data = prices[prices["timestamp"] <= current_time].iloc[-1]
+            current_idx = int(prices["timestamp"].searchsorted(current_time, side="right")) - 1
         else:
-            current_data = prices.iloc[-1]
+            current_idx = len(prices) - 1
+
+        if current_idx < self.window - 1:
+            return []
+
+        window_slice = slice(current_idx - self.window + 1, current_idx + 1)
+        price_arr = prices["price"].to_numpy(dtype=float)
+        volume_arr = prices["volume"].to_numpy(dtype=float)
 
-        current_price = current_data["price"]
-        upper_band = current_data["upper_band"]
-        lower_band = current_data["lower_band"]
-        sma = current_data["sma"]
+        # Calculate Bollinger Bands for the current row only
+        tail = price_arr[window_slice]
+        sma = tail.mean()
+        std = tail.std(ddof=1)  # Sample std, same as pandas rolling().std()
 
-        # Check for breakout
-        if pd.isna(upper_band) or pd.isna(lower_band):
+        # Check for breakout (NaN in the window leaves the bands undefined)
+        if np.isnan(sma) or np.isnan(std) or std == 0:
             return []
 
+        upper_band = sma + (self.std_multiplier * std)
+        lower_band = sma - (self.std_multiplier * std)
+        current_price = price_arr[current_idx]
+
         anomalies = []
 
         if current_price > upper_band:
@@ -176,16 +272,16 @@ class BollingerBandDetector:
             anomalies.append(
                 DetectedAnomaly(
                     symbol=prices.iloc[0].get("symbol", "UNKNOWN"),
-                    detected_at=current_data["timestamp"],
+                    detected_at=prices["timestamp"].iloc[current_idx],
                     anomaly_type=AnomalyType.PRICE_SPIKE,
-                    z_score=(current_price - sma) / current_data["std"],
+                    z_score=(current_price - sma) / std,
                     price_change_pct=price_change_pct,
                     confidence=min((current_price - upper_band) / upper_band, 1.0),
                     baseline_window_minutes=self.window,
                     price_before=sma,
                     price_at_detection=current_price,
-                    volume_before=prices["volume"].rolling(self.window).mean().iloc[-1],
-                    volume_at_detection=current_data["volume"],
+                    volume_before=volume_arr[window_slice].mean(),
+                    volume_at_detection=volume_arr[current_idx],
                 )
             )
         elif current_price < lower_band:
@@ -194,16 +290,16 @@ class BollingerBandDetector:
             anomalies.append(
                 DetectedAnomaly(
                     symbol=prices.iloc[0].get("symbol", "UNKNOWN"),
-                    detected_at=current_data["timestamp"],
+                    detected_at=prices["timestamp"].iloc[current_idx],
                     anomaly_type=AnomalyType.PRICE_DROP,
-                    z_score=(current_price - sma) / current_data["std"],
+                    z_score=(current_price - sma) / std,
                     price_change_pct=price_change_pct,
                     confidence=min((lower_band - current_price) / lower_band, 1.0),
                     baseline_window_minutes=self.window,
                     price_before=sma,
                     price_at_detection=current_price,
-                    volume_before=prices["volume"].rolling(self.window).mean().iloc[-1],
-                    volume_at_detection=current_data["volume"],
+                    volume_before=volume_arr[window_slice].mean(),
+                    volume_at_detection=volume_arr[current_idx],
                 )
             )
 
@@ -224,8 +320,8 @@ class VolumeSpikeDetector:
         self.window_minutes = window_minutes
 
     def detect(
-        self, prices: pd.DataFrame, current_time: Optional[datetime] = None
-    ) -> List[DetectedAnomaly]:
+        self, prices: pd.DataFrame, current_time: datetime | None = None
+    ) -> list[DetectedAnomaly]:
         """Detect volume anomalies.
 
         Args:
@@ -238,54 +334,75 @@ class VolumeSpikeDetector:
         if len(prices) < 2:
             return []
 
-        prices = prices.sort_values("timestamp")
+        prices = _sort_by_timestamp(prices)
 
         if current_time is None:
             current_time = prices["timestamp"].iloc[-1]
 
         window_start = current_time - timedelta(minutes=self.window_minutes)
-        window_data = prices[
-            (prices["timestamp"] >= window_start) & (prices["timestamp"] <= current_time)
+        lo, hi = _window_bounds(prices["timestamp"], window_start, current_time)
+
+        scored = self._score_window(prices["volume"].to_numpy(dtype=float), lo, hi)
+        if scored is None:
+            return []
+
+        volume_z_score, current_volume, mean_volume = scored
+        # Positional: after sorting, the index labels need not be contiguous
+        latest_pos = hi - 1
+        price_arr = prices["price"].to_numpy(dtype=float)
+
+        return [
+            DetectedAnomaly(
+                symbol=prices.iloc[0].get("symbol", "UNKNOWN"),
+                detected_at=prices["timestamp"].iat[latest_pos],
+                anomaly_type=AnomalyType.VOLUME_SPIKE,
+                z_score=volume_z_score,
+                price_change_pct=0.0,
+                volume_change_pct=((current_volume - mean_volume) / mean_volume) * 100,
+                confidence=min(volume_z_score / 5.0, 1.0),
+                baseline_window_minutes=self.window_minutes,
+                price_before=float(price_arr[latest_pos - 1]) if latest_pos > 0 else 0.0,
+                price_at_detection=float(price_arr[latest_pos]),
+                volume_before=mean_volume,
+                volume_at_detection=current_volume,
+            )
         ]
 
+    def _score_window(
+        self, volume_arr: np.ndarray, lo: int, hi: int
+    ) -> tuple[float, float, float] | None:
+        """Score the latest volume of the window rows [lo, hi).
+
+        Args:
+            volume_arr: Volumes of the timestamp-sorted frame
+            lo: First window row
+            hi: One past the last window row
+
+        Returns:
+            Tuple of (volume_z_score, current_volume, mean_volume) if the latest
+            volume is a spike, None otherwise
+        """
         # Require minimum 60 data points for stable statistics
-        if len(window_data) < 60:
-            return []
+        if hi - lo < 60:
+            return None
 
-        volumes = window_data["volume"].dropna()
+        volumes = volume_arr[lo:hi]
+        volumes = volumes[~np.isnan(volumes)]
         if len(volumes) < 60:
-            return []
+            return None
 
-        current_volume = volumes.iloc[-1]
-        mean_volume = volumes.iloc[:-1].mean()
-        std_volume = volumes.iloc[:-1].std()
+        current_volume = volumes[-1]
+        mean_volume, std_volume = _mean_std(volumes[:-1])
 
         if std_volume == 0:
-            return []
+            return None
 
         volume_z_score = (current_volume - mean_volume) / std_volume
 
         if volume_z_score > self.threshold:
-            latest_idx = window_data.index[-1]
-
-            return [
-                DetectedAnomaly(
-                    symbol=prices.iloc[0].get("symbol", "UNKNOWN"),
-                    detected_at=window_data.loc[latest_idx, "timestamp"],
-                    anomaly_type=AnomalyType.VOLUME_SPIKE,
-                    z_score=volume_z_score,
-                    price_change_pct=0.0,
-                    volume_change_pct=((current_volume - mean_volume) / mean_volume) * 100,
-                    confidence=min(volume_z_score / 5.0, 1.0),
-                    baseline_window_minutes=self.window_minutes,
-                    price_before=prices.loc[latest_idx - 1, "price"] if latest_idx > 0 else 0.0,
-                    price_at_detection=prices.loc[latest_idx, "price"],
-                    volume_before=mean_volume,
-                    volume_at_detection=current_volume,
-                )
-            ]
+            return volume_z_score, current_volume, mean_volume
 
-        return []
+        return None
 
 
 class CombinedDetector:
@@ -312,10 +429,13 @@ class CombinedDetector:
         self.volume_detector = VolumeSpikeDetector(volume_threshold, window_minutes)
 
     def detect(
-        self, prices: pd.DataFrame, current_time: Optional[datetime] = None
-    ) -> List[DetectedAnomaly]:
+        self, prices: pd.DataFrame, current_time: datetime | None = None
+    ) -> list[DetectedAnomaly]:
         """Detect combined price + volume anomalies.
 
+        Sorts and slices the window once and scores price and volume on it;
+        volume is only scored when the price move qualifies.
+
         Args:
             prices: DataFrame with columns [timestamp, price, volume]
             current_time: Time to check for anomaly (default: latest)
@@ -323,33 +443,61 @@ class CombinedDetector:
         Returns:
             List of detected anomalies
         """
-        price_anomalies = self.price_detector.detect(prices, current_time)
-        volume_anomalies = self.volume_detector.detect(prices, current_time)
+        if len(prices) < 2:
+            return []
 
-        # If both price and volume anomalies detected, merge them
-        if price_anomalies and volume_anomalies:
-            price_anom = price_anomalies[0]
-            volume_anom = volume_anomalies[0]
+        prices = _sort_by_timestamp(prices)
+        timestamps = prices["timestamp"]
 
-            # Create combined anomaly with higher confidence
-            return [
-                DetectedAnomaly(
-                    symbol=price_anom.symbol,
-                    detected_at=price_anom.detected_at,
-                    anomaly_type=AnomalyType.COMBINED,
-                    z_score=price_anom.z_score,
-                    price_change_pct=price_anom.price_change_pct,
-                    volume_change_pct=volume_anom.volume_change_pct,
-                    confidence=min((price_anom.confidence + volume_anom.confidence) / 2 * 1.5, 1.0),
-                    baseline_window_minutes=price_anom.baseline_window_minutes,
-                    price_before=price_anom.price_before,
-                    price_at_detection=price_anom.price_at_detection,
-                    volume_before=volume_anom.volume_before,
-                    volume_at_detection=volume_anom.volume_at_detection,
-                )
-            ]
+        if current_time is None:
+            current_time = timestamps.iloc[-1]
 
-        return []
+        price_window = self.price_detector.window_minutes
+        lo, hi = _window_bounds(
+            timestamps, current_time - timedelta(minutes=price_window), current_time
+        )
+
+        price_arr = prices["price"].to_numpy(dtype=float)
+        price_scored = self.price_detector._score_window(price_arr, lo, hi)
+        if price_scored is None:
+            return []
+
+        volume_window = self.volume_detector.window_minutes
+        if volume_window == price_window:
+            volume_lo, volume_hi = lo, hi
+        else:
+            volume_lo, volume_hi = _window_bounds(
+                timestamps, current_time - timedelta(minutes=volume_window), current_time
+            )
+
+        volume_scored = self.volume_detector._score_window(
+            prices["volume"].to_numpy(dtype=float), volume_lo, volume_hi
+        )
+        if volume_scored is None:
+            return []
+
+        # Both price and volume anomalous: create combined anomaly with higher confidence
+        z_score, latest_return = price_scored
+        volume_z_score, current_volume, mean_volume = volume_scored
+        price_confidence = min(abs(z_score) / 5.0, 1.0)
+        volume_confidence = min(volume_z_score / 5.0, 1.0)
+
+        return [
+            DetectedAnomaly(
+                symbol=prices.iloc[0].get("symbol", "UNKNOWN"),
+                detected_at=timestamps.iat[hi - 1],
+                anomaly_type=AnomalyType.COMBINED,
+                z_score=z_score,
+                price_change_pct=latest_return,
+                volume_change_pct=((current_volume - mean_volume) / mean_volume) * 100,
+                confidence=min((price_confidence + volume_confidence) / 2 * 1.5, 1.0),
+                baseline_window_minutes=price_window,
+                price_before=price_arr[hi - 2],
+                price_at_detection=price_arr[hi - 1],
+                volume_before=mean_volume,
+                volume_at_detection=current_volume,
+            )
+        ]
 
 
 class MultiTimeframeDetector:
@@ -364,7 +512,7 @@ class MultiTimeframeDetector:
     def __init__(
         self,
         threshold: float = 3.0,
-        timeframe_windows: Optional[List[int]] = None,
+        timeframe_windows: list[int] | None = None,
         baseline_multiplier: int = 3,
         min_absolute_return: float = 1.0,
     ):
@@ -382,8 +530,8 @@ class MultiTimeframeDetector:
         self.min_absolute_return = min_absolute_return
 
     def detect(
-        self, prices: pd.DataFrame, current_time: Optional[datetime] = None
-    ) -> List[DetectedAnomaly]:
+        self, prices: pd.DataFrame, current_time: datetime | None = None
+    ) -> list[DetectedAnomaly]:
         """Detect cumulative anomalies across multiple timeframes.
 
         Algorithm (per timeframe):
@@ -402,7 +550,7 @@ class MultiTimeframeDetector:
         if len(prices) < 5:
             return []
 
-        prices = prices.sort_values("timestamp")
+        prices = _sort_by_timestamp(prices)
 
         if current_time is None:
             current_time = prices["timestamp"].iloc[-1]
@@ -422,7 +570,7 @@ class MultiTimeframeDetector:
 
     def _detect_for_timeframe(
         self, prices: pd.DataFrame, current_time: datetime, window_minutes: int
-    ) -> Optional[DetectedAnomaly]:
+    ) -> DetectedAnomaly | None:
         """Detect anomaly for a specific timeframe window.
 
         Args:
@@ -439,32 +587,32 @@ class MultiTimeframeDetector:
         baseline_start = current_time - timedelta(minutes=baseline_window)
         baseline_end = window_start  # Exclude current move from baseline
 
-        # Get data for current window and baseline
-        current_window_data = prices[
-            (prices["timestamp"] >= window_start) & (prices["timestamp"] <= current_time)
-        ]
-        baseline_data = prices[
-            (prices["timestamp"] >= baseline_start) & (prices["timestamp"] < baseline_end)
-        ]
+        # Get positional bounds for current window and baseline
+        timestamps = prices["timestamp"]
+        window_lo, window_hi = _window_bounds(timestamps, window_start, current_time)
+        baseline_lo = int(timestamps.searchsorted(baseline_start, side="left"))
+        baseline_hi = int(timestamps.searchsorted(baseline_end, side="left"))
+        baseline_len = max(baseline_hi - baseline_lo, 0)
 
         # Need at least 3 periods in current window and sufficient baseline data
-        if len(current_window_data) < 3 or len(baseline_data) < window_minutes:
+        if window_hi - window_lo < 3 or baseline_len < window_minutes:
             return None
 
         # Calculate cumulative return for current window
-        price_at_start = current_window_data["price"].iloc[0]
-        price_at_end = current_window_data["price"].iloc[-1]
+        price_arr = prices["price"].to_numpy(dtype=float)
+        price_at_start = price_arr[window_lo]
+        price_at_end = price_arr[window_hi - 1]
         cumulative_return = ((price_at_end - price_at_start) / price_at_start) * 100
 
+        # Check minimum absolute return threshold (prevents flagging tiny moves)
+        # before paying for the baseline statistics
+        if abs(cumulative_return) < self.min_absolute_return:
+            return None
+
         # Calculate baseline cumulative returns (rolling windows)
-        baseline_returns = []
-        for i in range(len(baseline_data) - window_minutes + 1):
-            window_slice = baseline_data.iloc[i : i + window_minutes]
-            if len(window_slice) >= 2:
-                start_price = window_slice["price"].iloc[0]
-                end_price = window_slice["price"].iloc[-1]
-                ret = ((end_price - start_price) / start_price) * 100
-                baseline_returns.append(ret)
+        baseline_returns = _rolling_window_returns(
+            price_arr[baseline_lo:baseline_hi], window_minutes
+        )
 
         if len(baseline_returns) < 2:
             return None
@@ -478,18 +626,15 @@ class MultiTimeframeDetector:
 
         z_score = (cumulative_return - baseline_mean) / baseline_std
 
-        # Check minimum absolute return threshold (prevents flagging tiny moves)
-        if abs(cumulative_return) < self.min_absolute_return:
-            return None
-
         # Check if anomaly
         if abs(z_score) > self.threshold:
             symbol = prices.iloc[0].get("symbol", "UNKNOWN")
             anomaly_type = AnomalyType.PRICE_SPIKE if z_score > 0 else AnomalyType.PRICE_DROP
 
             # Calculate average volume change over window
-            baseline_avg_volume = baseline_data["volume"].mean()
-            current_avg_volume = current_window_data["volume"].mean()
+            volumes = prices["volume"]
+            baseline_avg_volume = volumes.iloc[baseline_lo:baseline_hi].mean()
+            current_avg_volume = volumes.iloc[window_lo:window_hi].mean()
             volume_change_pct = (
                 ((current_avg_volume - baseline_avg_volume) / baseline_avg_volume) * 100
                 if baseline_avg_volume > 0
@@ -536,7 +681,7 @@ class AnomalyDetector:
         self.profile_manager = None
         if settings.detection.use_asset_specific_thresholds:
             try:
-                self.profile_manager = AssetProfileManager(
+                self.profile_manager = get_profile_manager(
                     settings.detection.thresholds_config_path
                 )
             except Exception as e:
@@ -578,8 +723,8 @@ class AnomalyDetector:
         )
 
     def detect_all(
-        self, prices: pd.DataFrame, current_time: Optional[datetime] = None
-    ) -> List[DetectedAnomaly]:
+        self, prices: pd.DataFrame, current_time: datetime | None = None
+    ) -> list[DetectedAnomaly]:
         """Run all detectors and return unique anomalies.
 
         Priority detection order:
@@ -599,6 +744,10 @@ class AnomalyDetector:
         # Extract symbol from DataFrame
         symbol = prices.iloc[0].get("symbol", "UNKNOWN") if len(prices) > 0 else "UNKNOWN"
 
+        # Sort once; child detectors see an ordered frame and skip their own sort
+        if len(prices) > 0:
+            prices = _sort_by_timestamp(prices)
+
         # Get asset-specific thresholds
         asset_thresholds = None
         if self.profile_manager:
@@ -623,6 +772,11 @@ class AnomalyDetector:
                 )
                 return [anomaly]
 
+        # Optional prefilter (off by default): skip the remaining detectors on
+        # quiet ticks, accepting missed Bollinger/volume signals
+        if self._is_quiet_tick(prices, current_time):
+            return []
+
         # Priority 2: Combined detector (price + volume)
         if asset_thresholds:
             # Update thresholds dynamically
@@ -673,8 +827,45 @@ class AnomalyDetector:
                     "volatility_tier": asset_thresholds.volatility_tier,
                     "asset_threshold": asset_thresholds.z_score_threshold,
                     "threshold_source": asset_thresholds.source,
-                    "detector": anomaly.anomaly_type.value,
+                    "detector": anomaly.anomaly_type,
                 }
             return [anomaly]
 
         return []
+
+    def _is_quiet_tick(self, prices: pd.DataFrame, current_time: datetime | None) -> bool:
+        """Check the quiet-tick prefilter for the combined and single-tick detectors.
+
+        A tick is quiet when its return is below min_return_prefilter and its
+        volume is below min_volume_prefilter times the lookback mean volume.
+        Disabled unless both settings are positive.
+
+        Args:
+            prices: Timestamp-sorted price data
+            current_time: Time to check (default: latest)
+
+        Returns:
+            True if the remaining detectors can be skipped
+        """
+        min_return = settings.detection.min_return_prefilter
+        volume_ratio = settings.detection.min_volume_prefilter
+        if min_return <= 0 or volume_ratio <= 0 or len(prices) < 2:
+            return False
+
+        timestamps = prices["timestamp"]
+        if current_time is None:
+            current_time = timestamps.iloc[-1]
+        window_start = current_time - timedelta(minutes=settings.detection.lookback_window_minutes)
+        lo, hi = _window_bounds(timestamps, window_start, current_time)
+        if hi - lo < 2:
+            return False
+
+        price_arr = prices["price"].to_numpy(dtype=float)
+        latest_return = (price_arr[hi - 1] / price_arr[hi - 2] - 1) * 100
+        volumes = prices["volume"].to_numpy(dtype=float)[lo:hi]
+
+        # NaN comparisons are False, so missing data never counts as quiet
+        return bool(
+            math.fabs(latest_return) < min_return
+            and volumes[-1] < volume_ratio * volumes[:-1].mean()
+        )
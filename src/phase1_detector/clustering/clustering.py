@@ -1,12 +1,17 @@
 """News clustering using sentence-transformers and HDBSCAN."""
 
+import hashlib
 import logging
-from collections import Counter
+import threading
+import uuid
+from collections import OrderedDict
 from typing import Any
 
 import hdbscan
 import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from config.settings import settings
@@ -29,14 +34,50 @@ class NewsClusterer:
         self.session = session
 
         # Load embedding model
-        logger.info(f"Loading embedding model: {self.settings.clustering.embedding_model}")
-        self.embedding_model = SentenceTransformer(
-            self.settings.clustering.embedding_model
-        )
+        self.embedding_model = self._load_embedding_model()
+
+        # LRU cache of embeddings keyed by a hash of the embedded text;
+        # aggregators repeat the same headlines across sources and refreshes
+        self._embedding_cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._embedding_cache_lock = threading.Lock()
 
         # HDBSCAN clusterer (will be fit on data)
         self.clusterer = None
 
+    def _load_embedding_model(self) -> SentenceTransformer:
+        """Load the sentence-transformer for the available hardware.
+
+        GPU runs the PyTorch model in half precision. CPU uses the
+        dynamically quantized INT8 ONNX export only when opted in, falling
+        back to PyTorch FP32 if ONNX Runtime or the export is unavailable.
+
+        Returns:
+            Loaded SentenceTransformer model
+        """
+        model_name = self.settings.clustering.embedding_model
+
+        if (
+            self.settings.clustering.embedding_cpu_backend == "onnx_int8"
+            and not torch.cuda.is_available()
+        ):
+            onnx_file = self.settings.clustering.embedding_onnx_file
+            logger.info(f"Loading embedding model: {model_name} (ONNX INT8, {onnx_file})")
+            try:
+                return SentenceTransformer(
+                    model_name, backend="onnx", model_kwargs={"file_name": onnx_file}
+                )
+            except Exception as e:
+                logger.warning(f"ONNX INT8 embedding model unavailable, using PyTorch: {e}")
+
+        logger.info(f"Loading embedding model: {model_name}")
+        model = SentenceTransformer(model_name)
+
+        # Half precision on GPU halves memory traffic; CPU stays float32
+        if model.device.type == "cuda":
+            model.half()
+
+        return model
+
     def generate_embeddings(
         self, articles: list[NewsArticlePydantic]
     ) -> tuple[list[NewsArticlePydantic], np.ndarray]:
@@ -46,29 +87,71 @@ class NewsClusterer:
             articles: List of news articles to embed
 
         Returns:
-            Tuple of (articles, embeddings matrix)
+            Tuple of (articles, embeddings matrix). Rows are unit-norm
+            float32 in a C-contiguous array.
         """
         if not articles:
             logger.warning("No articles to embed")
             return articles, np.array([])
 
         # Combine title and summary for richer embeddings
-        texts = []
-        for article in articles:
-            text = article.title
-            if article.summary:
-                text += f" {article.summary}"
-            texts.append(text)
+        texts = [f"{a.title} {a.summary}" if a.summary else a.title for a in articles]
+
+        # Look up cached embeddings; only unseen texts go to the model
+        keys = [hashlib.blake2b(text.encode(), digest_size=16).digest() for text in texts]
+        with self._embedding_cache_lock:
+            cache = self._embedding_cache
+            cached = {key: cache[key] for key in keys if key in cache}
+        misses = {key: text for key, text in zip(keys, texts) if key not in cached}
+
+        # Generate unit-norm embeddings; downstream centroid and HDBSCAN
+        # code relies on rows being unit-norm, float32 and C-contiguous
+        fresh: dict[bytes, np.ndarray] = {}
+        if misses:
+            logger.info(
+                f"Generating embeddings for {len(misses)} articles "
+                f"({len(texts) - len(misses)} cached)"
+            )
+            encoded = self.embedding_model.encode(
+                list(misses.values()),
+                batch_size=self.settings.clustering.embedding_batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False,
+            )
+            encoded = np.asarray(encoded, dtype=np.float32)
+            fresh = {key: row.copy() for key, row in zip(misses, encoded)}
+        else:
+            logger.info(f"Using cached embeddings for {len(texts)} articles")
 
-        # Generate embeddings
-        logger.info(f"Generating embeddings for {len(texts)} articles")
-        embeddings = self.embedding_model.encode(
-            texts, convert_to_numpy=True, show_progress_bar=False
-        )
+        embeddings = np.stack([fresh[key] if key in fresh else cached[key] for key in keys])
+        self._update_embedding_cache(cached, fresh)
 
         logger.info(f"Generated embeddings with shape {embeddings.shape}")
         return articles, embeddings
 
+    def _update_embedding_cache(
+        self, hits: dict[bytes, np.ndarray], fresh: dict[bytes, np.ndarray]
+    ) -> None:
+        """Refresh recency of cache hits, add new embeddings and evict the oldest.
+
+        Args:
+            hits: Embeddings served from the cache, by text hash
+            fresh: Newly encoded embeddings, by text hash
+        """
+        max_size = self.settings.clustering.embedding_cache_size
+        if max_size <= 0:
+            return
+
+        with self._embedding_cache_lock:
+            cache = self._embedding_cache
+            for key in hits:
+                if key in cache:
+                    cache.move_to_end(key)
+            cache.update(fresh)
+            while len(cache) > max_size:
+                cache.popitem(last=False)
+
     def cluster_articles(
         self, articles: list[NewsArticlePydantic], embeddings: np.ndarray
     ) -> dict[int, list[int]]:
@@ -87,10 +170,11 @@ class NewsClusterer:
             return {}
 
         # Need at least min_cluster_size articles
-        if len(articles) < self.settings.clustering.min_cluster_size:
+        min_cluster_size = self.settings.clustering.min_cluster_size
+        if len(articles) < min_cluster_size:
             logger.warning(
                 f"Too few articles ({len(articles)}) for clustering "
-                f"(min_cluster_size={self.settings.clustering.min_cluster_size}). "
+                f"(min_cluster_size={min_cluster_size}). "
                 "Treating all as noise."
             )
             return {-1: list(range(len(articles)))}
@@ -98,11 +182,11 @@ class NewsClusterer:
         # Fit HDBSCAN
         logger.info(
             f"Clustering {len(articles)} articles with "
-            f"min_cluster_size={self.settings.clustering.min_cluster_size}"
+            f"min_cluster_size={min_cluster_size}"
         )
 
         self.clusterer = hdbscan.HDBSCAN(
-            min_cluster_size=self.settings.clustering.min_cluster_size,
+            min_cluster_size=min_cluster_size,
             metric="euclidean",
             cluster_selection_method="eom",  # Excess of mass
             prediction_data=True,
@@ -110,12 +194,14 @@ class NewsClusterer:
 
         cluster_labels = self.clusterer.fit_predict(embeddings)
 
-        # Group articles by cluster
-        clusters: dict[int, list[int]] = {}
-        for idx, cluster_id in enumerate(cluster_labels):
-            if cluster_id not in clusters:
-                clusters[cluster_id] = []
-            clusters[cluster_id].append(idx)
+        # Group articles by cluster; a stable sort keeps each group's
+        # indices in ascending article order
+        order = np.argsort(cluster_labels, kind="stable")
+        labels, starts = np.unique(cluster_labels[order], return_index=True)
+        clusters: dict[int, list[int]] = {
+            int(label): group.tolist()
+            for label, group in zip(labels, np.split(order, starts[1:]))
+        }
 
         # Log clustering results
         n_clusters = len([c for c in clusters.keys() if c != -1])
@@ -132,12 +218,15 @@ class NewsClusterer:
     ) -> str:
         """Get representative headline for a cluster.
 
-        Finds the article closest to the cluster centroid.
+        Finds the article closest to the cluster centroid. For unit-norm
+        embeddings the nearest article (euclidean) is the one with the
+        largest dot product with the centroid, so a single matrix-vector
+        product replaces the subtract-and-norm pass.
 
         Args:
             cluster_indices: Indices of articles in the cluster
             articles: List of all articles
-            embeddings: Embedding matrix
+            embeddings: Unit-norm embedding matrix from generate_embeddings
 
         Returns:
             Title of the article closest to centroid
@@ -145,15 +234,15 @@ class NewsClusterer:
         if not cluster_indices:
             return ""
 
-        # Get embeddings for this cluster
+        # Get embeddings for this cluster (unit-norm, see generate_embeddings)
         cluster_embeddings = embeddings[cluster_indices]
 
         # Calculate centroid
-        centroid = np.mean(cluster_embeddings, axis=0)
+        centroid = cluster_embeddings.mean(axis=0)
 
         # Find article closest to centroid
-        distances = np.linalg.norm(cluster_embeddings - centroid, axis=1)
-        closest_idx = cluster_indices[np.argmin(distances)]
+        scores = cluster_embeddings @ centroid
+        closest_idx = cluster_indices[int(np.argmax(scores))]
 
         return articles[closest_idx].title
 
@@ -208,92 +297,67 @@ class NewsClusterer:
         # Cluster articles
         clusters = self.cluster_articles(articles, embeddings)
 
-        # Create NewsCluster and NewsArticle database records
-        news_clusters = []
-        news_articles_db = []
-
+        # Build NewsArticle rows in one pass. Article IDs are assigned here
+        # so clusters can reference them without a flush.
+        article_ids = [str(uuid.uuid4()) for _ in articles]
+        article_rows = []
         for cluster_id, cluster_indices in clusters.items():
-            if cluster_id == -1:
-                # Handle noise points - save articles without creating a cluster
-                for idx in cluster_indices:
-                    article = articles[idx]
-                    article_db = NewsArticle(
-                        anomaly_id=anomaly_id,
-                        source=article.source,
-                        title=article.title,
-                        url=str(article.url) if article.url else None,
-                        published_at=article.published_at,
-                        summary=article.summary,
-                        cluster_id=-1,  # Noise
-                        embedding=embeddings[idx].tolist(),
-                        timing_tag=article.timing_tag,
-                        time_diff_minutes=article.time_diff_minutes,
-                    )
-                    news_articles_db.append(article_db)
-                continue
-
-            # Get cluster metadata
-            centroid_summary = self.get_cluster_centroid_summary(
-                cluster_indices, articles, embeddings
-            )
-            dominant_sentiment = self.get_dominant_sentiment(cluster_indices, articles)
-
-            # Create cluster articles with embeddings
-            cluster_article_ids = []
             for idx in cluster_indices:
                 article = articles[idx]
-                article_db = NewsArticle(
-                    anomaly_id=anomaly_id,
-                    source=article.source,
-                    title=article.title,
-                    url=str(article.url) if article.url else None,
-                    published_at=article.published_at,
-                    summary=article.summary,
-                    cluster_id=cluster_id,
-                    embedding=embeddings[idx].tolist(),
-                    timing_tag=article.timing_tag,
-                    time_diff_minutes=article.time_diff_minutes,
+                article_rows.append(
+                    {
+                        "id": article_ids[idx],
+                        "anomaly_id": anomaly_id,
+                        "source": article.source,
+                        "title": article.title,
+                        "url": str(article.url) if article.url else None,
+                        "published_at": article.published_at,
+                        "summary": article.summary,
+                        "cluster_id": cluster_id,  # -1 for noise
+                        "embedding": embeddings[idx],
+                        "timing_tag": article.timing_tag,
+                        "time_diff_minutes": article.time_diff_minutes,
+                    }
                 )
-                news_articles_db.append(article_db)
-                # Will get ID after flush
-                cluster_article_ids.append(article_db)
 
-            # Create NewsCluster record
-            cluster = NewsCluster(
+        # Create NewsCluster records (noise points get no cluster)
+        news_clusters = [
+            NewsCluster(
                 anomaly_id=anomaly_id,
                 cluster_number=cluster_id,
-                article_ids=[],  # Will update after articles are persisted
-                centroid_summary=centroid_summary,
-                dominant_sentiment=dominant_sentiment,
+                article_ids=[article_ids[idx] for idx in cluster_indices],
+                centroid_summary=self.get_cluster_centroid_summary(
+                    cluster_indices, articles, embeddings
+                ),
+                dominant_sentiment=self.get_dominant_sentiment(cluster_indices, articles),
                 size=len(cluster_indices),
             )
-            news_clusters.append((cluster, cluster_article_ids))
+            for cluster_id, cluster_indices in clusters.items()
+            if cluster_id != -1
+        ]
 
         # Persist to database
         logger.info(
-            f"Persisting {len(news_articles_db)} articles and "
+            f"Persisting {len(article_rows)} articles and "
             f"{len(news_clusters)} clusters"
         )
 
-        # Add articles first to generate IDs
-        self.session.add_all(news_articles_db)
-        self.session.flush()  # Generate IDs
-
-        # Update cluster article_ids and add clusters
-        final_clusters = []
-        for cluster, article_objs in news_clusters:
-            cluster.article_ids = [article.id for article in article_objs]
-            self.session.add(cluster)
-            final_clusters.append(cluster)
-
-        self.session.commit()
+        # One executemany INSERT for all articles, then the clusters, in a
+        # single transaction
+        try:
+            self.session.execute(insert(NewsArticle), article_rows)
+            self.session.add_all(news_clusters)
+            self.session.commit()
+        except Exception:
+            self.session.rollback()
+            raise
 
         logger.info(
-            f"Successfully clustered and persisted {len(news_articles_db)} articles "
-            f"into {len(final_clusters)} clusters"
+            f"Successfully clustered and persisted {len(article_rows)} articles "
+            f"into {len(news_clusters)} clusters"
         )
 
-        return final_clusters
+        return news_clusters
 
     def cluster_for_anomaly(
         self, anomaly_id: str, articles: list[NewsArticlePydantic]
@@ -1,12 +1,25 @@
 """Binance API client for price data."""
 
 import asyncio
-from datetime import datetime, timedelta, UTC
-from typing import Any, Sequence
+import functools
+import json
+from datetime import datetime, UTC
+from typing import Sequence
+import aiohttp
 import httpx
 
-from src.phase1_detector.data_ingestion.crypto_client import CryptoClient
-from src.phase1_detector.data_ingestion.models import PriceData, TickerData
+from src.phase1_detector.data_ingestion.crypto_client import (
+    CryptoClient,
+    create_http_client,
+)
+from src.phase1_detector.data_ingestion.kline_cache import KlineCache
+from src.phase1_detector.data_ingestion.models import (
+    BinanceTicker24h,
+    BinanceTicker24hList,
+    PriceData,
+)
+from src.phase1_detector.data_ingestion.rate_limiter import RateLimiter
+from src.utils.http import json_loads
 
 
 class BinanceClient(CryptoClient):
@@ -23,15 +36,31 @@ class BinanceClient(CryptoClient):
 
     BASE_URL = "https://api.binance.com/api/v3"
 
-    def __init__(self, api_key: str | None = None, api_secret: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        api_secret: str | None = None,
+        price_cache_ttl: float = 2.0,
+        http_client: httpx.AsyncClient | None = None,
+        kline_cache: KlineCache | None = None,
+    ):
         """Initialize Binance client.
 
         Args:
             api_key: API key (optional, not required for public endpoints)
             api_secret: API secret (optional, not required for public endpoints)
+            price_cache_ttl: Seconds a fetched price is reused (0 disables caching)
+            http_client: Shared HTTP client to use instead of creating one; the
+                caller keeps ownership and is responsible for closing it
+            kline_cache: On-disk cache for closed historical windows (optional)
         """
-        super().__init__(api_key, api_secret)
-        self._client = httpx.AsyncClient(timeout=10.0)
+        super().__init__(api_key, api_secret, price_cache_ttl, kline_cache)
+        self._owns_client = http_client is None
+        self._client = http_client if http_client is not None else create_http_client()
+
+        # Binance: 1200 req/min = 20 req/sec
+        self._rate_limiter = RateLimiter(20, 1.0)
+        self._window_semaphore = asyncio.Semaphore(10)
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -39,13 +68,17 @@ class BinanceClient(CryptoClient):
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self._client.aclose()
+        await self.close()
 
     async def close(self):
-        """Close the HTTP client."""
-        await self._client.aclose()
-
-    def _convert_symbol(self, symbol: str) -> str:
+        """Close the HTTP clients this instance created."""
+        if self._owns_client:
+            await self._client.aclose()
+        await self._close_backfill_session()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _convert_symbol(symbol: str) -> str:
         """Convert standard symbol format to Binance format.
 
         Args:
@@ -57,7 +90,9 @@ class BinanceClient(CryptoClient):
         # Replace USD with USDT and remove dash
         return symbol.replace("-USD", "USDT").replace("-", "")
 
-    def _convert_symbol_back(self, binance_symbol: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _convert_symbol_back(binance_symbol: str) -> str:
         """Convert Binance symbol format back to standard format.
 
         Args:
@@ -72,6 +107,21 @@ class BinanceClient(CryptoClient):
     async def get_price(self, symbol: str) -> PriceData:
         """Get current price data for a symbol.
 
+        Args:
+            symbol: Trading pair symbol in standard format (e.g., 'BTC-USD')
+
+        Returns:
+            PriceData object with current market data
+
+        Raises:
+            ValueError: If symbol is invalid or not supported
+            ConnectionError: If API request fails
+        """
+        return await self._get_price_cached(symbol, functools.partial(self._fetch_price, symbol))
+
+    async def _fetch_price(self, symbol: str) -> PriceData:
+        """Fetch current price data for a symbol from the 24h ticker endpoint.
+
         Args:
             symbol: Trading pair symbol in standard format (e.g., 'BTC-USD')
 
@@ -84,25 +134,25 @@ class BinanceClient(CryptoClient):
         """
         binance_symbol = self._convert_symbol(symbol)
 
+        # Get 24h ticker data (includes price, volume, high, low)
+        url = f"{self.BASE_URL}/ticker/24hr"
+        params = {"symbol": binance_symbol}
+
         try:
-            # Get 24h ticker data (includes price, volume, high, low)
-            url = f"{self.BASE_URL}/ticker/24hr"
-            params = {"symbol": binance_symbol}
             response = await self._client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            # Parse response
-            ticker = self._parse_ticker(symbol, data)
-            return ticker.to_price_data(self.source_name)
-
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 400:
-                raise ValueError(f"Symbol {symbol} not found on Binance")
-            raise ConnectionError(f"Binance API error: {e}")
         except httpx.RequestError as e:
             raise ConnectionError(f"Failed to connect to Binance API: {e}")
 
+        # Check status codes directly; only real failures raise
+        if response.status_code == 400:
+            raise ValueError(f"Symbol {symbol} not found on Binance")
+        if response.status_code >= 400:
+            raise ConnectionError(f"Binance API error: HTTP {response.status_code}")
+
+        # Parse response
+        ticker = BinanceTicker24h.model_validate_json(response.content)
+        return self._parse_ticker(symbol, ticker, datetime.now(UTC))
+
     async def get_prices(self, symbols: Sequence[str]) -> list[PriceData]:
         """Get current price data for multiple symbols.
 
@@ -116,9 +166,24 @@ class BinanceClient(CryptoClient):
             ValueError: If any symbol is invalid
             ConnectionError: If API request fails
         """
-        # Fetch all symbols concurrently
-        tasks = [self.get_price(symbol) for symbol in symbols]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # One batched request covers every symbol that is not cached
+        missing = [s for s in dict.fromkeys(symbols) if self._cached_price(s) is None]
+        batch: dict[str, PriceData] = {}
+        if missing:
+            try:
+                batch = await self._fetch_prices_batch(missing)
+            except (ValueError, ConnectionError) as e:
+                print(f"Warning: Batched Binance ticker request failed, fetching per symbol: {e}")
+
+        async def get_one(symbol: str) -> PriceData:
+            if symbol in batch:
+                return batch[symbol]
+            return await self.get_price(symbol)
+
+        # Cached or leftover symbols go through get_price concurrently
+        results = await asyncio.gather(
+            *[get_one(symbol) for symbol in symbols], return_exceptions=True
+        )
 
         # Separate successful results from errors
         prices = []
@@ -130,6 +195,59 @@ class BinanceClient(CryptoClient):
 
         return prices
 
+    async def _fetch_prices_batch(self, symbols: Sequence[str]) -> dict[str, PriceData]:
+        """Fetch 24h tickers for many symbols with the symbols=[...] parameter.
+
+        Binance returns up to 100 symbols per request, so larger lists are
+        split into chunks fetched concurrently. Fetched prices are cached.
+
+        Args:
+            symbols: Trading pair symbols in standard format
+
+        Returns:
+            Dict of standard symbol to PriceData
+
+        Raises:
+            ValueError: If any symbol is invalid (Binance rejects the whole batch)
+            ConnectionError: If API request fails
+        """
+        by_binance_symbol = {self._convert_symbol(symbol): symbol for symbol in symbols}
+        binance_symbols = list(by_binance_symbol)
+        url = f"{self.BASE_URL}/ticker/24hr"
+
+        async def fetch_chunk(chunk: list[str]):
+            # Binance expects a compact JSON array, e.g. ["BTCUSDT","ETHUSDT"]
+            params = {"symbols": json.dumps(chunk, separators=(",", ":"))}
+            async with self._request_semaphore:
+                response = await self._client.get(url, params=params)
+            if response.status_code == 400:
+                raise ValueError(f"Invalid symbol in batch {chunk} on Binance")
+            if response.status_code >= 400:
+                raise ConnectionError(f"Binance API error: HTTP {response.status_code}")
+            return BinanceTicker24hList.validate_json(response.content)
+
+        try:
+            chunks = await asyncio.gather(
+                *[
+                    fetch_chunk(binance_symbols[i : i + 100])
+                    for i in range(0, len(binance_symbols), 100)
+                ]
+            )
+        except httpx.RequestError as e:
+            raise ConnectionError(f"Failed to connect to Binance API: {e}")
+
+        # One fetch time for the whole batch
+        now = datetime.now(UTC)
+        prices = {}
+        for ticker in (ticker for chunk in chunks for ticker in chunk):
+            symbol = by_binance_symbol.get(ticker.symbol)
+            if symbol is None:
+                continue
+            prices[symbol] = self._parse_ticker(symbol, ticker, now)
+            self._cache_price(symbol, prices[symbol])
+
+        return prices
+
     async def health_check(self) -> bool:
         """Check if the Binance API is reachable.
 
@@ -186,88 +304,120 @@ class BinanceClient(CryptoClient):
         interval = interval_map[granularity_seconds]
         binance_symbol = self._convert_symbol(symbol)
 
-        all_prices = []
-
         # Binance max is 1000 klines per request
         max_klines = 1000
         window_seconds = max_klines * granularity_seconds
 
         # Pagination: Split date range into chunks
-        current_start = start_time
+        windows = self._split_windows(start_time, end_time, window_seconds)
+
+        # Fetch windows concurrently; the rate limiter paces the requests
+        pages = await asyncio.gather(
+            *[
+                self._fetch_klines_window(
+                    symbol,
+                    binance_symbol,
+                    interval,
+                    granularity_seconds,
+                    window_start,
+                    window_end,
+                    max_klines,
+                )
+                for window_start, window_end in windows
+            ]
+        )
+
+        return [price for page in pages for price in page]
+
+    async def _fetch_klines_window(
+        self,
+        symbol: str,
+        binance_symbol: str,
+        interval: str,
+        granularity_seconds: int,
+        window_start: datetime,
+        window_end: datetime,
+        limit: int,
+    ) -> list[PriceData]:
+        """Fetch one page of klines from the kline cache or Binance.
+
+        Args:
+            symbol: Trading pair symbol in standard format (e.g., 'BTC-USD')
+            binance_symbol: Trading pair symbol in Binance format (e.g., 'BTCUSDT')
+            interval: Binance kline interval (e.g., '1m')
+            granularity_seconds: Kline interval in seconds
+            window_start: Start of the window (UTC)
+            window_end: End of the window (UTC)
+            limit: Maximum klines to request
+
+        Returns:
+            List of PriceData objects for the window
+
+        Raises:
+            ValueError: If symbol is invalid or not supported
+            ConnectionError: If API request fails
+        """
+        # Convert to milliseconds (Binance uses ms timestamps)
+        params = {
+            "symbol": binance_symbol,
+            "interval": interval,
+            "startTime": int(window_start.timestamp() * 1000),
+            "endTime": int(window_end.timestamp() * 1000),
+            "limit": limit,
+        }
 
-        while current_start < end_time:
-            current_end = min(
-                current_start + timedelta(seconds=window_seconds), end_time
+        try:
+            body = await self._get_window_body(
+                symbol,
+                granularity_seconds,
+                limit * granularity_seconds,
+                window_start,
+                window_end,
+                functools.partial(self._download_window, f"{self.BASE_URL}/klines", params),
             )
+            klines = json_loads(body)
 
-            try:
-                # Convert to milliseconds (Binance uses ms timestamps)
-                start_ms = int(current_start.timestamp() * 1000)
-                end_ms = int(current_end.timestamp() * 1000)
-
-                url = f"{self.BASE_URL}/klines"
-                params = {
-                    "symbol": binance_symbol,
-                    "interval": interval,
-                    "startTime": start_ms,
-                    "endTime": end_ms,
-                    "limit": max_klines,
-                }
+        except aiohttp.ClientResponseError as e:
+            if e.status == 400:
+                raise ValueError(f"Symbol {symbol} not found on Binance")
+            raise ConnectionError(f"Binance API error: {e}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise ConnectionError(f"Failed to connect to Binance API: {e}")
 
-                response = await self._client.get(url, params=params)
-                response.raise_for_status()
-                klines = response.json()
-
-                # Parse klines
-                # [Open time, Open, High, Low, Close, Volume, Close time, ...]
-                for kline in klines:
-                    timestamp = datetime.fromtimestamp(kline[0] / 1000, tz=UTC)
-
-                    price_data = PriceData(
-                        symbol=symbol,  # Use standard format
-                        timestamp=timestamp,
-                        price=float(kline[4]),  # close price
-                        volume_24h=float(kline[5]),  # volume
-                        high_24h=float(kline[2]),  # high
-                        low_24h=float(kline[3]),  # low
-                        bid=None,  # Not available in klines
-                        ask=None,  # Not available in klines
-                        source=self.source_name,
-                    )
-                    all_prices.append(price_data)
-
-                # Move to next window
-                current_start = current_end
-
-                # Rate limit protection (Binance: 1200 req/min = 20 req/sec)
-                await asyncio.sleep(0.05)
-
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 400:
-                    raise ValueError(f"Symbol {symbol} not found on Binance")
-                raise ConnectionError(f"Binance API error: {e}")
-            except httpx.RequestError as e:
-                raise ConnectionError(f"Failed to connect to Binance API: {e}")
-
-        return all_prices
-
-    def _parse_ticker(self, symbol: str, data: dict[str, Any]) -> TickerData:
-        """Parse Binance API response into TickerData.
+        # Parse klines in a worker thread so other windows keep downloading
+        # [Open time, Open, High, Low, Close, Volume, Close time, ...]
+        return await asyncio.to_thread(
+            self._candles_to_price_data,
+            symbol,  # Use standard format
+            klines,
+            time_unit="ms",
+            close_col=4,
+            volume_col=5,
+            high_col=2,
+            low_col=3,
+        )
+
+    def _parse_ticker(
+        self, symbol: str, ticker: BinanceTicker24h, now: datetime
+    ) -> PriceData:
+        """Convert a validated Binance 24hr ticker into PriceData.
 
         Args:
             symbol: Trading pair symbol in standard format
-            data: Response from Binance 24hr ticker endpoint
+            ticker: Fields from the Binance 24hr ticker endpoint
+            now: Fetch time to stamp on the snapshot
 
         Returns:
-            TickerData object
+            PriceData object
         """
-        return TickerData(
+        return PriceData(
             symbol=symbol,
-            price=float(data["lastPrice"]),
-            volume=float(data["volume"]),
-            high=float(data["highPrice"]),
-            low=float(data["lowPrice"]),
-            bid=float(data["bidPrice"]),
-            ask=float(data["askPrice"]),
-            timestamp=datetime.now(UTC),
+            timestamp=now,
+            price=ticker.price,
+            volume_24h=ticker.volume_24h,
+            high_24h=ticker.high_24h,
+            low_24h=ticker.low_24h,
+            bid=ticker.bid,
+            ask=ticker.ask,
+            source=self.source_name,
         )
@@ -1,12 +1,20 @@
 """Coinbase Advanced Trade API client for price data."""
 
 import asyncio
-from datetime import datetime, timedelta, UTC
+import functools
+from datetime import datetime, UTC
 from typing import Any, Sequence
+import aiohttp
 import httpx
 
-from src.phase1_detector.data_ingestion.crypto_client import CryptoClient
-from src.phase1_detector.data_ingestion.models import PriceData, TickerData
+from src.phase1_detector.data_ingestion.crypto_client import (
+    CryptoClient,
+    create_http_client,
+)
+from src.phase1_detector.data_ingestion.kline_cache import KlineCache
+from src.phase1_detector.data_ingestion.models import PriceData
+from src.phase1_detector.data_ingestion.rate_limiter import RateLimiter
+from src.utils.http import json_loads, parse_json
 
 
 class CoinbaseClient(CryptoClient):
@@ -21,15 +29,31 @@ class CoinbaseClient(CryptoClient):
     # Using the public Coinbase Exchange API (formerly GDAX)
     BASE_URL = "https://api.exchange.coinbase.com"
 
-    def __init__(self, api_key: str | None = None, api_secret: str | None = None):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        api_secret: str | None = None,
+        price_cache_ttl: float = 2.0,
+        http_client: httpx.AsyncClient | None = None,
+        kline_cache: KlineCache | None = None,
+    ):
         """Initialize Coinbase client.
 
         Args:
             api_key: API key (optional, not required for public endpoints)
             api_secret: API secret (optional, not required for public endpoints)
+            price_cache_ttl: Seconds a fetched price is reused (0 disables caching)
+            http_client: Shared HTTP client to use instead of creating one; the
+                caller keeps ownership and is responsible for closing it
+            kline_cache: On-disk cache for closed historical windows (optional)
         """
-        super().__init__(api_key, api_secret)
-        self._client = httpx.AsyncClient(timeout=10.0)
+        super().__init__(api_key, api_secret, price_cache_ttl, kline_cache)
+        self._owns_client = http_client is None
+        self._client = http_client if http_client is not None else create_http_client()
+
+        # Coinbase public API: 10 req/sec
+        self._rate_limiter = RateLimiter(10, 1.0)
+        self._window_semaphore = asyncio.Semaphore(10)
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -37,11 +61,13 @@ class CoinbaseClient(CryptoClient):
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self._client.aclose()
+        await self.close()
 
     async def close(self):
-        """Close the HTTP client."""
-        await self._client.aclose()
+        """Close the HTTP clients this instance created."""
+        if self._owns_client:
+            await self._client.aclose()
+        await self._close_backfill_session()
 
     async def get_price(self, symbol: str) -> PriceData:
         """Get current price data for a symbol.
@@ -56,33 +82,88 @@ class CoinbaseClient(CryptoClient):
             ValueError: If symbol is invalid or not supported
             ConnectionError: If API request fails
         """
+        return await self._get_price_cached(symbol, functools.partial(self._get_price, symbol))
+
+    async def _get_price(
+        self,
+        symbol: str,
+        stats_data: dict[str, Any] | None = None,
+        now: datetime | None = None,
+    ) -> PriceData:
+        """Fetch the ticker for a symbol, and its 24h stats unless already known.
+
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTC-USD')
+            stats_data: Prefetched 24h stats for the symbol (optional)
+            now: Fetch time shared by a batch of symbols (default: current time)
+
+        Returns:
+            PriceData object with current market data
+
+        Raises:
+            ValueError: If symbol is invalid or not supported
+            ConnectionError: If API request fails
+        """
+        # Ticker data (includes price and best bid/ask)
+        ticker_url = f"{self.BASE_URL}/products/{symbol}/ticker"
+
         try:
-            # Get ticker data (includes price and best bid/ask)
-            ticker_url = f"{self.BASE_URL}/products/{symbol}/ticker"
-            response = await self._client.get(ticker_url)
-            response.raise_for_status()
-            ticker_data = response.json()
-
-            # Get 24h stats (includes volume, high, low)
-            stats_url = f"{self.BASE_URL}/products/{symbol}/stats"
-            stats_response = await self._client.get(stats_url)
-            stats_response.raise_for_status()
-            stats_data = stats_response.json()
-
-            # Parse response
-            ticker = self._parse_ticker(symbol, ticker_data, stats_data)
-            return ticker.to_price_data(self.source_name)
-
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 404:
-                raise ValueError(f"Symbol {symbol} not found on Coinbase")
-            raise ConnectionError(f"Coinbase API error: {e}")
+            if stats_data is None:
+                # 24h stats (includes volume, high, low), fetched concurrently
+                stats_url = f"{self.BASE_URL}/products/{symbol}/stats"
+                responses = await asyncio.gather(
+                    self._client.get(ticker_url), self._client.get(stats_url)
+                )
+            else:
+                responses = [await self._client.get(ticker_url)]
         except httpx.RequestError as e:
             raise ConnectionError(f"Failed to connect to Coinbase API: {e}")
 
+        # Check status codes directly; only real failures raise
+        for response in responses:
+            if response.status_code == 404:
+                raise ValueError(f"Symbol {symbol} not found on Coinbase")
+            if response.status_code >= 400:
+                raise ConnectionError(f"Coinbase API error: HTTP {response.status_code}")
+
+        ticker_data = parse_json(responses[0])
+        if stats_data is None:
+            stats_data = parse_json(responses[1])
+
+        # Parse response
+        return self._parse_ticker(symbol, ticker_data, stats_data, now or datetime.now(UTC))
+
+    async def _get_all_stats(self) -> dict[str, dict[str, Any]]:
+        """Fetch 24h stats for every product in one request.
+
+        Returns:
+            Mapping of product ID -> 24h stats, empty if the request fails
+            (callers then fall back to the per-symbol stats endpoint)
+        """
+        try:
+            response = await self._client.get(f"{self.BASE_URL}/products/stats")
+        except httpx.RequestError as e:
+            print(f"Warning: Failed to fetch Coinbase product stats: {e}")
+            return {}
+
+        if response.status_code >= 400:
+            print(f"Warning: Failed to fetch Coinbase product stats: HTTP {response.status_code}")
+            return {}
+
+        data = parse_json(response)
+
+        return {
+            product_id: entry["stats_24hour"]
+            for product_id, entry in data.items()
+            if isinstance(entry, dict) and entry.get("stats_24hour")
+        }
+
     async def get_prices(self, symbols: Sequence[str]) -> list[PriceData]:
         """Get current price data for multiple symbols.
 
+        Fetches 24h stats for all products with a single request, so only
+        the ticker endpoint is called per symbol.
+
         Args:
             symbols: List of trading pair symbols
 
@@ -93,8 +174,20 @@ class CoinbaseClient(CryptoClient):
             ValueError: If any symbol is invalid
             ConnectionError: If API request fails
         """
-        # Fetch all symbols concurrently
-        tasks = [self.get_price(symbol) for symbol in symbols]
+        # Batched stats are only needed when some symbol is not cached
+        all_stats = {}
+        if any(self._cached_price(symbol) is None for symbol in symbols):
+            all_stats = await self._get_all_stats()
+
+        # Fetch all tickers concurrently, stamped with one fetch time
+        now = datetime.now(UTC)
+        tasks = [
+            self._get_price_cached(
+                symbol,
+                functools.partial(self._get_price, symbol, all_stats.get(symbol), now),
+            )
+            for symbol in symbols
+        ]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         # Separate successful results from errors
@@ -153,80 +246,108 @@ class CoinbaseClient(CryptoClient):
                 f"Must be one of {valid_granularities}"
             )
 
-        all_prices = []
-
         # Coinbase max is 300 candles per request
         max_candles = 300
         window_seconds = max_candles * granularity_seconds
 
         # Pagination: Split date range into chunks
-        current_start = start_time
+        windows = self._split_windows(start_time, end_time, window_seconds)
+
+        # Fetch windows concurrently; the rate limiter paces the requests
+        pages = await asyncio.gather(
+            *[
+                self._fetch_candles_window(
+                    symbol, window_start, window_end, granularity_seconds, max_candles
+                )
+                for window_start, window_end in windows
+            ]
+        )
+
+        return [price for page in pages for price in page]
+
+    async def _fetch_candles_window(
+        self,
+        symbol: str,
+        window_start: datetime,
+        window_end: datetime,
+        granularity_seconds: int,
+        max_candles: int,
+    ) -> list[PriceData]:
+        """Fetch one page of candles from the kline cache or Coinbase.
+
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTC-USD')
+            window_start: Start of the window (UTC)
+            window_end: End of the window (UTC)
+            granularity_seconds: Candle interval in seconds
+            max_candles: Candles in a full window
+
+        Returns:
+            List of PriceData objects for the window
 
-        while current_start < end_time:
-            current_end = min(
-                current_start + timedelta(seconds=window_seconds), end_time
+        Raises:
+            ValueError: If symbol is invalid or not supported
+            ConnectionError: If API request fails
+        """
+        # Convert to ISO 8601 format
+        params = {
+            "start": window_start.isoformat(),
+            "end": window_end.isoformat(),
+            "granularity": granularity_seconds,
+        }
+
+        url = f"{self.BASE_URL}/products/{symbol}/candles"
+
+        try:
+            body = await self._get_window_body(
+                symbol,
+                granularity_seconds,
+                max_candles * granularity_seconds,
+                window_start,
+                window_end,
+                functools.partial(self._download_window, url, params),
             )
+            candles = json_loads(body)
 
-            try:
-                # Convert to ISO 8601 format
-                start_iso = current_start.isoformat()
-                end_iso = current_end.isoformat()
-
-                url = f"{self.BASE_URL}/products/{symbol}/candles"
-                params = {
-                    "start": start_iso,
-                    "end": end_iso,
-                    "granularity": granularity_seconds,
-                }
-
-                response = await self._client.get(url, params=params)
-                response.raise_for_status()
-                candles = response.json()
-
-                # Parse candles: [timestamp, low, high, open, close, volume]
-                for candle in candles:
-                    timestamp = datetime.fromtimestamp(candle[0], tz=UTC)
-
-                    price_data = PriceData(
-                        symbol=symbol,
-                        timestamp=timestamp,
-                        price=float(candle[4]),  # close price
-                        volume_24h=float(candle[5]),  # volume
-                        high_24h=float(candle[2]),  # high
-                        low_24h=float(candle[1]),  # low
-                        bid=None,  # Not available in candles
-                        ask=None,  # Not available in candles
-                        source=self.source_name,
-                    )
-                    all_prices.append(price_data)
-
-                # Move to next window
-                current_start = current_end
-
-                # Rate limit protection (Coinbase public API: 10 req/sec)
-                await asyncio.sleep(0.1)
-
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    raise ValueError(f"Symbol {symbol} not found on Coinbase")
-                raise ConnectionError(f"Coinbase API error: {e}")
-            except httpx.RequestError as e:
-                raise ConnectionError(f"Failed to connect to Coinbase API: {e}")
-
-        return all_prices
+        except aiohttp.ClientResponseError as e:
+            if e.status == 404:
+                raise ValueError(f"Symbol {symbol} not found on Coinbase")
+            raise ConnectionError(f"Coinbase API error: {e}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise ConnectionError(f"Failed to connect to Coinbase API: {e}")
+
+        # Parse candles off the event loop: [timestamp, low, high, open, close, volume]
+        return await asyncio.to_thread(
+            self._candles_to_price_data,
+            symbol,
+            candles,
+            time_unit="s",
+            close_col=4,
+            volume_col=5,
+            high_col=2,
+            low_col=1,
+        )
 
     def _parse_ticker(
-        self, symbol: str, ticker_data: dict[str, Any], stats_data: dict[str, Any]
-    ) -> TickerData:
-        """Parse Coinbase API response into TickerData.
+        self,
+        symbol: str,
+        ticker_data: dict[str, Any],
+        stats_data: dict[str, Any],
+        now: datetime,
+    ) -> PriceData:
+        """Parse Coinbase API response into PriceData.
+
+        Merges the ticker (price, bid/ask) and 24h stats (volume, high,
+        low) into a single PriceData.
 
         Args:
             symbol: Trading pair symbol
             ticker_data: Response from ticker endpoint
             stats_data: Response from stats endpoint
+            now: Fetch time to stamp on the snapshot
 
         Returns:
-            TickerData object
+            PriceData object
         """
         # Extract from ticker response
         price = float(ticker_data.get("price", 0))
@@ -238,13 +359,14 @@ class CoinbaseClient(CryptoClient):
         high_24h = float(stats_data.get("high", price))
         low_24h = float(stats_data.get("low", price))
 
-        return TickerData(
+        return PriceData(
             symbol=symbol,
+            timestamp=now,
             price=price,
-            volume=volume_24h,
-            high=high_24h,
-            low=low_24h,
+            volume_24h=volume_24h,
+            high_24h=high_24h,
+            low_24h=low_24h,
             bid=best_bid,
             ask=best_ask,
-            timestamp=datetime.now(UTC),
+            source=self.source_name,
         )
@@ -1,15 +1,175 @@
 """Abstract base class for cryptocurrency exchange clients."""
 
+import asyncio
+import csv
+import io
+import time
+import warnings
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, UTC
-from typing import Sequence
+from typing import Any, Awaitable, Callable, Iterator, Sequence
 
+import aiohttp
+import httpx
+import numpy as np
 import pandas as pd
+from pydantic import TypeAdapter
+from sqlalchemy import select, text
 from sqlalchemy.orm import Session
-from sqlalchemy.dialects.postgresql import insert
 
+from src.phase1_detector.data_ingestion.kline_cache import KlineCache
 from src.phase1_detector.data_ingestion.models import PriceData
+from src.phase1_detector.data_ingestion.rate_limiter import RateLimiter
 from src.database.models import Price
+from src.utils.http import HTTP2_AVAILABLE
+
+
+def _retry_after_seconds(header: str | None, default: float) -> float:
+    """Parse a Retry-After header given in seconds.
+
+    Args:
+        header: Raw header value, if present
+        default: Delay to use when the header is missing or not a number
+
+    Returns:
+        Seconds to wait before retrying
+    """
+    if header is None:
+        return default
+    try:
+        return max(float(header), 0.0)
+    except ValueError:
+        return default
+
+
+# Bulk insert with one array parameter per column: PostgreSQL parses and
+# plans a fixed-size statement however many rows a batch holds, unlike a
+# VALUES list with a placeholder per cell. Timestamps go through timestamptz
+# so aware datetimes convert exactly as they do when bound individually.
+# created_at is left to the column's server default. Columns are listed in
+# PriceData field order.
+_PRICE_COLUMNS = (
+    "symbol",
+    "timestamp",
+    "price",
+    "volume_24h",
+    "high_24h",
+    "low_24h",
+    "bid",
+    "ask",
+    "source",
+)
+
+_UNNEST_INSERT_PRICES = text(
+    f"""
+    INSERT INTO {Price.__tablename__} ({", ".join(_PRICE_COLUMNS)})
+    SELECT * FROM unnest(
+        CAST(:symbol AS text[]),
+        CAST(:timestamp AS timestamptz[]),
+        CAST(:price AS float8[]),
+        CAST(:volume_24h AS float8[]),
+        CAST(:high_24h AS float8[]),
+        CAST(:low_24h AS float8[]),
+        CAST(:bid AS float8[]),
+        CAST(:ask AS float8[]),
+        CAST(:source AS text[])
+    )
+    ON CONFLICT ON CONSTRAINT uq_symbol_timestamp DO NOTHING
+    """
+)
+
+
+# SET LOCAL lasts until the end of the caller's transaction, so every write
+# committed with it (not just the prices) may be lost on a server crash
+_ASYNC_COMMIT = text("SET LOCAL synchronous_commit = off")
+
+
+def _price_rows(prices: Sequence[PriceData]) -> Iterator[tuple[Any, ...]]:
+    """Yield each price's field values in _PRICE_COLUMNS order.
+
+    Reads the validated field values straight from the instance dict,
+    which is about twice as fast as one attribute lookup per column and
+    several times faster than model_dump() per row.
+
+    Args:
+        prices: PriceData objects
+
+    Returns:
+        Iterator of value tuples, one per price
+    """
+    return (tuple(vars(p).values()) for p in prices)
+
+
+def _history_frame(
+    timestamps: Sequence[datetime],
+    prices: Sequence[float],
+    volumes: Sequence[float | None],
+    symbols: Sequence[str],
+) -> pd.DataFrame:
+    """Build a price history frame from column tuples with fixed dtypes.
+
+    Typed arrays skip pandas' per-cell type inference, and an empty result
+    keeps the same dtypes as a populated one instead of falling back to object.
+
+    Args:
+        timestamps: Naive UTC timestamps as stored in the prices table
+        prices: Prices
+        volumes: 24h volumes (None where not recorded)
+        symbols: Trading pair symbols
+
+    Returns:
+        DataFrame with columns: [timestamp, price, volume, symbol]
+    """
+    return pd.DataFrame(
+        {
+            "timestamp": pd.DatetimeIndex(timestamps, dtype="datetime64[ns]"),
+            "price": np.fromiter(prices, dtype=np.float64, count=len(prices)),
+            # NULL volumes become NaN
+            "volume": np.array(volumes, dtype=np.float64),
+            "symbol": pd.Series(symbols, dtype=str),
+        },
+        copy=False,
+    )
+
+
+# Validator for whole pages of candles at once
+_PRICE_DATA_LIST = TypeAdapter(list[PriceData])
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP client shared by all requests of an exchange client.
+
+    Keeps connections alive between polls so each request reuses an open TLS
+    connection, and multiplexes requests over HTTP/2 when h2 is installed.
+
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(10.0, connect=5.0),
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=50,
+            keepalive_expiry=60.0,
+        ),
+    )
+
+
+def create_backfill_session() -> aiohttp.ClientSession:
+    """Create the aiohttp session used for paginated historical backfills.
+
+    aiohttp has lower per-request overhead than httpx, which adds up over
+    hundreds of kline/candle pages. The connector keeps connections alive
+    and caches DNS lookups across pages.
+
+    Returns:
+        Configured aiohttp.ClientSession
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, limit_per_host=50, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=10),
+    )
 
 
 class CryptoClient(ABC):
@@ -19,16 +179,144 @@ class CryptoClient(ABC):
     and implement the required methods.
     """
 
-    def __init__(self, api_key: str | None = None, api_secret: str | None = None):
+    # Upper bound on concurrent price requests across all symbols
+    MAX_CONCURRENT_REQUESTS = 20
+
+    # Bulk writes larger than this go through COPY instead of INSERT batches
+    COPY_THRESHOLD = 10_000
+
+    # Rows fetched per round-trip when streaming price history
+    HISTORY_YIELD_PER = 5000
+
+    # Historical page retries: attempts and backoff (0.5, 1, 2, 4s)
+    MAX_WINDOW_ATTEMPTS = 5
+    RETRY_BASE_DELAY = 0.5
+    RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    # Set by subclasses: per-exchange request budget and historical page concurrency
+    _rate_limiter: RateLimiter
+    _window_semaphore: asyncio.Semaphore
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        api_secret: str | None = None,
+        price_cache_ttl: float = 2.0,
+        kline_cache: KlineCache | None = None,
+    ):
         """Initialize the crypto client.
 
         Args:
             api_key: API key for the exchange (optional for public endpoints)
             api_secret: API secret for the exchange (optional for public endpoints)
+            price_cache_ttl: Seconds a fetched price is reused (0 disables caching)
+            kline_cache: On-disk cache for closed historical windows (optional)
         """
         self.api_key = api_key
         self.api_secret = api_secret
 
+        # Latest price per symbol: symbol -> (monotonic fetch time, PriceData)
+        self._price_cache_ttl = price_cache_ttl
+        self._price_cache: dict[str, tuple[float, PriceData]] = {}
+
+        # Single-flight fetches per symbol, bounded across symbols
+        self._inflight: dict[str, asyncio.Future[PriceData]] = {}
+        self._request_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
+
+        # Created on first historical fetch
+        self._backfill_session: aiohttp.ClientSession | None = None
+        self._kline_cache = kline_cache
+
+    def _get_backfill_session(self) -> aiohttp.ClientSession:
+        """Get the backfill session, creating it on first use.
+
+        Returns:
+            Open aiohttp.ClientSession shared by all historical page requests
+        """
+        if self._backfill_session is None or self._backfill_session.closed:
+            self._backfill_session = create_backfill_session()
+        return self._backfill_session
+
+    async def _close_backfill_session(self) -> None:
+        """Close the backfill session if one was opened."""
+        if self._backfill_session is not None:
+            await self._backfill_session.close()
+            self._backfill_session = None
+
+    def _cached_price(self, symbol: str) -> PriceData | None:
+        """Get a cached price if it is still within the TTL.
+
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTC-USD')
+
+        Returns:
+            Cached PriceData, or None if missing or expired
+        """
+        if self._price_cache_ttl <= 0:
+            return None
+
+        entry = self._price_cache.get(symbol)
+        if entry is not None and time.monotonic() - entry[0] < self._price_cache_ttl:
+            return entry[1]
+        return None
+
+    async def _get_price_cached(
+        self, symbol: str, fetch: Callable[[], Awaitable[PriceData]]
+    ) -> PriceData:
+        """Return the cached price for a symbol, or fetch and cache it.
+
+        Concurrent lookups of the same symbol share one in-flight fetch, so
+        only the first one hits the API and the rest await its result.
+        Fetches across all symbols are capped at MAX_CONCURRENT_REQUESTS.
+
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTC-USD')
+            fetch: Coroutine factory that fetches fresh price data
+
+        Returns:
+            PriceData object with current market data
+        """
+        cached = self._cached_price(symbol)
+        if cached is not None:
+            return cached
+
+        task = self._inflight.get(symbol)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_cache(symbol, fetch))
+            self._inflight[symbol] = task
+            task.add_done_callback(lambda _: self._inflight.pop(symbol, None))
+
+        # Shield so one cancelled caller does not cancel the shared fetch
+        return await asyncio.shield(task)
+
+    async def _fetch_and_cache(
+        self, symbol: str, fetch: Callable[[], Awaitable[PriceData]]
+    ) -> PriceData:
+        """Fetch a price under the request semaphore and cache it.
+
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTC-USD')
+            fetch: Coroutine factory that fetches fresh price data
+
+        Returns:
+            PriceData object with current market data
+        """
+        async with self._request_semaphore:
+            price = await fetch()
+
+        self._cache_price(symbol, price)
+        return price
+
+    def _cache_price(self, symbol: str, price: PriceData) -> None:
+        """Store a freshly fetched price if caching is enabled.
+
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTC-USD')
+            price: Price data to cache
+        """
+        if self._price_cache_ttl > 0:
+            self._price_cache[symbol] = (time.monotonic(), price)
+
     @abstractmethod
     async def get_price(self, symbol: str) -> PriceData:
         """Get current price data for a symbol.
@@ -108,10 +396,181 @@ class CryptoClient(ABC):
         """
         pass
 
+    @staticmethod
+    def _split_windows(
+        start_time: datetime, end_time: datetime, window_seconds: int
+    ) -> list[tuple[datetime, datetime]]:
+        """Split a date range into consecutive pagination windows.
+
+        Window boundaries are aligned to multiples of window_seconds since
+        the epoch, so repeated backfills produce the same full windows and
+        can reuse cached pages. The windows are independent, so callers can
+        fetch them concurrently and concatenate the pages in list order.
+
+        Args:
+            start_time: Start of date range (UTC)
+            end_time: End of date range (UTC)
+            window_seconds: Maximum length of each window in seconds
+
+        Returns:
+            List of (window_start, window_end) pairs covering the range
+        """
+        windows = []
+        step = timedelta(seconds=window_seconds)
+        offset = timedelta(seconds=start_time.timestamp() % window_seconds)
+        current_start = start_time
+
+        # The first window runs only up to the next aligned boundary
+        current_end = start_time - offset + step
+        while current_start < end_time:
+            current_end = min(current_end, end_time)
+            windows.append((current_start, current_end))
+            current_start = current_end
+            current_end = current_start + step
+
+        return windows
+
+    async def _get_window_body(
+        self,
+        symbol: str,
+        granularity_seconds: int,
+        window_seconds: int,
+        window_start: datetime,
+        window_end: datetime,
+        download: Callable[[], Awaitable[bytes]],
+    ) -> bytes:
+        """Return a historical page body from the kline cache or the exchange.
+
+        Only full windows that have completely elapsed are cached; the
+        trailing window may still gain candles and is always downloaded.
+
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTC-USD')
+            granularity_seconds: Candle interval in seconds
+            window_seconds: Length of a full window in seconds
+            window_start: Start of the window (UTC)
+            window_end: End of the window (UTC)
+            download: Coroutine factory that fetches the raw page body
+
+        Returns:
+            Raw JSON body of the page
+        """
+        cache = self._kline_cache
+        closed_before = datetime.now(UTC) - timedelta(seconds=granularity_seconds)
+        cacheable = (
+            cache is not None
+            and (window_end - window_start).total_seconds() == window_seconds
+            and window_end <= closed_before
+        )
+
+        if cacheable:
+            body = cache.get(self.source_name, symbol, granularity_seconds, window_start)
+            if body is not None:
+                return body
+
+        body = await download()
+
+        if cacheable:
+            cache.put(self.source_name, symbol, granularity_seconds, window_start, body)
+        return body
+
+    async def _download_window(self, url: str, params: dict[str, Any]) -> bytes:
+        """Download one historical page, retrying transient failures.
+
+        Rate limiting (429), 5xx responses, dropped connections and timeouts
+        are retried with exponential backoff, honouring a Retry-After header
+        when the exchange sends one. Other error statuses fail immediately.
+
+        Args:
+            url: Page endpoint URL
+            params: Query parameters for the page
+
+        Returns:
+            Raw JSON body of the page
+
+        Raises:
+            aiohttp.ClientResponseError: On a non-retryable status, or once
+                attempts are exhausted
+            aiohttp.ClientError: If the connection still fails on the last attempt
+            asyncio.TimeoutError: If the request still times out on the last attempt
+        """
+        session = self._get_backfill_session()
+        last_attempt = self.MAX_WINDOW_ATTEMPTS - 1
+
+        for attempt in range(self.MAX_WINDOW_ATTEMPTS):
+            delay = self.RETRY_BASE_DELAY * 2**attempt
+            try:
+                async with self._window_semaphore, self._rate_limiter:
+                    async with session.get(url, params=params) as response:
+                        retryable = response.status in self.RETRYABLE_STATUSES
+                        if not retryable or attempt == last_attempt:
+                            response.raise_for_status()
+                            return await response.read()
+                        delay = _retry_after_seconds(response.headers.get("Retry-After"), delay)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == last_attempt:
+                    raise
+
+            # Sleep outside the semaphore so other windows keep downloading
+            await asyncio.sleep(delay)
+
+        raise AssertionError("unreachable")
+
+    def _candles_to_price_data(
+        self,
+        symbol: str,
+        candles: list[list[Any]],
+        time_unit: str,
+        close_col: int,
+        volume_col: int,
+        high_col: int,
+        low_col: int,
+    ) -> list[PriceData]:
+        """Convert a page of OHLCV candle rows into PriceData objects.
+
+        Reads only the needed fields of each row in a single pass, with no
+        intermediate table, and leaves numeric-string coercion to
+        pydantic-core. The timestamp is always the first column.
+
+        Args:
+            symbol: Trading pair symbol in standard format (e.g., 'BTC-USD')
+            candles: Candle rows as returned by the exchange
+            time_unit: Unit of the timestamp column ('s' or 'ms')
+            close_col: Index of the close price column
+            volume_col: Index of the volume column
+            high_col: Index of the high price column
+            low_col: Index of the low price column
+
+        Returns:
+            List of PriceData objects, one per candle
+        """
+        divisor = 1000 if time_unit == "ms" else 1
+
+        # Validate the whole page in one pydantic-core call; bid/ask are not
+        # available in candles and default to None
+        source = self.source_name
+        return _PRICE_DATA_LIST.validate_python(
+            [
+                {
+                    "symbol": symbol,
+                    "timestamp": datetime.fromtimestamp(row[0] / divisor, tz=UTC),
+                    "price": row[close_col],
+                    "volume_24h": row[volume_col],
+                    "high_24h": row[high_col],
+                    "low_24h": row[low_col],
+                    "source": source,
+                }
+                for row in candles
+            ]
+        )
+
     async def store_price(self, price_data: PriceData, session: Session) -> None:
         """Store price data to database.
 
-        Uses INSERT ... ON CONFLICT DO NOTHING to handle duplicates gracefully.
+        Deprecated: use store_prices_bulk([price_data], session), which this
+        delegates to. Does not commit; the caller owns the transaction,
+        which is committed asynchronously, so do not mix writes that must be
+        durable into it.
 
         Args:
             price_data: Price data to store
@@ -120,27 +579,12 @@ class CryptoClient(ABC):
         Raises:
             Exception: If database operation fails
         """
-        # Convert PriceData (Pydantic) to dict for insertion
-        price_dict = {
-            "symbol": price_data.symbol,
-            "timestamp": price_data.timestamp,
-            "price": price_data.price,
-            "volume_24h": price_data.volume_24h,
-            "high_24h": price_data.high_24h,
-            "low_24h": price_data.low_24h,
-            "bid": price_data.bid,
-            "ask": price_data.ask,
-            "source": price_data.source,
-            "created_at": datetime.now(UTC),
-        }
-
-        # Use PostgreSQL INSERT ... ON CONFLICT to handle duplicates
-        stmt = insert(Price).values(**price_dict)
-        # Ignore duplicates based on symbol + timestamp (unique constraint)
-        stmt = stmt.on_conflict_do_nothing(index_elements=["symbol", "timestamp"])
-
-        session.execute(stmt)
-        session.commit()
+        warnings.warn(
+            "store_price is deprecated; use store_prices_bulk",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        await self.store_prices_bulk([price_data], session)
 
     async def get_price_history(
         self,
@@ -164,32 +608,28 @@ class CryptoClient(ABC):
         Raises:
             Exception: If database query fails
         """
-        # Calculate cutoff time
-        cutoff_time = datetime.utcnow() - timedelta(minutes=minutes)
-
-        # Query price history
-        prices = (
-            session.query(Price)
-            .filter(
+        # Calculate cutoff time; an aware cutoff is converted with the same
+        # session time zone PostgreSQL used when storing the aware timestamps
+        cutoff_time = datetime.now(UTC) - timedelta(minutes=minutes)
+
+        # Project only the needed columns and stream them from a server-side
+        # cursor, so only one chunk of rows is held as Python objects at a time
+        result = session.execute(
+            select(Price.timestamp, Price.price, Price.volume_24h, Price.symbol)
+            .where(
                 Price.symbol == symbol,
                 Price.timestamp >= cutoff_time,
             )
             .order_by(Price.timestamp.asc())
-            .all()
+            .execution_options(yield_per=self.HISTORY_YIELD_PER)
         )
+        frames = [_history_frame(*zip(*rows)) for rows in result.partitions()]
 
-        # Convert to DataFrame
-        if not prices:
-            return pd.DataFrame(columns=["timestamp", "price", "volume", "symbol"])
-
-        data = {
-            "timestamp": [p.timestamp for p in prices],
-            "price": [p.price for p in prices],
-            "volume": [p.volume_24h for p in prices],
-            "symbol": [p.symbol for p in prices],
-        }
-
-        return pd.DataFrame(data)
+        if not frames:
+            return _history_frame((), (), (), ())
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, ignore_index=True)
 
     async def store_prices_bulk(
         self,
@@ -199,7 +639,16 @@ class CryptoClient(ABC):
     ) -> int:
         """Store multiple price records efficiently using bulk insert.
 
-        Uses INSERT ... ON CONFLICT DO NOTHING for idempotent operation.
+        Uses INSERT ... SELECT FROM unnest(...) ON CONFLICT DO NOTHING for
+        idempotent operation, binding one array per column. Does not commit,
+        so a whole ingestion cycle can be written in one transaction; the
+        caller commits (e.g. on leaving get_db_context). More than
+        COPY_THRESHOLD records are handed to store_prices_copy instead.
+
+        Turns off synchronous_commit for the rest of the caller's
+        transaction: ticks can be re-fetched, but every other write in that
+        transaction also loses its durability guarantee. Callers must not
+        mix writes that must survive a crash into the same transaction.
 
         Args:
             prices: List of PriceData objects to store
@@ -212,38 +661,110 @@ class CryptoClient(ABC):
         Raises:
             Exception: If database operation fails
         """
+        return self._insert_prices(prices, session, batch_size)
+
+    async def store_prices_copy(self, prices: list[PriceData], session: Session) -> int:
+        """Store a large set of price records via COPY into a staging table.
+
+        Streams the rows into a temporary table with COPY, then moves them
+        into prices with one INSERT ... SELECT ... ON CONFLICT DO NOTHING.
+        Like store_prices_bulk, this does not commit; the staging table is
+        dropped afterwards (and on commit at the latest). It also turns off
+        synchronous_commit for the rest of the caller's transaction, so
+        callers must not mix durable writes into the same transaction.
+
+        Args:
+            prices: List of PriceData objects to store
+            session: SQLAlchemy database session (PostgreSQL via psycopg2)
+
+        Returns:
+            Number of records actually inserted (excluding duplicates)
+
+        Raises:
+            Exception: If database operation fails
+        """
+        return self._copy_prices(prices, session)
+
+    def _insert_prices(self, prices: list[PriceData], session: Session, batch_size: int) -> int:
+        """Insert prices in unnest() batches, or via COPY above COPY_THRESHOLD.
+
+        Args:
+            prices: List of PriceData objects to store
+            session: SQLAlchemy database session
+            batch_size: Number of records per batch
+
+        Returns:
+            Number of records actually inserted (excluding duplicates)
+        """
         if not prices:
             return 0
 
-        # Convert PriceData objects to dicts
-        price_dicts = [
-            {
-                "symbol": p.symbol,
-                "timestamp": p.timestamp,
-                "price": p.price,
-                "volume_24h": p.volume_24h,
-                "high_24h": p.high_24h,
-                "low_24h": p.low_24h,
-                "bid": p.bid,
-                "ask": p.ask,
-                "source": p.source,
-                "created_at": datetime.now(UTC),
-            }
-            for p in prices
-        ]
+        # Large backfills: COPY skips the SQL parser entirely
+        if len(prices) > self.COPY_THRESHOLD:
+            return self._copy_prices(prices, session)
 
-        inserted_count = 0
+        # Ticks are re-fetchable, so skip the WAL flush wait on this transaction's commit
+        session.execute(_ASYNC_COMMIT)
 
-        # Process in batches
-        for i in range(0, len(price_dicts), batch_size):
-            batch = price_dicts[i : i + batch_size]
+        inserted_count = 0
 
-            # PostgreSQL-specific bulk insert with ON CONFLICT
-            stmt = insert(Price).values(batch)
-            stmt = stmt.on_conflict_do_nothing(constraint="uq_symbol_timestamp")
+        # Process in batches, one array per column
+        for i in range(0, len(prices), batch_size):
+            batch = prices[i : i + batch_size]
+            params = dict(zip(_PRICE_COLUMNS, map(list, zip(*_price_rows(batch)))))
 
-            result = session.execute(stmt)
+            result = session.execute(_UNNEST_INSERT_PRICES, params)
             inserted_count += result.rowcount
 
-        session.commit()
+        return inserted_count
+
+    def _copy_prices(self, prices: list[PriceData], session: Session) -> int:
+        """Stage prices with COPY and merge them into the prices table.
+
+        Args:
+            prices: List of PriceData objects to store
+            session: SQLAlchemy database session (PostgreSQL via psycopg2)
+
+        Returns:
+            Number of records actually inserted (excluding duplicates)
+        """
+        if not prices:
+            return 0
+
+        session.execute(_ASYNC_COMMIT)
+
+        columns = ", ".join(_PRICE_COLUMNS)
+        # Stage timestamps as timestamptz so the "+00:00" offset is honoured and
+        # converted with the session TimeZone on insert, exactly like the
+        # timestamptz[] cast in the unnest path
+        stage_columns = ", ".join(
+            "timestamp::timestamptz AS timestamp" if column == "timestamp" else column
+            for column in _PRICE_COLUMNS
+        )
+
+        # CSV with empty unquoted fields for NULLs
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows(_price_rows(prices))
+        buffer.seek(0)
+
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.execute(
+                f"CREATE TEMP TABLE _price_stage ON COMMIT DROP AS "
+                f"SELECT {stage_columns} FROM {Price.__tablename__} WITH NO DATA"
+            )
+            cursor.copy_expert(
+                f"COPY _price_stage ({columns}) FROM STDIN WITH (FORMAT csv)", buffer
+            )
+            cursor.execute(
+                f"INSERT INTO {Price.__tablename__} ({columns}) "
+                f"SELECT {columns} FROM _price_stage "
+                f"ON CONFLICT ON CONSTRAINT uq_symbol_timestamp DO NOTHING"
+            )
+            inserted_count = cursor.rowcount
+            cursor.execute("DROP TABLE _price_stage")
+        finally:
+            cursor.close()
+
         return inserted_count
@@ -0,0 +1,93 @@
+"""On-disk cache of closed historical candle windows."""
+
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+
+class KlineCache:
+    """SQLite cache of raw candle pages keyed by (source, symbol, granularity, window start).
+
+    Only full, closed windows are stored: a candle that has fully elapsed
+    never changes, so cached pages never expire. Pages are kept as the raw
+    JSON body returned by the exchange and decoded with the normal parsing
+    path on a hit.
+    """
+
+    def __init__(self, path: str | Path):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file path
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS kline_windows (
+                source TEXT NOT NULL,
+                symbol TEXT NOT NULL,
+                granularity_seconds INTEGER NOT NULL,
+                window_start INTEGER NOT NULL,
+                body BLOB NOT NULL,
+                PRIMARY KEY (source, symbol, granularity_seconds, window_start)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(
+        self,
+        source: str,
+        symbol: str,
+        granularity_seconds: int,
+        window_start: datetime,
+    ) -> bytes | None:
+        """Look up a cached window.
+
+        Args:
+            source: Exchange name (e.g., 'binance')
+            symbol: Trading pair symbol (e.g., 'BTC-USD')
+            granularity_seconds: Candle interval in seconds
+            window_start: Start of the window (UTC)
+
+        Returns:
+            Raw JSON body of the page, or None on a miss
+        """
+        row = self._conn.execute(
+            """
+            SELECT body FROM kline_windows
+            WHERE source = ? AND symbol = ? AND granularity_seconds = ?
+              AND window_start = ?
+            """,
+            (source, symbol, granularity_seconds, int(window_start.timestamp())),
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(
+        self,
+        source: str,
+        symbol: str,
+        granularity_seconds: int,
+        window_start: datetime,
+        body: bytes,
+    ) -> None:
+        """Store a closed window.
+
+        Args:
+            source: Exchange name (e.g., 'binance')
+            symbol: Trading pair symbol (e.g., 'BTC-USD')
+            granularity_seconds: Candle interval in seconds
+            window_start: Start of the window (UTC)
+            body: Raw JSON body of the page
+        """
+        self._conn.execute(
+            "INSERT OR REPLACE INTO kline_windows VALUES (?, ?, ?, ?, ?)",
+            (source, symbol, granularity_seconds, int(window_start.timestamp()), body),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
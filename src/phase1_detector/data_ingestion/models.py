@@ -1,11 +1,14 @@
 """Pydantic models for data ingestion."""
 
 from datetime import datetime, UTC
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class PriceData(BaseModel):
-    """Price data from crypto exchanges."""
+    """Price data from crypto exchanges.
+
+    Immutable: cached prices are shared between callers.
+    """
 
     symbol: str = Field(..., description="Trading pair symbol (e.g., BTC-USD)")
     timestamp: datetime = Field(..., description="Time of price snapshot")
@@ -18,6 +21,8 @@ class PriceData(BaseModel):
     source: str = Field(..., description="Data source (coinbase, binance)")
 
     model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
         json_schema_extra={
             "example": {
                 "symbol": "BTC-USD",
@@ -37,6 +42,8 @@ class PriceData(BaseModel):
 class TickerData(BaseModel):
     """Raw ticker data from exchange API."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     symbol: str
     price: float
     volume: float | None = None
@@ -46,18 +53,20 @@ class TickerData(BaseModel):
     ask: float | None = None
     timestamp: datetime | None = None
 
-    def to_price_data(self, source: str) -> PriceData:
+    def to_price_data(self, source: str, now: datetime | None = None) -> PriceData:
         """Convert to standardized PriceData.
 
         Args:
             source: Name of the data source (e.g., 'coinbase', 'binance')
+            now: Fetch time used when the ticker has no timestamp; pass one
+                value for a whole batch (defaults to the current time)
 
         Returns:
             Standardized PriceData object
         """
         return PriceData(
             symbol=self.symbol,
-            timestamp=self.timestamp or datetime.now(UTC),
+            timestamp=self.timestamp or now or datetime.now(UTC),
             price=self.price,
             volume_24h=self.volume,
             high_24h=self.high,
@@ -66,3 +75,24 @@ class TickerData(BaseModel):
             ask=self.ask,
             source=source,
         )
+
+
+class BinanceTicker24h(BaseModel):
+    """Fields used from a Binance /ticker/24hr response.
+
+    Validated straight from the raw JSON body, so the other ~15 fields of
+    the response are never materialized as Python objects. Binance sends
+    prices as strings, which are coerced to floats.
+    """
+
+    symbol: str = Field(..., description="Binance symbol (e.g., BTCUSDT)")
+    price: float = Field(..., validation_alias="lastPrice")
+    volume_24h: float = Field(..., validation_alias="volume")
+    high_24h: float = Field(..., validation_alias="highPrice")
+    low_24h: float = Field(..., validation_alias="lowPrice")
+    bid: float = Field(..., validation_alias="bidPrice")
+    ask: float = Field(..., validation_alias="askPrice")
+
+
+# Validator for the list returned by /ticker/24hr?symbols=[...]
+BinanceTicker24hList = TypeAdapter(list[BinanceTicker24h])
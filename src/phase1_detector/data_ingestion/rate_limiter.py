@@ -0,0 +1,56 @@
+"""Token-bucket rate limiter for exchange API requests."""
+
+import asyncio
+import time
+
+
+class RateLimiter:
+    """Async token-bucket limiter shared by all tasks of one client.
+
+    Allows bursts of up to ``max_rate`` requests, refilling at
+    ``max_rate / time_period`` tokens per second. Waiters are served in
+    arrival order.
+
+    Usage:
+        limiter = RateLimiter(20, 1.0)
+        async with limiter:
+            response = await client.get(url)
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        """Initialize the limiter.
+
+        Args:
+            max_rate: Requests allowed per time period (also the burst size)
+            time_period: Length of the period in seconds (default: 1.0)
+        """
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._refill_per_second = max_rate / time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent, then consume one token."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.max_rate,
+                    self._tokens + (now - self._last_refill) * self._refill_per_second,
+                )
+                self._last_refill = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self._refill_per_second)
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
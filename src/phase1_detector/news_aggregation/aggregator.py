@@ -1,11 +1,17 @@
 """News aggregator combining multiple news sources."""
 
 import asyncio
+import logging
+import time
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import Sequence
 
 from config.settings import settings
-from src.phase1_detector.news_aggregation.news_client import NewsClient
+from src.phase1_detector.news_aggregation.news_client import (
+    NewsClient,
+    create_news_http_client,
+)
 from src.phase1_detector.news_aggregation.cryptopanic_client import CryptoPanicClient
 from src.phase1_detector.news_aggregation.newsapi_client import NewsAPIClient
 from src.phase1_detector.news_aggregation.grok_client import GrokClient
@@ -13,6 +19,8 @@ from src.phase1_detector.news_aggregation.rss_client import RSSFeedClient
 from src.phase1_detector.news_aggregation.replay_client import HistoricalReplayClient
 from src.phase1_detector.news_aggregation.models import NewsArticle
 
+logger = logging.getLogger(__name__)
+
 
 class NewsAggregator:
     """Aggregates news from multiple sources for anomaly detection.
@@ -25,6 +33,10 @@ class NewsAggregator:
     This is the main entry point for Phase 1 news aggregation.
     """
 
+    # Source fetches retried on ConnectionError, with backoff (0.5, 1s)
+    MAX_FETCH_ATTEMPTS = 3
+    RETRY_BASE_DELAY = 0.5
+
     def __init__(
         self,
         mode: str | None = None,
@@ -44,6 +56,25 @@ class NewsAggregator:
         self.mode = mode
         self.clients: list[NewsClient] = []
 
+        # One connection pool for every HTTP source; closed by close()
+        self._http_client = create_news_http_client()
+
+        # Caps source fetches in flight across concurrent aggregator calls
+        self._semaphore = asyncio.Semaphore(settings.news.max_concurrent_fetches)
+
+        # Recent fetches per (client, symbols, minute window, limit):
+        # key -> (monotonic expiry, shared fetch)
+        self._fetch_cache_ttl = settings.news.fetch_cache_ttl_seconds
+        self._fetch_cache: dict[tuple, tuple[float, asyncio.Future[list[NewsArticle]]]] = {}
+
+        # Circuit breaker per source: consecutive failures, and monotonic time
+        # until which a source that kept failing is skipped
+        self._source_failures: dict[str, int] = {}
+        self._source_open_until: dict[str, float] = {}
+
+        # Last health report: (monotonic expiry, status per source)
+        self._health_cache: tuple[float, dict[str, bool]] | None = None
+
         if mode == "replay":
             # Historical replay only (deterministic, cost-free)
             self.clients.append(
@@ -52,17 +83,25 @@ class NewsAggregator:
 
         elif mode == "live":
             # RSS (free) + Grok (free tier)
-            self.clients.append(RSSFeedClient(rss_feeds=settings.news.rss_feeds))
+            self.clients.append(
+                RSSFeedClient(rss_feeds=settings.news.rss_feeds, http_client=self._http_client)
+            )
 
             # Grok client (optional - free tier available)
             grok_api_key = grok_key or settings.news.grok_api_key
             if grok_api_key:
-                self.clients.append(GrokClient(api_key=grok_api_key))
+                self.clients.append(GrokClient(api_key=grok_api_key, http_client=self._http_client))
 
             # Paid providers (optional, for backwards compatibility)
             crypto_key = cryptopanic_key or settings.news.cryptopanic_api_key
             if crypto_key:
-                self.clients.append(CryptoPanicClient(api_key=crypto_key))
+                self.clients.append(
+                    CryptoPanicClient(
+                        api_key=crypto_key,
+                        http_client=self._http_client,
+                        response_cache_ttl=self._fetch_cache_ttl,
+                    )
+                )
 
             news_key = newsapi_key or settings.news.newsapi_api_key
             if news_key:
@@ -73,11 +112,13 @@ class NewsAggregator:
             self.clients.append(
                 HistoricalReplayClient(dataset_path=settings.news.replay_dataset_path)
             )
-            self.clients.append(RSSFeedClient(rss_feeds=settings.news.rss_feeds))
+            self.clients.append(
+                RSSFeedClient(rss_feeds=settings.news.rss_feeds, http_client=self._http_client)
+            )
 
             grok_api_key = grok_key or settings.news.grok_api_key
             if grok_api_key:
-                self.clients.append(GrokClient(api_key=grok_api_key))
+                self.clients.append(GrokClient(api_key=grok_api_key, http_client=self._http_client))
 
         else:
             raise ValueError(f"Invalid news mode: {mode}. Must be 'live', 'replay', or 'hybrid'")
@@ -88,6 +129,20 @@ class NewsAggregator:
                 f"Check your settings and API keys."
             )
 
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close all sources and the shared HTTP client."""
+        for client in self.clients:
+            await client.close()
+        await self._http_client.aclose()
+
     async def get_news_for_anomaly(
         self,
         symbols: Sequence[str],
@@ -117,50 +172,9 @@ class NewsAggregator:
         start_time = anomaly_time - timedelta(minutes=window)
         end_time = anomaly_time + timedelta(minutes=window)
 
-        # Fetch from all sources concurrently
-        tasks = []
-        for client in self.clients:
-            task = client.get_news(
-                symbols=symbols,
-                start_time=start_time,
-                end_time=end_time,
-                limit=limit_per_source,
-            )
-            tasks.append(task)
-
-        # Gather results
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Combine articles from all sources
-        all_articles = []
-        for result in results:
-            if isinstance(result, Exception):
-                # Log error but continue with other sources
-                continue
-            all_articles.extend(result)
-
-        # Tag articles as pre_event or post_event
-        for article in all_articles:
-            time_diff = (article.published_at - anomaly_time).total_seconds() / 60
-            if article.published_at < anomaly_time:
-                article.timing_tag = "pre_event"
-            else:
-                article.timing_tag = "post_event"
-            article.time_diff_minutes = time_diff
-
-        # Sort by published time (newest first)
-        all_articles.sort(key=lambda x: x.published_at, reverse=True)
-
-        # Deduplicate by URL
-        seen_urls = set()
-        unique_articles = []
-        for article in all_articles:
-            url = str(article.url) if article.url else article.title
-            if url not in seen_urls:
-                seen_urls.add(url)
-                unique_articles.append(article)
-
-        return unique_articles
+        return await self._collect_news(
+            symbols, start_time, end_time, limit_per_source, anomaly_time=anomaly_time
+        )
 
     async def get_news(
         self,
@@ -182,60 +196,259 @@ class NewsAggregator:
         Returns:
             List of NewsArticle objects
         """
-        # Fetch from all sources concurrently
-        tasks = []
-        for client in self.clients:
-            task = client.get_news(
+        return await self._collect_news(symbols, start_time, end_time, limit_per_source)
+
+    async def _collect_news(
+        self,
+        symbols: Sequence[str] | None,
+        start_time: datetime | None,
+        end_time: datetime | None,
+        limit_per_source: int,
+        anomaly_time: datetime | None = None,
+    ) -> list[NewsArticle]:
+        """Fetch from all sources concurrently and merge results as they arrive.
+
+        Articles from fast sources are tagged and deduplicated while slower
+        sources are still in flight, so only the final sort waits on the
+        slowest source. Sources whose circuit breaker is open are skipped.
+
+        Args:
+            symbols: Crypto symbols to filter by
+            start_time: Start of time window
+            end_time: End of time window
+            limit_per_source: Max articles per source
+            anomaly_time: If given, tag articles relative to this time
+
+        Returns:
+            Deduplicated NewsArticle objects, sorted by published time (newest first)
+        """
+        now = time.monotonic()
+        tasks = [
+            self._fetch_cached(
+                client,
                 symbols=symbols,
                 start_time=start_time,
                 end_time=end_time,
                 limit=limit_per_source,
             )
-            tasks.append(task)
-
-        # Gather results
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Combine articles from all sources
-        all_articles = []
-        for result in results:
-            if isinstance(result, Exception):
+            for client in self.clients
+            if self._source_open_until.get(client.source_name, 0.0) <= now
+        ]
+
+        merged: dict[str, NewsArticle] = {}
+        for next_result in asyncio.as_completed(tasks):
+            try:
+                articles = await next_result
+            except Exception as e:
+                # Log error but continue with other sources
+                logger.warning(f"News source failed: {e}")
                 continue
-            all_articles.extend(result)
+            self._merge_articles(merged, articles, anomaly_time)
 
         # Sort by published time (newest first)
-        all_articles.sort(key=lambda x: x.published_at, reverse=True)
+        return sorted(merged.values(), key=attrgetter("published_at"), reverse=True)
+
+    @staticmethod
+    def _merge_articles(
+        merged: dict[str, NewsArticle],
+        articles: list[NewsArticle],
+        anomaly_time: datetime | None = None,
+    ) -> None:
+        """Merge one source's articles into the deduplicated set.
+
+        Articles are keyed by URL (or title when there is no URL). Of
+        duplicates, the most recently published one is kept, matching a
+        newest-first sort followed by first-wins deduplication.
+
+        Args:
+            merged: Articles kept so far, keyed by URL; updated in place
+            articles: Articles from one source
+            anomaly_time: If given, tag each article as pre_event or
+                post_event relative to it
+        """
+        for article in articles:
+            if anomaly_time is not None:
+                article.timing_tag = (
+                    "pre_event" if article.published_at < anomaly_time else "post_event"
+                )
+                article.time_diff_minutes = (
+                    article.published_at - anomaly_time
+                ).total_seconds() / 60
+
+            key = article.dedup_key
+            kept = merged.get(key)
+            if kept is None or article.published_at > kept.published_at:
+                merged[key] = article
+
+    async def _fetch_cached(
+        self,
+        client: NewsClient,
+        symbols: Sequence[str] | None,
+        start_time: datetime | None,
+        end_time: datetime | None,
+        limit: int,
+    ) -> list[NewsArticle]:
+        """Fetch news from one source, reusing a recent identical fetch.
+
+        Calls with the same source, symbols, limit and window (to the
+        minute) within the cache TTL share one fetch, including calls that
+        arrive while it is still in flight. Failed fetches are not cached.
+        Each caller gets its own copies of the articles, since the
+        aggregator tags them per anomaly.
+
+        Args:
+            client: News source to fetch from
+            symbols: Crypto symbols to filter by
+            start_time: Start of time window
+            end_time: End of time window
+            limit: Max articles from this source
+
+        Returns:
+            List of NewsArticle objects from the source
+        """
+        if self._fetch_cache_ttl <= 0:
+            return await self._fetch_from_client(client, symbols, start_time, end_time, limit)
+
+        key = (
+            client,
+            tuple(sorted(symbols)) if symbols else None,
+            start_time.replace(second=0, microsecond=0) if start_time else None,
+            end_time.replace(second=0, microsecond=0) if end_time else None,
+            limit,
+        )
+        now = time.monotonic()
+        entry = self._fetch_cache.get(key)
+
+        if entry is None or entry[0] <= now:
+            # Drop expired entries so the cache stays small
+            for stale in [k for k, (expiry, _) in self._fetch_cache.items() if expiry <= now]:
+                del self._fetch_cache[stale]
+
+            future = asyncio.ensure_future(
+                self._fetch_from_client(client, symbols, start_time, end_time, limit)
+            )
+            entry = (now + self._fetch_cache_ttl, future)
+            self._fetch_cache[key] = entry
 
-        # Deduplicate by URL
-        seen_urls = set()
-        unique_articles = []
-        for article in all_articles:
-            url = str(article.url) if article.url else article.title
-            if url not in seen_urls:
-                seen_urls.add(url)
-                unique_articles.append(article)
+            def forget_failure(done: asyncio.Future, entry=entry) -> None:
+                if (done.cancelled() or done.exception()) and self._fetch_cache.get(key) is entry:
+                    del self._fetch_cache[key]
 
-        return unique_articles
+            future.add_done_callback(forget_failure)
+
+        # Shield the shared fetch so one cancelled caller does not cancel it for others
+        articles = await asyncio.shield(entry[1])
+        return [article.model_copy() for article in articles]
+
+    async def _fetch_from_client(
+        self,
+        client: NewsClient,
+        symbols: Sequence[str] | None,
+        start_time: datetime | None,
+        end_time: datetime | None,
+        limit: int,
+    ) -> list[NewsArticle]:
+        """Fetch news from one source under the concurrency cap.
+
+        Each attempt is capped at settings.news.source_timeout_seconds.
+        Connection errors (including rate limiting) are retried with
+        exponential backoff; the semaphore is released while waiting. The
+        outcome feeds the source's circuit breaker.
+
+        Args:
+            client: News source to fetch from
+            symbols: Crypto symbols to filter by
+            start_time: Start of time window
+            end_time: End of time window
+            limit: Max articles from this source
+
+        Returns:
+            List of NewsArticle objects from the source
+
+        Raises:
+            ConnectionError: If the source still fails on the last attempt
+            TimeoutError: If an attempt exceeds the source timeout
+        """
+        try:
+            for attempt in range(self.MAX_FETCH_ATTEMPTS):
+                try:
+                    async with self._semaphore:
+                        articles = await asyncio.wait_for(
+                            client.get_news(
+                                symbols=symbols,
+                                start_time=start_time,
+                                end_time=end_time,
+                                limit=limit,
+                            ),
+                            timeout=settings.news.source_timeout_seconds,
+                        )
+                    break
+                except ConnectionError as e:
+                    if attempt == self.MAX_FETCH_ATTEMPTS - 1:
+                        raise
+                    wait_time = self.RETRY_BASE_DELAY * 2**attempt
+                    logger.warning(
+                        f"Fetching {client.source_name} failed, retrying in {wait_time}s "
+                        f"(attempt {attempt + 1}): {e}"
+                    )
+                    await asyncio.sleep(wait_time)
+        except Exception:
+            self._record_source_failure(client.source_name)
+            raise
+
+        self._source_failures.pop(client.source_name, None)
+        return articles
+
+    def _record_source_failure(self, source: str) -> None:
+        """Count a failed fetch and open the source's breaker at the threshold.
+
+        Once open, the source is skipped for settings.news.breaker_reset_seconds.
+        The next fetch after that is a trial: success resets the count, failure
+        reopens the breaker straight away.
+
+        Args:
+            source: Source name
+        """
+        failures = self._source_failures.get(source, 0) + 1
+        self._source_failures[source] = failures
+
+        if failures >= settings.news.breaker_failure_threshold:
+            reset = settings.news.breaker_reset_seconds
+            self._source_open_until[source] = time.monotonic() + reset
+            logger.warning(f"News source {source} failed {failures} times, skipping for {reset}s")
 
     async def health_check(self) -> dict[str, bool]:
         """Check health of all news sources.
 
+        Waits at most settings.news.health_check_timeout_seconds; sources
+        that have not answered by then are cancelled and reported unhealthy.
+        A report is reused for settings.news.health_cache_ttl_seconds, since
+        some checks make a real API request that counts against rate limits.
+
         Returns:
             Dictionary mapping source names to health status
         """
-        tasks = []
-        sources = []
+        now = time.monotonic()
+        if self._health_cache is not None and self._health_cache[0] > now:
+            return dict(self._health_cache[1])
 
-        for client in self.clients:
-            tasks.append(client.health_check())
-            sources.append(client.source_name)
+        tasks = {
+            client.source_name: asyncio.ensure_future(client.health_check())
+            for client in self.clients
+        }
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        done, pending = await asyncio.wait(
+            tasks.values(), timeout=settings.news.health_check_timeout_seconds
+        )
+        for task in pending:
+            task.cancel()
 
-        return {
-            source: result if isinstance(result, bool) else False
-            for source, result in zip(sources, results)
+        health = {
+            source: task in done and task.exception() is None and task.result() is True
+            for source, task in tasks.items()
         }
+        self._health_cache = (time.monotonic() + settings.news.health_cache_ttl_seconds, health)
+        return dict(health)
 
     def __repr__(self) -> str:
         """String representation."""
@@ -1,11 +1,31 @@
 """CryptoPanic API client for cryptocurrency news."""
 
+import functools
+import time
 import httpx
 from datetime import datetime
+from itertools import islice
 from typing import Sequence
 
 from src.phase1_detector.news_aggregation.news_client import NewsClient
 from src.phase1_detector.news_aggregation.models import NewsArticle, CryptoPanicArticle
+from src.utils.http import parse_json
+
+
+@functools.lru_cache(maxsize=256)
+def _currencies_param(symbols: tuple[str, ...]) -> str:
+    """Convert trading pairs to CryptoPanic's comma-separated currency codes.
+
+    CryptoPanic uses currency codes (BTC, ETH) not trading pairs. The
+    pipeline asks about the same watchlist every cycle, so results are cached.
+
+    Args:
+        symbols: Symbols in request order (e.g., ('BTC-USD', 'ETH'))
+
+    Returns:
+        Currencies query value (e.g., 'BTC,ETH')
+    """
+    return ",".join(s.split("-")[0] for s in symbols)
 
 
 class CryptoPanicClient(NewsClient):
@@ -19,16 +39,33 @@ class CryptoPanicClient(NewsClient):
 
     BASE_URL = "https://cryptopanic.com/api/v1"
 
-    def __init__(self, api_key: str, timeout: int = 10):
+    def __init__(
+        self,
+        api_key: str,
+        timeout: int = 10,
+        http_client: httpx.AsyncClient | None = None,
+        response_cache_ttl: float = 60.0,
+    ):
         """Initialize CryptoPanic client.
 
         Args:
             api_key: CryptoPanic API key (get from https://cryptopanic.com/developers/api/)
             timeout: Request timeout in seconds
+            http_client: Shared HTTP client to use instead of creating one; the
+                caller keeps ownership and is responsible for closing it
+            response_cache_ttl: Seconds a response is reused for the same
+                currencies (0 disables caching)
         """
         super().__init__(api_key=api_key)
         self.timeout = timeout
-        self._client = httpx.AsyncClient(timeout=timeout)
+        # An own client is created on first request (see _client), so instances
+        # that never fetch hold no connection pool
+        self._owns_client = http_client is None
+        self._http_client = http_client
+
+        # currencies param -> (monotonic expiry, raw results)
+        self._response_cache_ttl = response_cache_ttl
+        self._response_cache: dict[str, tuple[float, list[dict]]] = {}
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -36,7 +73,20 @@ class CryptoPanicClient(NewsClient):
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self._client.aclose()
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the HTTP client if this instance created it."""
+        if self._owns_client and self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        """HTTP client for requests, created on first use when not shared."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient()
+        return self._http_client
 
     async def get_news(
         self,
@@ -68,55 +118,77 @@ class CryptoPanicClient(NewsClient):
             "auth_token": self.api_key,
             "kind": "news",  # Only news articles, not media
             "filter": "hot",  # Hot news (trending)
+            "public": "true",  # Public feed: no per-user fields in the payload
         }
 
         # Add currency filter if symbols provided
         if symbols:
-            # CryptoPanic uses currency codes (BTC, ETH) not trading pairs
-            currencies = [s.split("-")[0] if "-" in s else s for s in symbols]
-            params["currencies"] = ",".join(currencies)
+            params["currencies"] = _currencies_param(tuple(symbols))
 
-        try:
-            response = await self._client.get(f"{self.BASE_URL}/posts/", params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            if "results" not in data:
-                raise ValueError(f"Unexpected API response: {data}")
-
-            # Parse articles
-            articles = []
-            for item in data["results"][:limit]:
-                try:
-                    # Parse published_at timestamp
-                    published_at = datetime.fromisoformat(
-                        item["published_at"].replace("Z", "+00:00")
-                    )
+        results = await self._get_results(params)
 
-                    # Filter by time window if specified
-                    if start_time and published_at < start_time:
-                        continue
-                    if end_time and published_at > end_time:
-                        continue
+        # Parse articles
+        articles = []
+        for item in islice(results, limit):
+            try:
+                # Parse published_at timestamp (fromisoformat accepts "Z" since 3.11)
+                published_at = datetime.fromisoformat(item["published_at"])
 
-                    crypto_article = CryptoPanicArticle(
-                        id=item["id"],
+                # Filter by time window if specified
+                if start_time and published_at < start_time:
+                    continue
+                if end_time and published_at > end_time:
+                    continue
+
+                # Map straight to NewsArticle; a CryptoPanicArticle in between
+                # would validate every field a second time
+                source_title = item.get("source", {}).get("title")
+                articles.append(
+                    NewsArticle(
+                        source="cryptopanic",
                         title=item["title"],
                         url=item["url"],
                         published_at=published_at,
-                        source_title=item.get("source", {}).get("title"),
-                        currencies=item.get("currencies", []),
-                        kind=item.get("kind"),
-                        domain=item.get("domain"),
-                        votes=item.get("votes"),
+                        summary=f"Source: {source_title or item.get('domain')}",
+                        sentiment=CryptoPanicArticle.vote_sentiment(item.get("votes")),
+                        symbols=CryptoPanicArticle.currency_codes(item.get("currencies", [])),
                     )
-                    articles.append(crypto_article.to_news_article())
-                except (KeyError, ValueError) as e:
-                    # Skip malformed articles
-                    continue
+                )
+            except (KeyError, ValueError) as e:
+                # Skip malformed articles
+                continue
 
-            return articles
+        return articles
 
+    async def _get_results(self, params: dict[str, str]) -> list[dict]:
+        """Fetch the raw post list, reusing a recent response for the same query.
+
+        The time window is applied locally, so anomalies with different
+        windows for the same currencies send the same request; within the
+        cache TTL they share one response.
+
+        Args:
+            params: Query parameters for /posts/
+
+        Returns:
+            Raw post dicts from the response's "results"
+
+        Raises:
+            ValueError: If API key is invalid or the response is malformed
+            ConnectionError: If API request fails
+        """
+        key = params.get("currencies", "")
+        now = time.monotonic()
+        entry = self._response_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        try:
+            response = await self._client.get(
+                f"{self.BASE_URL}/posts/", params=params, timeout=self.timeout
+            )
+            response.raise_for_status()
+            data = parse_json(response)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
                 raise ValueError("Invalid CryptoPanic API key")
@@ -124,6 +196,17 @@ class CryptoPanicClient(NewsClient):
         except httpx.RequestError as e:
             raise ConnectionError(f"Failed to connect to CryptoPanic: {e}")
 
+        if "results" not in data:
+            raise ValueError(f"Unexpected API response: {data}")
+
+        if self._response_cache_ttl > 0:
+            # Drop expired entries so the cache stays small
+            for stale in [k for k, (expiry, _) in self._response_cache.items() if expiry <= now]:
+                del self._response_cache[stale]
+            self._response_cache[key] = (now + self._response_cache_ttl, data["results"])
+
+        return data["results"]
+
     async def health_check(self) -> bool:
         """Check if CryptoPanic API is reachable.
 
@@ -58,6 +58,7 @@ class GrokClient(NewsClient):
         timeout: int = DEFAULT_TIMEOUT,
         model: str = DEFAULT_MODEL,
         min_engagement: int = MIN_ENGAGEMENT,
+        http_client: httpx.AsyncClient | None = None,
     ):
         """Initialize Grok API client.
 
@@ -66,18 +67,20 @@ class GrokClient(NewsClient):
             timeout: Request timeout in seconds (default: 30)
             model: Grok model to use (default: grok-beta)
             min_engagement: Minimum likes for post filtering (default: 100)
+            http_client: Shared HTTP client to use instead of creating one; the
+                caller keeps ownership and is responsible for closing it
         """
         super().__init__(api_key=api_key)
         self.timeout = timeout
         self.model = model
         self.min_engagement = min_engagement
-        self._client = httpx.AsyncClient(
-            timeout=timeout,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-                "Content-Type": "application/json",
-            },
-        )
+        # Sent per request, since a shared client carries no auth headers
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
+        self._owns_client = http_client is None
+        self._client = http_client if http_client is not None else httpx.AsyncClient()
         # Usage tracking for budget enforcement
         self._cumulative_cost = 0.0
         self._request_count = 0
@@ -88,7 +91,12 @@ class GrokClient(NewsClient):
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self._client.aclose()
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the HTTP client if this instance created it."""
+        if self._owns_client:
+            await self._client.aclose()
 
     def _build_search_query(self, symbols: Sequence[str] | None = None) -> str:
         """Build search query for X/Twitter posts.
@@ -395,6 +403,8 @@ class GrokClient(NewsClient):
             response = await self._client.post(
                 f"{self.BASE_URL}/chat/completions",
                 json=payload,
+                headers=self._headers,
+                timeout=self.timeout,
             )
             response.raise_for_status()
             data = response.json()
@@ -448,6 +458,7 @@ class GrokClient(NewsClient):
         try:
             response = await self._client.get(
                 f"{self.BASE_URL}/models",
+                headers=self._headers,
                 timeout=5,
             )
             return response.status_code == 200
@@ -1,9 +1,34 @@
 """Pydantic models for news data."""
 
 from datetime import datetime
+from functools import cached_property
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
 from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 
+# Query parameters added by share links and campaigns; they never select content
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "ref_src"})
+
+
+def _normalize_url(url: str) -> str:
+    """Drop tracking query parameters and the fragment, and lower-case the host.
+
+    Args:
+        url: Article URL
+
+    Returns:
+        Normalized URL
+    """
+    parts = urlsplit(url)
+    query = [
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not name.startswith("utm_") and name not in _TRACKING_PARAMS
+    ]
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ""))
+
+
 class NewsArticle(BaseModel):
     """News article data from various sources.
 
@@ -35,6 +60,15 @@ class NewsArticle(BaseModel):
         }
     )
 
+    @cached_property
+    def dedup_key(self) -> str:
+        """Key used to deduplicate articles across sources: the URL, or the title.
+
+        The URL is normalized so that copies of one article shared with
+        different tracking parameters or fragments get the same key.
+        """
+        return _normalize_url(str(self.url)) if self.url else self.title
+
 
 class CryptoPanicArticle(BaseModel):
     """CryptoPanic API article data.
@@ -67,28 +101,47 @@ class CryptoPanicArticle(BaseModel):
         Returns:
             NewsArticle instance
         """
-        # Extract symbol codes from currencies
-        symbols = [curr.get("code", "").upper() for curr in self.currencies if curr.get("code")]
-
-        # Calculate sentiment from votes if available
-        sentiment = None
-        if self.votes:
-            positive = self.votes.get("positive", 0)
-            negative = self.votes.get("negative", 0)
-            total = positive + negative
-            if total > 0:
-                sentiment = (positive - negative) / total
-
         return NewsArticle(
             source="cryptopanic",
             title=self.title,
             url=str(self.url),
             published_at=self.published_at,
             summary=f"Source: {self.source_title or self.domain}",
-            sentiment=sentiment,
-            symbols=symbols,
+            sentiment=self.vote_sentiment(self.votes),
+            symbols=self.currency_codes(self.currencies),
         )
 
+    @staticmethod
+    def currency_codes(currencies: list[dict]) -> list[str]:
+        """Extract upper-case symbol codes from CryptoPanic currency entries.
+
+        Args:
+            currencies: Currency dicts as returned by the API
+
+        Returns:
+            Currency codes (e.g., ['BTC', 'ETH'])
+        """
+        return [curr.get("code", "").upper() for curr in currencies if curr.get("code")]
+
+    @staticmethod
+    def vote_sentiment(votes: dict | None) -> float | None:
+        """Calculate sentiment from CryptoPanic votes.
+
+        Args:
+            votes: Voting data as returned by the API
+
+        Returns:
+            (positive - negative) / total in [-1, 1], or None without votes
+        """
+        if not votes:
+            return None
+        positive = votes.get("positive", 0)
+        negative = votes.get("negative", 0)
+        total = positive + negative
+        if total > 0:
+            return (positive - negative) / total
+        return None
+
 
 class NewsAPIArticle(BaseModel):
     """NewsAPI article data.
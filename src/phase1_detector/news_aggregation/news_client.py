@@ -4,7 +4,31 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Sequence
 
+import httpx
+
 from src.phase1_detector.news_aggregation.models import NewsArticle
+from src.utils.http import HTTP2_AVAILABLE
+
+
+def create_news_http_client() -> httpx.AsyncClient:
+    """Create the pooled HTTP client shared by all news clients of an aggregator.
+
+    Concurrent fetches reuse open TLS connections, and requests to the same
+    host are multiplexed over one connection when HTTP/2 is available.
+    Clients pass their own per-request timeouts.
+
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=httpx.Timeout(10.0, connect=5.0),
+        limits=httpx.Limits(
+            max_connections=20,
+            max_keepalive_connections=20,
+            keepalive_expiry=60.0,
+        ),
+    )
 
 
 class NewsClient(ABC):
@@ -23,6 +47,10 @@ class NewsClient(ABC):
         """
         self.api_key = api_key
 
+    async def close(self) -> None:
+        """Release any connections held by the client."""
+        return None
+
     @abstractmethod
     async def get_news(
         self,
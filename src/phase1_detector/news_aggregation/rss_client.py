@@ -43,6 +43,7 @@ class RSSFeedClient(NewsClient):
         rss_feeds: list[str] | None = None,
         timeout: int = 30,
         user_agent: str = "MarketAnomalyEngine/0.1.0",
+        http_client: httpx.AsyncClient | None = None,
     ):
         """Initialize RSS feed client.
 
@@ -50,11 +51,29 @@ class RSSFeedClient(NewsClient):
             rss_feeds: List of RSS feed URLs (defaults to DEFAULT_FEEDS)
             timeout: HTTP request timeout in seconds
             user_agent: User agent string for HTTP requests
+            http_client: Shared HTTP client to use instead of creating one; the
+                caller keeps ownership and is responsible for closing it
         """
         super().__init__(api_key=None)
         self.rss_feeds = rss_feeds or self.DEFAULT_FEEDS
         self.timeout = timeout
         self.user_agent = user_agent
+        # One pooled client for all feeds, so refetches reuse open connections
+        self._owns_client = http_client is None
+        self._client = http_client if http_client is not None else httpx.AsyncClient()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the HTTP client if this instance created it."""
+        if self._owns_client:
+            await self._client.aclose()
 
     async def get_news(
         self,
@@ -137,14 +156,14 @@ class RSSFeedClient(NewsClient):
         Raises:
             httpx.HTTPError: If request fails
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            response = await client.get(
-                feed_url,
-                headers={"User-Agent": self.user_agent},
-                follow_redirects=True,
-            )
-            response.raise_for_status()
-            return response.text
+        response = await self._client.get(
+            feed_url,
+            headers={"User-Agent": self.user_agent},
+            follow_redirects=True,
+            timeout=self.timeout,
+        )
+        response.raise_for_status()
+        return response.text
 
     def _parse_entry(
         self, entry: FeedParserDict, symbols: Sequence[str] | None
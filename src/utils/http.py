@@ -0,0 +1,36 @@
+"""HTTP helpers shared by the exchange and news clients."""
+
+import importlib.util
+import json
+from typing import Any
+
+import httpx
+
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+    json_loads = orjson.loads
+except ImportError:
+    ORJSON_AVAILABLE = False
+    json_loads = json.loads
+
+
+def parse_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed.
+
+    orjson parses the raw bytes directly and is several times faster than
+    the stdlib decoder on large kline arrays and post lists.
+
+    Args:
+        response: HTTP response with a JSON body
+
+    Returns:
+        Decoded JSON value
+    """
+    if ORJSON_AVAILABLE:
+        return json_loads(response.content)
+    return response.json()
@@ -67,7 +67,7 @@ async def main():
 
         if anomaly:
             console.print(f"[green]✓ Anomaly detected![/green]")
-            console.print(f"  Type: {anomaly.anomaly_type.value}")
+            console.print(f"  Type: {anomaly.anomaly_type}")
             console.print(f"  Confidence: {anomaly.confidence:.2%}")
             console.print(f"  Z-Score: {anomaly.z_score:.2f}")
             console.print(f"  Price Change: {anomaly.price_change_pct:+.2f}%")
@@ -17,6 +17,7 @@ def mock_settings():
     settings.data_ingestion.primary_source = "coinbase"
     settings.data_ingestion.coinbase_api_key = None
     settings.data_ingestion.coinbase_api_secret = None
+    settings.data_ingestion.price_cache_ttl_seconds = 2.0
     settings.orchestration.duplicate_window_minutes = 5
     settings.orchestration.price_history_lookback_minutes = 60
     settings.orchestration.min_price_points = 30
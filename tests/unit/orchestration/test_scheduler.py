@@ -177,6 +177,21 @@ class TestUpdateMetrics:
         assert scheduler.metrics.narratives_rejected == 1
         assert scheduler.metrics.narratives_validated == 0
 
+    def test_merge_metrics_batch(
+        self, scheduler, sample_success_stats, sample_failure_stats
+    ):
+        """Test a cycle's stats are merged into overall and symbol metrics."""
+        scheduler._merge_metrics([sample_success_stats, sample_failure_stats])
+
+        assert scheduler.metrics.total_runs == 2
+        assert scheduler.metrics.successful_runs == 1
+        assert scheduler.metrics.failed_runs == 1
+        assert scheduler.metrics.anomalies_detected == 1
+        assert scheduler.metrics.narratives_validated == 1
+        assert scheduler.metrics.symbol_stats["BTC-USD"].successful_runs == 1
+        assert scheduler.metrics.symbol_stats["ETH-USD"].failed_runs == 1
+        assert scheduler.metrics.symbol_stats["ETH-USD"].last_error == "API timeout"
+
 
 class TestHandleError:
     """Tests for _handle_error method."""
@@ -233,17 +248,17 @@ class TestStorePricesCycle:
 
     @pytest.mark.asyncio
     async def test_store_prices_success(self, scheduler):
-        """Test price storage cycle succeeds."""
+        """Test price storage cycle writes all prices in one bulk call."""
         mock_price_data = [
-            Mock(symbol="BTC-USD"),
-            Mock(symbol="ETH-USD"),
-            Mock(symbol="SOL-USD"),
+            Mock(symbol="BTC-USD", timestamp=datetime(2024, 1, 15, 14, 0)),
+            Mock(symbol="ETH-USD", timestamp=datetime(2024, 1, 15, 14, 0)),
+            Mock(symbol="SOL-USD", timestamp=datetime(2024, 1, 15, 14, 0)),
         ]
 
         scheduler.pipeline.crypto_client.get_prices = AsyncMock(
             return_value=mock_price_data
         )
-        scheduler.pipeline.crypto_client.store_price = AsyncMock()
+        scheduler.pipeline.crypto_client.store_prices_bulk = AsyncMock(return_value=3)
 
         with patch("src.orchestration.scheduler.get_db_context") as mock_db_context:
             mock_session = MagicMock()
@@ -256,24 +271,25 @@ class TestStorePricesCycle:
                 ["BTC-USD", "ETH-USD", "SOL-USD"]
             )
 
-            # Verify store_price called for each symbol
-            assert scheduler.pipeline.crypto_client.store_price.call_count == 3
+            # Verify one bulk write for the whole cycle
+            scheduler.pipeline.crypto_client.store_prices_bulk.assert_awaited_once_with(
+                mock_price_data, mock_session
+            )
+            assert set(scheduler._last_price_at) == {"BTC-USD", "ETH-USD", "SOL-USD"}
 
     @pytest.mark.asyncio
-    async def test_store_prices_partial_failure(self, scheduler):
-        """Test price storage continues even if some symbols fail."""
+    async def test_store_prices_failure(self, scheduler):
+        """Test a failed write is logged and does not mark prices as stored."""
         mock_price_data = [
-            Mock(symbol="BTC-USD"),
-            Mock(symbol="ETH-USD"),
+            Mock(symbol="BTC-USD", timestamp=datetime(2024, 1, 15, 14, 0)),
+            Mock(symbol="ETH-USD", timestamp=datetime(2024, 1, 15, 14, 0)),
         ]
 
         scheduler.pipeline.crypto_client.get_prices = AsyncMock(
             return_value=mock_price_data
         )
-
-        # First call succeeds, second fails
-        scheduler.pipeline.crypto_client.store_price = AsyncMock(
-            side_effect=[None, Exception("DB error")]
+        scheduler.pipeline.crypto_client.store_prices_bulk = AsyncMock(
+            side_effect=Exception("DB error")
         )
 
         with patch("src.orchestration.scheduler.get_db_context") as mock_db_context:
@@ -283,8 +299,7 @@ class TestStorePricesCycle:
             # Should not raise exception
             await scheduler._store_prices_cycle()
 
-            # Verify both store attempts made
-            assert scheduler.pipeline.crypto_client.store_price.call_count == 2
+            assert scheduler._last_price_at == {}
 
 
 class TestRunDetectionCycle:
@@ -344,6 +359,92 @@ class TestRunDetectionCycle:
             # Verify failure tracked
             assert scheduler.metrics.failed_runs > 0
 
+    @pytest.mark.asyncio
+    async def test_detection_cycle_skips_symbols_without_new_prices(
+        self, scheduler, sample_success_stats
+    ):
+        """Test symbols are skipped until a newer price is stored."""
+        scheduler._last_price_at = {
+            "BTC-USD": datetime(2024, 1, 15, 14, 0),
+            "ETH-USD": datetime(2024, 1, 15, 14, 0),
+        }
+        scheduler.pipeline.run_for_symbol = AsyncMock(
+            return_value=(Mock(), sample_success_stats)
+        )
+
+        with patch("src.orchestration.scheduler.get_db_context") as mock_db_context:
+            mock_db_context.return_value.__enter__.return_value = MagicMock()
+
+            await scheduler._run_detection_cycle()
+            assert scheduler.pipeline.run_for_symbol.call_count == 3
+
+            # No new prices: only SOL-USD (never stored) runs again
+            await scheduler._run_detection_cycle()
+            assert scheduler.pipeline.run_for_symbol.call_count == 4
+
+            # New BTC price stored: BTC-USD runs again
+            scheduler._last_price_at["BTC-USD"] = datetime(2024, 1, 15, 14, 1)
+            await scheduler._run_detection_cycle()
+            assert scheduler.pipeline.run_for_symbol.call_count == 6
+
+    @pytest.mark.asyncio
+    async def test_detection_cycle_retries_failed_symbols(
+        self, scheduler, sample_success_stats, sample_failure_stats
+    ):
+        """Test symbols that failed are retried on the same prices."""
+        scheduler._last_price_at = dict.fromkeys(scheduler.symbols, datetime(2024, 1, 15, 14, 0))
+        scheduler.pipeline.run_for_symbol = AsyncMock(
+            side_effect=[
+                (Mock(), sample_success_stats),
+                (Mock(), sample_failure_stats),
+                Exception("Pipeline error"),
+                (Mock(), sample_success_stats),
+                (Mock(), sample_success_stats),
+            ]
+        )
+
+        with patch("src.orchestration.scheduler.get_db_context") as mock_db_context:
+            mock_db_context.return_value.__enter__.return_value = MagicMock()
+
+            await scheduler._run_detection_cycle()
+            await scheduler._run_detection_cycle()
+
+        retried = [call.args[0] for call in scheduler.pipeline.run_for_symbol.call_args_list[3:]]
+        assert retried == ["ETH-USD", "SOL-USD"]
+
+    @pytest.mark.asyncio
+    async def test_detection_cycle_retries_after_rollback(self, scheduler, sample_success_stats):
+        """Test a cycle whose commit fails is rerun for every symbol."""
+        scheduler._last_price_at = dict.fromkeys(scheduler.symbols, datetime(2024, 1, 15, 14, 0))
+        scheduler.pipeline.run_for_symbol = AsyncMock(
+            return_value=(Mock(), sample_success_stats)
+        )
+
+        with patch("src.orchestration.scheduler.get_db_context") as mock_db_context:
+            mock_db_context.return_value.__enter__.return_value = MagicMock()
+            mock_db_context.return_value.__exit__.side_effect = [
+                Exception("commit failed"),
+                False,
+            ]
+
+            await scheduler._run_detection_cycle()
+            await scheduler._run_detection_cycle()
+
+        assert scheduler.pipeline.run_for_symbol.call_count == 6
+
+    @pytest.mark.asyncio
+    async def test_skipped_detection_cycle_updates_last_run_time(self, scheduler):
+        """Test a cycle with nothing to run still counts as a completed run."""
+        price_time = datetime(2024, 1, 15, 14, 0)
+        scheduler._last_price_at = dict.fromkeys(scheduler.symbols, price_time)
+        scheduler._last_detected_at = dict.fromkeys(scheduler.symbols, price_time)
+        scheduler.pipeline.run_for_symbol = AsyncMock()
+
+        await scheduler._run_detection_cycle()
+
+        scheduler.pipeline.run_for_symbol.assert_not_called()
+        assert scheduler.metrics.last_run_time is not None
+
 
 class TestSchedulerMetrics:
     """Tests for SchedulerMetrics and SymbolMetrics dataclasses."""
@@ -3,6 +3,7 @@
 import os
 import uuid
 from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
@@ -15,6 +16,7 @@ os.environ["NEWS__CRYPTOPANIC_API_KEY"] = "test_crypto_key"
 os.environ["NEWS__REDDIT_CLIENT_ID"] = "test_reddit_id"
 os.environ["NEWS__REDDIT_CLIENT_SECRET"] = "test_reddit_secret"
 
+from config.settings import settings
 from src.database.models import Base, NewsArticle, NewsCluster
 from src.phase1_detector.clustering import NewsClusterer
 from src.phase1_detector.news_aggregation.models import NewsArticle as NewsArticlePydantic
@@ -122,6 +124,31 @@ class TestNewsClusterer:
         assert clusterer.embedding_model is not None
         assert clusterer.session is None
 
+    def test_initialization_defaults_to_torch_on_cpu(self):
+        """Test that the CPU default is the PyTorch model, not INT8 ONNX."""
+        module = "src.phase1_detector.clustering.clustering"
+        with patch(f"{module}.torch.cuda.is_available", return_value=False), \
+             patch(f"{module}.SentenceTransformer") as model_cls:
+            NewsClusterer()
+
+        assert settings.clustering.embedding_cpu_backend == "torch"
+        model_cls.assert_called_once()
+        assert "backend" not in model_cls.call_args.kwargs
+
+    def test_initialization_falls_back_to_torch(self):
+        """Test that a failed ONNX INT8 load falls back to the PyTorch model."""
+        module = "src.phase1_detector.clustering.clustering"
+        torch_model = MagicMock()
+        with patch(f"{module}.torch.cuda.is_available", return_value=False), \
+             patch.object(settings.clustering, "embedding_cpu_backend", "onnx_int8"), \
+             patch(f"{module}.SentenceTransformer") as model_cls:
+            model_cls.side_effect = [RuntimeError("onnxruntime not installed"), torch_model]
+            clusterer = NewsClusterer()
+
+        assert model_cls.call_args_list[0].kwargs["backend"] == "onnx"
+        assert "backend" not in model_cls.call_args_list[1].kwargs
+        assert clusterer.embedding_model is torch_model
+
     def test_initialization_with_session(self, in_memory_db):
         """Test NewsClusterer initialization with database session."""
         clusterer = NewsClusterer(session=in_memory_db)
@@ -137,6 +164,33 @@ class TestNewsClusterer:
         assert embeddings.shape[1] > 0  # Embedding dimension > 0
         assert embeddings.dtype == np.float32
 
+    def test_generate_embeddings_reuses_cache(self, sample_articles):
+        """Test that previously seen texts are not re-encoded."""
+        clusterer = NewsClusterer()
+        _, first = clusterer.generate_embeddings(sample_articles)
+
+        with patch.object(
+            clusterer.embedding_model, "encode", wraps=clusterer.embedding_model.encode
+        ) as encode:
+            _, second = clusterer.generate_embeddings(sample_articles)
+
+        encode.assert_not_called()
+        np.testing.assert_array_equal(first, second)
+
+    def test_generate_embeddings_encodes_duplicates_once(self, sample_articles):
+        """Test that duplicate texts in one batch are encoded once."""
+        clusterer = NewsClusterer()
+        articles = sample_articles[:2] + sample_articles[:2]
+
+        with patch.object(
+            clusterer.embedding_model, "encode", wraps=clusterer.embedding_model.encode
+        ) as encode:
+            _, embeddings = clusterer.generate_embeddings(articles)
+
+        assert len(encode.call_args.args[0]) == 2
+        assert embeddings.shape[0] == 4
+        np.testing.assert_array_equal(embeddings[:2], embeddings[2:])
+
     def test_generate_embeddings_empty(self):
         """Test embedding generation with empty input."""
         clusterer = NewsClusterer()
@@ -1,16 +1,32 @@
 """Unit tests for data ingestion clients."""
 
+import asyncio
+import contextlib
+import inspect
+import json
 import pytest
 from datetime import datetime, timedelta, UTC
 from unittest.mock import AsyncMock, Mock, patch
+import aiohttp
 import httpx
+from pydantic import ValidationError
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
 
+from src.database.models import Base, Price
 from src.phase1_detector.data_ingestion import (
     CoinbaseClient,
     BinanceClient,
     PriceData,
     TickerData,
 )
+from src.phase1_detector.data_ingestion.crypto_client import (
+    _PRICE_COLUMNS,
+    CryptoClient,
+)
+from src.phase1_detector.data_ingestion.kline_cache import KlineCache
+from src.phase1_detector.data_ingestion.rate_limiter import RateLimiter
+from src.utils.http import parse_json
 
 
 @pytest.fixture
@@ -75,6 +91,37 @@ class TestTickerData:
         assert price_data.source == "coinbase"
         assert price_data.timestamp == datetime(2024, 1, 11, 12, 0, 0)
 
+    def test_price_data_is_immutable(self):
+        """Cached prices are shared, so PriceData cannot be modified."""
+        price = PriceData(
+            symbol="BTC-USD",
+            timestamp=datetime(2024, 1, 11, 12, 0, 0, tzinfo=UTC),
+            price=45000.0,
+            source="coinbase",
+        )
+
+        with pytest.raises(ValidationError):
+            price.price = 1.0
+
+    def test_to_price_data_uses_batch_time(self):
+        """A ticker without a timestamp takes the supplied fetch time."""
+        now = datetime(2024, 1, 11, 12, 0, 0, tzinfo=UTC)
+        tickers = [TickerData(symbol=s, price=1.0) for s in ("BTC-USD", "ETH-USD")]
+
+        prices = [t.to_price_data(source="coinbase", now=now) for t in tickers]
+
+        assert [p.timestamp for p in prices] == [now, now]
+
+
+class TestParseJson:
+    """Test response body decoding."""
+
+    def test_parses_response_bytes(self):
+        """Should decode the raw body regardless of the JSON backend."""
+        response = httpx.Response(200, content=b'[[1700000000000, "45000.5", 12]]')
+
+        assert parse_json(response) == [[1700000000000, "45000.5", 12]]
+
 
 class TestCoinbaseClient:
     """Tests for CoinbaseClient."""
@@ -92,12 +139,14 @@ class TestCoinbaseClient:
             # Mock ticker response
             ticker_response = Mock()
             ticker_response.json.return_value = mock_coinbase_ticker_response
-            ticker_response.raise_for_status = Mock()
+            ticker_response.content = json.dumps(mock_coinbase_ticker_response).encode()
+            ticker_response.status_code = 200
 
             # Mock stats response
             stats_response = Mock()
             stats_response.json.return_value = mock_coinbase_stats_response
-            stats_response.raise_for_status = Mock()
+            stats_response.content = json.dumps(mock_coinbase_stats_response).encode()
+            stats_response.status_code = 200
 
             # Configure get to return different responses
             mock_client.get.side_effect = [ticker_response, stats_response]
@@ -121,9 +170,7 @@ class TestCoinbaseClient:
             # Mock 404 response
             mock_response = Mock()
             mock_response.status_code = 404
-            mock_client.get.side_effect = httpx.HTTPStatusError(
-                "Not found", request=Mock(), response=mock_response
-            )
+            mock_client.get.return_value = mock_response
 
             client = CoinbaseClient()
 
@@ -142,17 +189,23 @@ class TestCoinbaseClient:
             # Mock responses
             ticker_response = Mock()
             ticker_response.json.return_value = mock_coinbase_ticker_response
-            ticker_response.raise_for_status = Mock()
-
-            stats_response = Mock()
-            stats_response.json.return_value = mock_coinbase_stats_response
-            stats_response.raise_for_status = Mock()
+            ticker_response.content = json.dumps(mock_coinbase_ticker_response).encode()
+            ticker_response.status_code = 200
+
+            # One batched stats response covers every product
+            all_stats_response = Mock()
+            all_stats = {
+                "BTC-USD": {"stats_24hour": mock_coinbase_stats_response},
+                "ETH-USD": {"stats_24hour": mock_coinbase_stats_response},
+            }
+            all_stats_response.json.return_value = all_stats
+            all_stats_response.content = json.dumps(all_stats).encode()
+            all_stats_response.status_code = 200
 
             mock_client.get.side_effect = [
+                all_stats_response,
                 ticker_response,
-                stats_response,
                 ticker_response,
-                stats_response,
             ]
 
             client = CoinbaseClient()
@@ -160,6 +213,40 @@ class TestCoinbaseClient:
 
             assert len(prices) == 2
             assert all(isinstance(p, PriceData) for p in prices)
+            assert all(p.volume_24h == 1500000000.0 for p in prices)
+            assert prices[0].timestamp == prices[1].timestamp
+            assert mock_client.get.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_get_prices_falls_back_to_per_symbol_stats(
+        self, mock_coinbase_ticker_response, mock_coinbase_stats_response
+    ):
+        """Test per-symbol stats are fetched when the batched stats request fails."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            ticker_response = Mock()
+            ticker_response.json.return_value = mock_coinbase_ticker_response
+            ticker_response.content = json.dumps(mock_coinbase_ticker_response).encode()
+            ticker_response.status_code = 200
+
+            stats_response = Mock()
+            stats_response.json.return_value = mock_coinbase_stats_response
+            stats_response.content = json.dumps(mock_coinbase_stats_response).encode()
+            stats_response.status_code = 200
+
+            mock_client.get.side_effect = [
+                httpx.ConnectError("Connection refused"),
+                ticker_response,
+                stats_response,
+            ]
+
+            client = CoinbaseClient()
+            prices = await client.get_prices(["BTC-USD"])
+
+            assert len(prices) == 1
+            assert prices[0].volume_24h == 1500000000.0
 
     @pytest.mark.asyncio
     async def test_health_check_success(self):
@@ -222,7 +309,8 @@ class TestBinanceClient:
 
             mock_response = Mock()
             mock_response.json.return_value = mock_binance_ticker_response
-            mock_response.raise_for_status = Mock()
+            mock_response.content = json.dumps(mock_binance_ticker_response).encode()
+            mock_response.status_code = 200
             mock_client.get.return_value = mock_response
 
             client = BinanceClient()
@@ -233,6 +321,152 @@ class TestBinanceClient:
             assert price_data.volume_24h == 1500000000.0
             assert price_data.source == "binance"
 
+    @pytest.mark.asyncio
+    async def test_get_price_reuses_cached_price(self, mock_binance_ticker_response):
+        """Concurrent and repeated lookups within the TTL share one request."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            mock_response = Mock()
+            mock_response.json.return_value = mock_binance_ticker_response
+            mock_response.content = json.dumps(mock_binance_ticker_response).encode()
+            mock_response.status_code = 200
+            mock_client.get.return_value = mock_response
+
+            client = BinanceClient(price_cache_ttl=60.0)
+            first, second = await asyncio.gather(
+                client.get_price("BTC-USD"), client.get_price("BTC-USD")
+            )
+            third = await client.get_price("BTC-USD")
+
+            assert first is second is third
+            assert mock_client.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_price_is_single_flight(
+        self, mock_binance_ticker_response
+    ):
+        """Concurrent lookups share one in-flight request even without a cache."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            mock_response = Mock()
+            mock_response.json.return_value = mock_binance_ticker_response
+            mock_response.content = json.dumps(mock_binance_ticker_response).encode()
+            mock_response.status_code = 200
+            mock_client.get.return_value = mock_response
+
+            client = BinanceClient(price_cache_ttl=0)
+            prices = await asyncio.gather(*[client.get_price("BTC-USD") for _ in range(5)])
+
+            assert all(price is prices[0] for price in prices)
+            assert mock_client.get.call_count == 1
+            assert client._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_get_price_bounds_concurrent_requests(
+        self, mock_binance_ticker_response
+    ):
+        """No more than MAX_CONCURRENT_REQUESTS fetches run at once."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            active = 0
+            peak = 0
+
+            async def get_ticker(url, params):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.001)
+                active -= 1
+                response = Mock()
+                response.json.return_value = mock_binance_ticker_response
+                response.content = json.dumps(mock_binance_ticker_response).encode()
+                response.status_code = 200
+                return response
+
+            mock_client.get.side_effect = get_ticker
+
+            client = BinanceClient()
+            symbols = [f"COIN{i}-USD" for i in range(50)]
+            prices = await asyncio.gather(*[client.get_price(s) for s in symbols])
+
+            assert len(prices) == 50
+            assert peak == BinanceClient.MAX_CONCURRENT_REQUESTS
+
+    @pytest.mark.asyncio
+    async def test_get_price_cache_disabled(self, mock_binance_ticker_response):
+        """A zero TTL fetches on every call."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            mock_response = Mock()
+            mock_response.json.return_value = mock_binance_ticker_response
+            mock_response.content = json.dumps(mock_binance_ticker_response).encode()
+            mock_response.status_code = 200
+            mock_client.get.return_value = mock_response
+
+            client = BinanceClient(price_cache_ttl=0)
+            await client.get_price("BTC-USD")
+            await client.get_price("BTC-USD")
+
+            assert mock_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_prices_batches_symbols(self, mock_binance_ticker_response):
+        """All uncached symbols are fetched with one symbols=[...] request."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            eth_ticker = {**mock_binance_ticker_response, "symbol": "ETHUSDT"}
+            mock_response = Mock()
+            mock_response.content = json.dumps(
+                [mock_binance_ticker_response, eth_ticker]
+            ).encode()
+            mock_response.status_code = 200
+            mock_client.get.return_value = mock_response
+
+            client = BinanceClient()
+            prices = await client.get_prices(["BTC-USD", "ETH-USD"])
+
+            assert [p.symbol for p in prices] == ["BTC-USD", "ETH-USD"]
+            assert prices[0].timestamp == prices[1].timestamp
+            mock_client.get.assert_awaited_once()
+            params = mock_client.get.call_args.kwargs["params"]
+            assert params == {"symbols": '["BTCUSDT","ETHUSDT"]'}
+
+    @pytest.mark.asyncio
+    async def test_get_prices_falls_back_per_symbol(self, mock_binance_ticker_response):
+        """A rejected batch is retried per symbol, skipping the bad one."""
+        with patch("httpx.AsyncClient") as mock_client_class:
+            mock_client = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            bad_request = Mock()
+            bad_request.status_code = 400
+            ticker_response = Mock()
+            ticker_response.content = json.dumps(mock_binance_ticker_response).encode()
+            ticker_response.status_code = 200
+
+            async def get(url, params):
+                if "symbols" in params or params["symbol"] == "INVALIDUSDT":
+                    return bad_request
+                return ticker_response
+
+            mock_client.get.side_effect = get
+
+            client = BinanceClient()
+            prices = await client.get_prices(["BTC-USD", "INVALID-USD"])
+
+            assert [p.symbol for p in prices] == ["BTC-USD"]
+            assert mock_client.get.call_count == 3
+
     @pytest.mark.asyncio
     async def test_get_price_invalid_symbol(self):
         """Test error handling for invalid symbol."""
@@ -242,9 +476,7 @@ class TestBinanceClient:
 
             mock_response = Mock()
             mock_response.status_code = 400
-            mock_client.get.side_effect = httpx.HTTPStatusError(
-                "Bad request", request=Mock(), response=mock_response
-            )
+            mock_client.get.return_value = mock_response
 
             client = BinanceClient()
 
@@ -267,103 +499,299 @@ class TestBinanceClient:
 
             assert is_healthy is True
 
+    @pytest.mark.asyncio
+    async def test_shared_http_client_is_not_closed(self, mock_binance_ticker_response):
+        """An injected client is used for requests and left open on close()."""
+        shared = AsyncMock()
+        mock_response = Mock()
+        mock_response.content = json.dumps(mock_binance_ticker_response).encode()
+        mock_response.status_code = 200
+        shared.get.return_value = mock_response
+
+        binance = BinanceClient(http_client=shared)
+        coinbase = CoinbaseClient(http_client=shared)
+        await binance.get_price("BTC-USD")
+        await binance.close()
+        await coinbase.close()
+
+        assert binance._client is coinbase._client is shared
+        shared.get.assert_awaited_once()
+        shared.aclose.assert_not_awaited()
+
     def test_source_name(self):
         """Test source_name property."""
         client = BinanceClient()
         assert client.source_name == "binance"
 
 
+class FakeBackfillSession:
+    """Stand-in for the aiohttp session used by historical fetches."""
+
+    closed = False
+
+    def __init__(self, handler, status: int = 200, failures=(), headers=None):
+        self.handler = handler
+        self.status = status
+        self.failures = list(failures)  # Statuses returned before the normal one
+        self.headers = headers or {}
+        self.calls = []
+
+    @contextlib.asynccontextmanager
+    async def get(self, url, params=None):
+        self.calls.append(params)
+        payload = self.handler(params)
+        if inspect.isawaitable(payload):
+            payload = await payload
+
+        status = self.failures.pop(0) if self.failures else self.status
+        response = Mock()
+        response.status = status
+        response.headers = self.headers
+        response.raise_for_status = Mock()
+        if status >= 400:
+            response.raise_for_status.side_effect = aiohttp.ClientResponseError(
+                request_info=Mock(), history=(), status=status
+            )
+        response.read = AsyncMock(return_value=json.dumps(payload).encode())
+        yield response
+
+    async def close(self):
+        self.closed = True
+
+
 class TestHistoricalDataFetching:
     """Tests for get_historical_prices methods."""
 
     @pytest.mark.asyncio
     async def test_coinbase_historical_fetch(self):
         """Test Coinbase historical data fetching with pagination."""
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value = mock_client
+        # Mock candle responses (format: [time, low, high, open, close, volume])
+        mock_candles = [
+            [1704974400, 44000.0, 46000.0, 45000.0, 45500.0, 1500000000.0],
+            [1704974460, 44500.0, 46500.0, 45500.0, 46000.0, 1600000000.0],
+        ]
 
-            # Mock candle responses (format: [time, low, high, open, close, volume])
-            mock_candles = [
-                [1704974400, 44000.0, 46000.0, 45000.0, 45500.0, 1500000000.0],
-                [1704974460, 44500.0, 46500.0, 45500.0, 46000.0, 1600000000.0],
-            ]
+        client = CoinbaseClient()
+        client._backfill_session = FakeBackfillSession(lambda params: mock_candles)
 
-            mock_response = Mock()
-            mock_response.json.return_value = mock_candles
-            mock_response.raise_for_status = Mock()
-            mock_client.get.return_value = mock_response
+        start = datetime(2024, 1, 11, 0, 0, 0, tzinfo=UTC)
+        end = datetime(2024, 1, 11, 1, 0, 0, tzinfo=UTC)
 
-            client = CoinbaseClient()
+        prices = await client.get_historical_prices(
+            symbol="BTC-USD",
+            start_time=start,
+            end_time=end,
+            granularity_seconds=60,
+        )
 
-            start = datetime(2024, 1, 11, 0, 0, 0, tzinfo=UTC)
-            end = datetime(2024, 1, 11, 1, 0, 0, tzinfo=UTC)
+        assert len(prices) == 2
+        assert all(isinstance(p, PriceData) for p in prices)
+        assert prices[0].symbol == "BTC-USD"
+        assert prices[0].source == "coinbase"
+        assert prices[0].price == 45500.0
+        assert prices[0].timestamp == datetime(2024, 1, 11, 12, 0, 0, tzinfo=UTC)
+        assert prices[0].high_24h == 46000.0
+        assert prices[0].low_24h == 44000.0
 
+    @pytest.mark.asyncio
+    async def test_coinbase_historical_unknown_symbol(self):
+        """A 404 from the candles endpoint means the symbol does not exist."""
+        client = CoinbaseClient()
+        client._backfill_session = FakeBackfillSession(lambda params: {}, status=404)
+
+        start = datetime(2024, 1, 11, 0, 0, 0, tzinfo=UTC)
+
+        with pytest.raises(ValueError, match="not found"):
+            await client.get_historical_prices(
+                symbol="INVALID-USD",
+                start_time=start,
+                end_time=start + timedelta(hours=1),
+            )
+
+        assert len(client._backfill_session.calls) == 1  # Not retried
+
+    @pytest.mark.asyncio
+    async def test_historical_retries_rate_limited_page(self):
+        """A 429 is retried after the Retry-After delay."""
+        mock_klines = [[1704974400000, "45000", "46000", "44000", "45500", "1500", 0]]
+        client = BinanceClient()
+        session = FakeBackfillSession(
+            lambda params: mock_klines, failures=[429, 503], headers={"Retry-After": "3"}
+        )
+        client._backfill_session = session
+
+        start = datetime(2024, 1, 11, 0, 0, 0, tzinfo=UTC)
+
+        with patch("asyncio.sleep", new=AsyncMock()) as sleep:
             prices = await client.get_historical_prices(
                 symbol="BTC-USD",
                 start_time=start,
-                end_time=end,
-                granularity_seconds=60,
+                end_time=start + timedelta(hours=1),
             )
 
-            assert len(prices) == 2
-            assert all(isinstance(p, PriceData) for p in prices)
-            assert prices[0].symbol == "BTC-USD"
-            assert prices[0].source == "coinbase"
-            assert prices[0].price == 45500.0
+        assert len(prices) == 1
+        assert len(session.calls) == 3
+        assert [call.args[0] for call in sleep.await_args_list] == [3.0, 3.0]
+
+    @pytest.mark.asyncio
+    async def test_historical_gives_up_after_max_attempts(self):
+        """Persistent 503s back off exponentially, then fail the fetch."""
+        client = CoinbaseClient()
+        session = FakeBackfillSession(lambda params: [], status=503)
+        client._backfill_session = session
+
+        start = datetime(2024, 1, 11, 0, 0, 0, tzinfo=UTC)
+
+        with patch("asyncio.sleep", new=AsyncMock()) as sleep:
+            with pytest.raises(ConnectionError):
+                await client.get_historical_prices(
+                    symbol="BTC-USD",
+                    start_time=start,
+                    end_time=start + timedelta(hours=1),
+                )
+
+        assert len(session.calls) == client.MAX_WINDOW_ATTEMPTS
+        assert [call.args[0] for call in sleep.await_args_list] == [0.5, 1.0, 2.0, 4.0]
 
     @pytest.mark.asyncio
     async def test_binance_historical_fetch(self):
         """Test Binance historical data fetching with pagination."""
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value = mock_client
+        # Mock kline responses
+        # [Open time, Open, High, Low, Close, Volume, Close time, ...]
+        mock_klines = [
+            [
+                1704974400000,
+                "45000.0",
+                "46000.0",
+                "44000.0",
+                "45500.0",
+                "1500000000.0",
+                1704974459999,
+            ],
+            [
+                1704974460000,
+                "45500.0",
+                "46500.0",
+                "44500.0",
+                "46000.0",
+                "1600000000.0",
+                1704974519999,
+            ],
+        ]
 
-            # Mock kline responses
-            # [Open time, Open, High, Low, Close, Volume, Close time, ...]
-            mock_klines = [
-                [
-                    1704974400000,
-                    "45000.0",
-                    "46000.0",
-                    "44000.0",
-                    "45500.0",
-                    "1500000000.0",
-                    1704974459999,
-                ],
-                [
-                    1704974460000,
-                    "45500.0",
-                    "46500.0",
-                    "44500.0",
-                    "46000.0",
-                    "1600000000.0",
-                    1704974519999,
-                ],
-            ]
+        client = BinanceClient()
+        client._backfill_session = FakeBackfillSession(lambda params: mock_klines)
 
-            mock_response = Mock()
-            mock_response.json.return_value = mock_klines
-            mock_response.raise_for_status = Mock()
-            mock_client.get.return_value = mock_response
+        start = datetime(2024, 1, 11, 0, 0, 0, tzinfo=UTC)
+        end = datetime(2024, 1, 11, 1, 0, 0, tzinfo=UTC)
 
-            client = BinanceClient()
+        prices = await client.get_historical_prices(
+            symbol="BTC-USD",
+            start_time=start,
+            end_time=end,
+            granularity_seconds=60,
+        )
 
-            start = datetime(2024, 1, 11, 0, 0, 0, tzinfo=UTC)
-            end = datetime(2024, 1, 11, 1, 0, 0, tzinfo=UTC)
+        assert len(prices) == 2
+        assert all(isinstance(p, PriceData) for p in prices)
+        assert prices[0].symbol == "BTC-USD"
+        assert prices[0].source == "binance"
+        assert prices[0].price == 45500.0
+        assert prices[0].timestamp == datetime(2024, 1, 11, 12, 0, 0, tzinfo=UTC)
+        assert prices[1].timestamp == datetime(2024, 1, 11, 12, 1, 0, tzinfo=UTC)
+        assert prices[1].volume_24h == 1600000000.0
+        assert prices[1].high_24h == 46500.0
+        assert prices[1].low_24h == 44500.0
+
+    def test_split_windows_covers_range(self):
+        """Windows are contiguous and the last one is clipped to end_time."""
+        start = datetime(2024, 1, 11, 0, 0, 0, tzinfo=UTC)
+        end = start + timedelta(minutes=25)
 
-            prices = await client.get_historical_prices(
-                symbol="BTC-USD",
-                start_time=start,
-                end_time=end,
-                granularity_seconds=60,
-            )
+        windows = CryptoClient._split_windows(start, end, window_seconds=600)
 
-            assert len(prices) == 2
-            assert all(isinstance(p, PriceData) for p in prices)
-            assert prices[0].symbol == "BTC-USD"
-            assert prices[0].source == "binance"
-            assert prices[0].price == 45500.0
+        assert windows == [
+            (start, start + timedelta(minutes=10)),
+            (start + timedelta(minutes=10), start + timedelta(minutes=20)),
+            (start + timedelta(minutes=20), end),
+        ]
+
+    def test_split_windows_aligns_to_boundaries(self):
+        """An unaligned start gets a short first window, then aligned ones."""
+        start = datetime(2024, 1, 11, 0, 3, 0, tzinfo=UTC)
+        end = datetime(2024, 1, 11, 0, 25, 0, tzinfo=UTC)
+
+        windows = CryptoClient._split_windows(start, end, window_seconds=600)
+
+        assert [(s.minute, e.minute) for s, e in windows] == [(3, 10), (10, 20), (20, 25)]
+
+    @pytest.mark.asyncio
+    async def test_closed_windows_are_served_from_kline_cache(self, tmp_path):
+        """A repeated backfill reuses full, closed windows from disk."""
+        cache = KlineCache(tmp_path / "klines.sqlite")
+        start = datetime(2024, 1, 10, 22, 0, 0, tzinfo=UTC)  # On a 300-minute boundary
+        end = start + timedelta(minutes=450)  # One full window, one partial
+
+        def page(params):
+            return [[int(datetime.fromisoformat(params["start"]).timestamp()), 1, 1, 1, 1, 1]]
+
+        first = CoinbaseClient(kline_cache=cache)
+        first._backfill_session = FakeBackfillSession(page)
+        expected = await first.get_historical_prices("BTC-USD", start, end)
+
+        second = CoinbaseClient(kline_cache=cache)
+        session = FakeBackfillSession(page)
+        second._backfill_session = session
+        prices = await second.get_historical_prices("BTC-USD", start, end)
+
+        assert prices == expected
+        # Only the partial trailing window is downloaded again
+        assert [call["start"] for call in session.calls] == [
+            (start + timedelta(minutes=300)).isoformat()
+        ]
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_binance_multi_window_fetch_keeps_order(self):
+        """Concurrently fetched windows are returned in chronological order."""
+        start = datetime(2024, 1, 11, 8, 0, 0, tzinfo=UTC)  # On a 1000-minute boundary
+        end = start + timedelta(minutes=2500)  # 3 windows of up to 1000 klines
+        start_ms = int(start.timestamp() * 1000)
+
+        async def get_window(params):
+            # Finish later windows first to check the result order
+            await asyncio.sleep(0.01 if params["startTime"] == start_ms else 0)
+            return [[params["startTime"], "1.0", "1.0", "1.0", "1.0", "1.0"]]
+
+        client = BinanceClient()
+        session = FakeBackfillSession(get_window)
+        client._backfill_session = session
+
+        prices = await client.get_historical_prices(
+            symbol="BTC-USD",
+            start_time=start,
+            end_time=end,
+            granularity_seconds=60,
+        )
+
+        assert len(session.calls) == 3
+        assert [p.timestamp for p in prices] == [
+            start,
+            start + timedelta(minutes=1000),
+            start + timedelta(minutes=2000),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_close_releases_backfill_session(self):
+        """Closing the client also closes the backfill session."""
+        client = BinanceClient()
+        session = FakeBackfillSession(lambda params: [])
+        client._backfill_session = session
+
+        await client.close()
+
+        assert session.closed
+        assert client._backfill_session is None
 
     @pytest.mark.asyncio
     async def test_invalid_granularity_coinbase(self):
@@ -398,6 +826,37 @@ class TestHistoricalDataFetching:
             )
 
 
+class TestRateLimiter:
+    """Tests for the token-bucket rate limiter."""
+
+    @pytest.mark.asyncio
+    async def test_allows_burst_up_to_max_rate(self):
+        """The first max_rate acquisitions do not wait."""
+        limiter = RateLimiter(5, 1.0)
+        loop = asyncio.get_running_loop()
+
+        started = loop.time()
+        for _ in range(5):
+            async with limiter:
+                pass
+
+        assert loop.time() - started < 0.05
+
+    @pytest.mark.asyncio
+    async def test_waits_for_refill_when_exhausted(self):
+        """Acquisitions beyond the burst are paced at the refill rate."""
+        limiter = RateLimiter(10, 0.1)  # One token every 10ms
+        loop = asyncio.get_running_loop()
+
+        for _ in range(10):
+            await limiter.acquire()
+
+        started = loop.time()
+        await asyncio.gather(*[limiter.acquire() for _ in range(3)])
+
+        assert loop.time() - started >= 0.025
+
+
 class TestBulkStorage:
     """Tests for store_prices_bulk method."""
 
@@ -431,7 +890,7 @@ class TestBulkStorage:
 
         assert inserted == 100
         assert mock_session.execute.called
-        assert mock_session.commit.called
+        assert not mock_session.commit.called  # Caller owns the transaction
 
     @pytest.mark.asyncio
     async def test_bulk_insert_batching(self):
@@ -461,8 +920,92 @@ class TestBulkStorage:
         client = CoinbaseClient()
         await client.store_prices_bulk(prices, mock_session, batch_size=1000)
 
-        # Should be called twice (once per batch)
-        assert mock_session.execute.call_count == 2
+        # synchronous_commit, then once per batch
+        assert mock_session.execute.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_binds_one_array_per_column(self):
+        """Each batch is sent as column arrays for the unnest() insert."""
+        mock_session = Mock()
+        mock_session.execute.return_value = Mock(rowcount=2)
+        base_time = datetime(2024, 1, 11, 12, 0, 0, tzinfo=UTC)
+        prices = [
+            PriceData(symbol="BTC-USD", timestamp=base_time, price=45000.0, source="coinbase"),
+            PriceData(
+                symbol="ETH-USD", timestamp=base_time, price=2500.0, bid=2499.5, source="coinbase"
+            ),
+        ]
+
+        client = CoinbaseClient()
+        await client.store_prices_bulk(prices, mock_session)
+
+        (set_stmt,), _ = mock_session.execute.call_args_list[0]
+        stmt, params = mock_session.execute.call_args.args
+        assert str(set_stmt) == "SET LOCAL synchronous_commit = off"
+        assert "unnest(" in str(stmt)
+        assert "created_at" not in params  # Stamped by the server default
+        assert params["symbol"] == ["BTC-USD", "ETH-USD"]
+        assert params["timestamp"] == [base_time, base_time]
+        assert params["price"] == [45000.0, 2500.0]
+        assert params["bid"] == [None, 2499.5]
+
+    def test_price_columns_follow_model_fields(self):
+        """Rows are read in field order, so the column list must match it."""
+        assert _PRICE_COLUMNS == tuple(PriceData.model_fields)
+
+    @pytest.mark.asyncio
+    async def test_large_bulk_insert_uses_copy(self):
+        """Above COPY_THRESHOLD rows are staged with COPY, then merged once."""
+        mock_session = Mock()
+        cursor = mock_session.connection.return_value.connection.cursor.return_value
+        cursor.rowcount = 3
+        copied = []
+        cursor.copy_expert.side_effect = lambda sql, buffer: copied.append(buffer.read())
+
+        base_time = datetime(2024, 1, 11, 12, 0, 0, tzinfo=UTC)
+        prices = [
+            PriceData(
+                symbol="BTC-USD",
+                timestamp=base_time + timedelta(minutes=i),
+                price=45000.0 + i,
+                source="binance",
+            )
+            for i in range(3)
+        ]
+
+        client = BinanceClient()
+        client.COPY_THRESHOLD = 2
+        inserted = await client.store_prices_bulk(prices, mock_session)
+
+        assert inserted == 3
+        mock_session.execute.assert_called_once()  # Only SET LOCAL synchronous_commit
+        rows = copied[0].splitlines()
+        assert len(rows) == 3
+        assert rows[0] == "BTC-USD,2024-01-11 12:00:00+00:00,45000.0,,,,,,binance"
+        statements = [call.args[0] for call in cursor.execute.call_args_list]
+        # The offset is kept by a timestamptz stage column, as in the unnest path
+        assert "timestamp::timestamptz AS timestamp" in statements[0]
+        assert "ON CONFLICT ON CONSTRAINT uq_symbol_timestamp DO NOTHING" in statements[1]
+        cursor.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_store_price_uses_bulk_path(self):
+        """Deprecated store_price still writes through store_prices_bulk without committing."""
+        mock_session = Mock()
+        mock_session.execute.return_value = Mock(rowcount=1)
+        price = PriceData(
+            symbol="BTC-USD",
+            timestamp=datetime(2024, 1, 11, 12, 0, 0, tzinfo=UTC),
+            price=45000.0,
+            source="coinbase",
+        )
+
+        client = CoinbaseClient()
+        with pytest.warns(DeprecationWarning):
+            await client.store_price(price, mock_session)
+
+        assert mock_session.execute.call_count == 2  # synchronous_commit + insert
+        assert not mock_session.commit.called
 
     @pytest.mark.asyncio
     async def test_bulk_insert_empty_list(self):
@@ -474,3 +1017,84 @@ class TestBulkStorage:
 
         assert inserted == 0
         assert not mock_session.execute.called
+
+
+class TestPriceHistory:
+    """Tests for get_price_history method."""
+
+    @pytest.fixture
+    def session(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            yield session
+
+    @pytest.mark.asyncio
+    async def test_returns_recent_rows_in_order(self, session):
+        """Only rows inside the window for the symbol come back, oldest first."""
+        now = datetime.now(UTC)
+        session.add_all(
+            [
+                Price(symbol="BTC-USD", timestamp=now - timedelta(minutes=1), price=101.0),
+                Price(
+                    symbol="BTC-USD",
+                    timestamp=now - timedelta(minutes=2),
+                    price=100.0,
+                    volume_24h=5.0,
+                ),
+                Price(symbol="BTC-USD", timestamp=now - timedelta(minutes=90), price=90.0),
+                Price(symbol="ETH-USD", timestamp=now - timedelta(minutes=1), price=2500.0),
+            ]
+        )
+        session.commit()
+
+        df = await CoinbaseClient().get_price_history("BTC-USD", 60, session)
+
+        assert list(df.columns) == ["timestamp", "price", "volume", "symbol"]
+        assert df["price"].tolist() == [100.0, 101.0]
+        assert df["volume"].iloc[0] == 5.0
+        assert df["symbol"].unique().tolist() == ["BTC-USD"]
+
+    @pytest.mark.asyncio
+    async def test_streamed_chunks_are_concatenated(self, session):
+        """Rows fetched over several yield_per chunks form one ordered frame."""
+        now = datetime.now(UTC)
+        session.add_all(
+            [
+                Price(symbol="BTC-USD", timestamp=now - timedelta(minutes=i), price=100.0 - i)
+                for i in range(1, 6)
+            ]
+        )
+        session.commit()
+
+        client = CoinbaseClient()
+        client.HISTORY_YIELD_PER = 2
+        df = await client.get_price_history("BTC-USD", 60, session)
+
+        assert df.index.tolist() == [0, 1, 2, 3, 4]
+        assert df["price"].tolist() == [95.0, 96.0, 97.0, 98.0, 99.0]
+
+    @pytest.mark.asyncio
+    async def test_no_rows_returns_empty_frame(self, session):
+        """With no stored prices the result is an empty DataFrame with the usual columns."""
+        df = await CoinbaseClient().get_price_history("BTC-USD", 60, session)
+
+        assert df.empty
+        assert list(df.columns) == ["timestamp", "price", "volume", "symbol"]
+        assert str(df["timestamp"].dtype) == "datetime64[ns]"
+        assert df["price"].dtype == "float64"
+        assert df["volume"].dtype == "float64"
+
+    @pytest.mark.asyncio
+    async def test_missing_volume_is_nan(self, session):
+        """Populated frames use the same fixed dtypes, with NULL volume as NaN."""
+        now = datetime.now(UTC)
+        session.add(Price(symbol="BTC-USD", timestamp=now - timedelta(minutes=1), price=100.0))
+        session.commit()
+
+        df = await CoinbaseClient().get_price_history("BTC-USD", 60, session)
+
+        assert str(df["timestamp"].dtype) == "datetime64[ns]"
+        assert df["volume"].dtype == "float64"
+        assert df["volume"].isna().all()
+
@@ -11,6 +11,7 @@ from src.phase1_detector.anomaly_detection.statistical import (
 from src.phase1_detector.anomaly_detection.asset_profiles import (
     AssetProfileManager,
     AssetThresholds,
+    get_profile_manager,
 )
 from src.phase1_detector.anomaly_detection.models import AnomalyType
 
@@ -191,6 +192,28 @@ class TestAssetProfileManager:
 
         assert thresholds1 is thresholds2  # Same object (cached)
 
+    def test_get_profile_manager_is_shared(self):
+        """Factory should return one shared manager per config path."""
+        manager1 = get_profile_manager("config/thresholds.yaml")
+        manager2 = get_profile_manager("config/thresholds.yaml")
+
+        assert manager1 is manager2
+
+    def test_reload_picks_up_changed_file(self, tmp_path):
+        """Reload should re-parse only when the file on disk changed."""
+        config_file = tmp_path / "thresholds.yaml"
+        config_file.write_text("global_defaults:\n  z_score_threshold: 3.0\n")
+        manager = AssetProfileManager(str(config_file))
+        loaded = manager._config
+
+        manager.reload_config()
+        assert manager._config is loaded  # Unchanged file is not re-parsed
+
+        config_file.write_text("global_defaults:\n  z_score_threshold: 4.25\n")
+        manager.reload_config()
+
+        assert manager.get_thresholds("UNKNOWN-USD").z_score_threshold == 4.25
+
     def test_get_timeframe_config(self):
         """Should load timeframe configuration from YAML."""
         manager = AssetProfileManager("config/thresholds.yaml")
@@ -1,5 +1,7 @@
 """Unit tests for news aggregation module."""
 
+import asyncio
+import json
 import pytest
 from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch, AsyncMock
@@ -9,6 +11,7 @@ import os
 os.environ["DATABASE__PASSWORD"] = "test_password"
 os.environ["NEWS__CRYPTOPANIC_API_KEY"] = "test_crypto_key"
 
+from config.settings import settings
 from src.phase1_detector.news_aggregation import (
     NewsArticle,
     CryptoPanicClient,
@@ -99,6 +102,31 @@ class TestNewsArticleModels:
         assert news_article.source == "newsapi"
         assert "ETH-USD" in news_article.symbols
 
+    def test_dedup_key_prefers_url(self):
+        """Articles are keyed by URL, falling back to the title."""
+        published_at = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+        with_url = NewsArticle(
+            source="rss", title="A", url="https://example.com/a", published_at=published_at
+        )
+        without_url = NewsArticle(source="rss", title="B", published_at=published_at)
+
+        assert with_url.dedup_key == "https://example.com/a"
+        assert with_url.model_copy().dedup_key == "https://example.com/a"
+        assert without_url.dedup_key == "B"
+        assert "dedup_key" not in with_url.model_dump()
+
+    def test_dedup_key_ignores_tracking_parameters(self):
+        """Share links with tracking parameters key the same as the plain URL."""
+        published_at = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+        shared = NewsArticle(
+            source="rss",
+            title="A",
+            url="https://Example.com/a?id=3&utm_source=x&fbclid=abc#comments",
+            published_at=published_at,
+        )
+
+        assert shared.dedup_key == "https://example.com/a?id=3"
+
 
 class TestCryptoPanicClient:
     """Test CryptoPanic API client."""
@@ -110,6 +138,7 @@ class TestCryptoPanicClient:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = MOCK_CRYPTOPANIC_RESPONSE
+            mock_response.content = json.dumps(MOCK_CRYPTOPANIC_RESPONSE).encode()
             mock_response.raise_for_status = Mock()
             mock_get.return_value = mock_response
 
@@ -119,6 +148,7 @@ class TestCryptoPanicClient:
                 assert len(articles) > 0
                 assert articles[0].source == "cryptopanic"
                 assert "BTC" in articles[0].symbols
+                assert articles[0].published_at == datetime(2024, 1, 15, 12, tzinfo=timezone.utc)
 
     @pytest.mark.asyncio
     async def test_get_news_without_api_key(self):
@@ -139,6 +169,62 @@ class TestCryptoPanicClient:
                 is_healthy = await client.health_check()
                 assert is_healthy is True
 
+    @pytest.mark.asyncio
+    async def test_response_reused_across_windows(self):
+        """Different time windows for the same currencies share one request."""
+        with patch("httpx.AsyncClient.get") as mock_get:
+            mock_response = Mock()
+            mock_response.json.return_value = MOCK_CRYPTOPANIC_RESPONSE
+            mock_response.content = json.dumps(MOCK_CRYPTOPANIC_RESPONSE).encode()
+            mock_response.raise_for_status = Mock()
+            mock_get.return_value = mock_response
+            published_at = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+            async with CryptoPanicClient(api_key="test_key") as client:
+                wide = await client.get_news(
+                    symbols=["BTC-USD"],
+                    start_time=published_at - timedelta(hours=1),
+                    end_time=published_at + timedelta(hours=1),
+                )
+                narrow = await client.get_news(
+                    symbols=["BTC-USD"], start_time=published_at + timedelta(minutes=1)
+                )
+                await client.get_news(symbols=["ETH-USD"])
+
+            assert len(wide) == 1
+            assert narrow == []
+            assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_symbols_sent_as_currency_codes(self):
+        """Trading pairs are sent as comma-separated currency codes, in order."""
+        with patch("httpx.AsyncClient.get") as mock_get:
+            mock_response = Mock()
+            mock_response.json.return_value = {"results": []}
+            mock_response.content = b'{"results": []}'
+            mock_response.raise_for_status = Mock()
+            mock_get.return_value = mock_response
+
+            async with CryptoPanicClient(api_key="test_key") as client:
+                await client.get_news(symbols=["ETH-USD", "BTC", "SOL-USDT"])
+
+            params = mock_get.call_args.kwargs["params"]
+            assert params["currencies"] == "ETH,BTC,SOL"
+            assert params["public"] == "true"
+
+    @pytest.mark.asyncio
+    async def test_own_http_client_created_lazily(self):
+        """A standalone client opens its pool on first use and close() releases it."""
+        client = CryptoPanicClient(api_key="test_key")
+        assert client._http_client is None
+
+        http_client = client._client
+        assert client._client is http_client
+
+        await client.close()
+        assert http_client.is_closed
+        assert client._http_client is None
+
     def test_source_name(self):
         """Test source name property."""
         client = CryptoPanicClient(api_key="test_key")
@@ -286,3 +372,293 @@ class TestNewsAggregator:
             assert health["cryptopanic"] is True
             assert "rss" in health
             assert health["rss"] is True
+
+    @pytest.mark.asyncio
+    async def test_sources_share_one_http_client(self):
+        """HTTP sources reuse the aggregator's client, which close() shuts down."""
+        async with NewsAggregator(mode="live", cryptopanic_key="test_key") as aggregator:
+            http_sources = [c for c in aggregator.clients if hasattr(c, "_owns_client")]
+            assert {c._client for c in http_sources} == {aggregator._http_client}
+            assert not any(c._owns_client for c in http_sources)
+
+        assert aggregator._http_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_fetch_retries_connection_errors(self):
+        """A source that fails transiently is retried with backoff."""
+        with patch(
+            "src.phase1_detector.news_aggregation.aggregator.HistoricalReplayClient"
+        ) as MockReplay:
+            mock_replay_client = AsyncMock()
+            mock_replay_client.get_news.side_effect = [
+                ConnectionError("rate limited"),
+                [
+                    NewsArticle(
+                        source="replay",
+                        title="BTC news",
+                        url="https://example.com/btc",
+                        published_at=datetime.now(timezone.utc),
+                        symbols=["BTC"],
+                    )
+                ],
+            ]
+            MockReplay.return_value = mock_replay_client
+
+            aggregator = NewsAggregator(mode="replay")
+
+            with patch("asyncio.sleep", new=AsyncMock()) as sleep:
+                articles = await aggregator.get_news(symbols=["BTC-USD"])
+
+            assert len(articles) == 1
+            assert mock_replay_client.get_news.call_count == 2
+            sleep.assert_awaited_once_with(0.5)
+
+    @pytest.mark.asyncio
+    async def test_failing_source_is_skipped_after_threshold(self):
+        """Repeated failures open the breaker; the source is skipped until it resets."""
+        with patch(
+            "src.phase1_detector.news_aggregation.aggregator.HistoricalReplayClient"
+        ) as MockReplay:
+            mock_replay_client = AsyncMock()
+            mock_replay_client.source_name = "replay"
+            mock_replay_client.get_news.side_effect = ValueError("bad dataset")
+            MockReplay.return_value = mock_replay_client
+
+            aggregator = NewsAggregator(mode="replay")
+
+            with patch.object(settings.news, "breaker_failure_threshold", 2):
+                for _ in range(3):
+                    assert await aggregator.get_news(symbols=["BTC-USD"]) == []
+
+                assert mock_replay_client.get_news.call_count == 2
+
+                # Once the reset time has passed, one trial fetch is let through
+                aggregator._source_open_until["replay"] = 0.0
+                await aggregator.get_news(symbols=["BTC-USD"])
+
+            assert mock_replay_client.get_news.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_slow_source_times_out(self):
+        """A source slower than source_timeout_seconds counts as failed."""
+
+        async def get_news(**kwargs):
+            await asyncio.sleep(1)
+            return []
+
+        with patch(
+            "src.phase1_detector.news_aggregation.aggregator.HistoricalReplayClient"
+        ) as MockReplay:
+            mock_replay_client = AsyncMock()
+            mock_replay_client.source_name = "replay"
+            mock_replay_client.get_news.side_effect = get_news
+            MockReplay.return_value = mock_replay_client
+
+            aggregator = NewsAggregator(mode="replay")
+
+            with patch.object(settings.news, "source_timeout_seconds", 0.01):
+                assert await aggregator.get_news(symbols=["BTC-USD"]) == []
+
+            assert aggregator._source_failures == {"replay": 1}
+
+    @pytest.mark.asyncio
+    async def test_fetches_are_bounded(self):
+        """No more than max_concurrent_fetches sources are fetched at once."""
+        in_flight = 0
+        peak = 0
+
+        async def get_news(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        with patch(
+            "src.phase1_detector.news_aggregation.aggregator.HistoricalReplayClient"
+        ), patch(
+            "src.phase1_detector.news_aggregation.aggregator.settings.news.max_concurrent_fetches",
+            2,
+        ):
+            aggregator = NewsAggregator(mode="replay")
+
+        clients = []
+        for _ in range(5):
+            client = AsyncMock()
+            client.get_news.side_effect = get_news
+            clients.append(client)
+        aggregator.clients = clients
+
+        await aggregator.get_news(symbols=["BTC-USD"])
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_deduplication_keeps_newest_across_sources(self):
+        """Of duplicate URLs across sources, the newest article is kept and tagged."""
+        anomaly_time = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
+
+        def article(source: str, url: str, minutes: int) -> NewsArticle:
+            return NewsArticle(
+                source=source,
+                title=f"{source} {url}",
+                url=f"https://example.com/{url}",
+                published_at=anomaly_time + timedelta(minutes=minutes),
+                symbols=["BTC"],
+            )
+
+        with patch(
+            "src.phase1_detector.news_aggregation.aggregator.HistoricalReplayClient"
+        ):
+            aggregator = NewsAggregator(mode="replay")
+
+        first = AsyncMock()
+        first.get_news.return_value = [article("a", "same", -10), article("a", "only-a", 5)]
+        second = AsyncMock()
+        second.get_news.return_value = [article("b", "same", -2)]
+        aggregator.clients = [first, second]
+
+        articles = await aggregator.get_news_for_anomaly(
+            symbols=["BTC-USD"], anomaly_time=anomaly_time, window_minutes=30
+        )
+
+        assert [a.title for a in articles] == ["a only-a", "b same"]
+        assert [a.timing_tag for a in articles] == ["post_event", "pre_event"]
+        assert articles[1].time_diff_minutes == -2
+
+    @pytest.mark.asyncio
+    async def test_fast_sources_merged_before_slow_ones_finish(self):
+        """Results are merged as each source completes; failures are skipped."""
+        merged_fast = asyncio.Event()
+
+        def article(source: str) -> NewsArticle:
+            return NewsArticle(
+                source=source,
+                title=f"{source} news",
+                url=f"https://example.com/{source}",
+                published_at=datetime.now(timezone.utc),
+                symbols=["BTC"],
+            )
+
+        async def slow_news(**kwargs):
+            await merged_fast.wait()  # Only finishes once the fast source was merged
+            return [article("slow")]
+
+        with patch(
+            "src.phase1_detector.news_aggregation.aggregator.HistoricalReplayClient"
+        ):
+            aggregator = NewsAggregator(mode="replay")
+
+        fast, slow, broken = AsyncMock(), AsyncMock(), AsyncMock()
+        fast.get_news.return_value = [article("fast")]
+        slow.get_news.side_effect = slow_news
+        broken.get_news.side_effect = ValueError("bad response")
+        aggregator.clients = [slow, broken, fast]
+
+        merge = aggregator._merge_articles
+
+        def merge_and_signal(merged, articles, anomaly_time=None):
+            merge(merged, articles, anomaly_time)
+            merged_fast.set()
+
+        with patch.object(aggregator, "_merge_articles", side_effect=merge_and_signal):
+            articles = await asyncio.wait_for(aggregator.get_news(symbols=["BTC-USD"]), 1.0)
+
+        assert {a.source for a in articles} == {"fast", "slow"}
+
+    @pytest.mark.asyncio
+    async def test_repeated_fetches_share_cached_results(self):
+        """Overlapping calls within the TTL hit each source once, with own copies."""
+        anomaly_time = datetime(2024, 1, 15, 12, 0, 30, tzinfo=timezone.utc)
+
+        with patch(
+            "src.phase1_detector.news_aggregation.aggregator.HistoricalReplayClient"
+        ) as MockReplay:
+            mock_replay_client = AsyncMock()
+            mock_replay_client.get_news.return_value = [
+                NewsArticle(
+                    source="replay",
+                    title="BTC news",
+                    url="https://example.com/btc",
+                    published_at=anomaly_time - timedelta(minutes=5),
+                    symbols=["BTC"],
+                )
+            ]
+            MockReplay.return_value = mock_replay_client
+            aggregator = NewsAggregator(mode="replay")
+
+        first, second = await asyncio.gather(
+            aggregator.get_news_for_anomaly(["BTC-USD"], anomaly_time, window_minutes=30),
+            aggregator.get_news_for_anomaly(
+                ["BTC-USD"], anomaly_time + timedelta(seconds=10), window_minutes=30
+            ),
+        )
+
+        assert mock_replay_client.get_news.call_count == 1
+        assert first[0] is not second[0]
+        assert first[0].time_diff_minutes == pytest.approx(-5.0)
+        assert second[0].time_diff_minutes == pytest.approx(-5.0 - 10 / 60)
+
+    @pytest.mark.asyncio
+    async def test_failed_fetches_are_not_cached(self):
+        """A source that failed is fetched again on the next call."""
+        with patch(
+            "src.phase1_detector.news_aggregation.aggregator.HistoricalReplayClient"
+        ) as MockReplay:
+            mock_replay_client = AsyncMock()
+            mock_replay_client.get_news.side_effect = [ValueError("bad response"), []]
+            MockReplay.return_value = mock_replay_client
+            aggregator = NewsAggregator(mode="replay")
+
+        await aggregator.get_news(symbols=["BTC-USD"])
+        await aggregator.get_news(symbols=["BTC-USD"])
+
+        assert mock_replay_client.get_news.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_health_check_times_out_hung_source(self):
+        """A source that never answers is reported unhealthy after the timeout."""
+        with patch(
+            "src.phase1_detector.news_aggregation.aggregator.HistoricalReplayClient"
+        ):
+            aggregator = NewsAggregator(mode="replay")
+
+        async def hang():
+            await asyncio.Event().wait()
+
+        healthy, hung, broken = AsyncMock(), AsyncMock(), AsyncMock()
+        healthy.source_name, hung.source_name, broken.source_name = "rss", "grok", "replay"
+        healthy.health_check.return_value = True
+        hung.health_check.side_effect = hang
+        broken.health_check.side_effect = ConnectionError("down")
+        aggregator.clients = [healthy, hung, broken]
+
+        with patch.object(settings.news, "health_check_timeout_seconds", 0.05):
+            health = await asyncio.wait_for(aggregator.health_check(), 1.0)
+
+        assert health == {"rss": True, "grok": False, "replay": False}
+
+    @pytest.mark.asyncio
+    async def test_health_check_reuses_recent_report(self):
+        """Checks within the cache TTL do not query the sources again."""
+        with patch(
+            "src.phase1_detector.news_aggregation.aggregator.HistoricalReplayClient"
+        ) as MockReplay:
+            mock_replay_client = AsyncMock()
+            mock_replay_client.source_name = "replay"
+            mock_replay_client.health_check.return_value = True
+            MockReplay.return_value = mock_replay_client
+
+            aggregator = NewsAggregator(mode="replay")
+
+        assert await aggregator.health_check() == {"replay": True}
+        assert await aggregator.health_check() == {"replay": True}
+        mock_replay_client.health_check.assert_awaited_once()
+
+        with patch.object(settings.news, "health_cache_ttl_seconds", 0):
+            aggregator._health_cache = None
+            await aggregator.health_check()
+            await aggregator.health_check()
+
+        assert mock_replay_client.health_check.await_count == 3
@@ -0,0 +1,290 @@
+"""Tests for the single-timeframe statistical detectors."""
+
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from config.settings import settings
+from src.phase1_detector.anomaly_detection.statistical import (
+    AnomalyDetector,
+    BollingerBandDetector,
+    CombinedDetector,
+    VolumeSpikeDetector,
+    ZScoreDetector,
+    _mean_std,
+    _rolling_window_returns,
+)
+from src.phase1_detector.anomaly_detection.models import AnomalyType
+
+
+def make_prices(
+    prices: list[float], volumes: list[float] | None = None, symbol: str = "TEST-USD"
+) -> pd.DataFrame:
+    """Create one-minute price data ending at 2024-03-14 14:00."""
+    base_time = datetime(2024, 3, 14, 14, 0, 0)
+    n = len(prices)
+    return pd.DataFrame(
+        {
+            "timestamp": [base_time + timedelta(minutes=i - n + 1) for i in range(n)],
+            "price": prices,
+            "volume": volumes if volumes is not None else [1000.0] * n,
+            "symbol": [symbol] * n,
+        }
+    )
+
+
+def noisy_prices(n: int, seed: int = 0) -> list[float]:
+    """Random-walk prices around 100 with ~0.1% steps."""
+    rng = np.random.default_rng(seed)
+    return list(100.0 * np.cumprod(1 + rng.normal(0, 0.001, n)))
+
+
+class TestMeanStd:
+    """Test the single-pass mean/std helper."""
+
+    def test_matches_numpy(self):
+        """Should match NumPy mean and sample std."""
+        values = np.random.default_rng(4).normal(0.01, 0.2, 59)
+
+        mean, std = _mean_std(values)
+
+        assert mean == pytest.approx(values.mean())
+        assert std == pytest.approx(values.std(ddof=1))
+
+    def test_large_near_constant_values_stay_precise(self):
+        """Tiny spread on a large level should not lose precision."""
+        values = 1e9 + np.random.default_rng(5).normal(0.0, 0.5, 59)
+
+        _, std = _mean_std(values)
+
+        assert std == pytest.approx(values.std(ddof=1), rel=1e-6)
+
+    def test_constant_values_have_zero_std(self):
+        """Constant input should give exactly zero std."""
+        _, std = _mean_std(np.full(59, 123456.789))
+
+        assert std == 0
+
+
+class TestRollingWindowReturns:
+    """Test vectorized rolling window returns."""
+
+    def test_matches_per_window_loop(self):
+        """Each entry is the first-to-last return of one window."""
+        prices = np.array(noisy_prices(30))
+        expected = [
+            (prices[i + 9] - prices[i]) / prices[i] * 100 for i in range(len(prices) - 9)
+        ]
+
+        np.testing.assert_allclose(_rolling_window_returns(prices, 10), expected)
+
+    def test_short_input_returns_empty(self):
+        """Fewer prices than the window size yields no returns."""
+        assert len(_rolling_window_returns(np.array([1.0, 2.0]), 5)) == 0
+
+
+class TestBollingerBandDetector:
+    """Test Bollinger Band breakout detection."""
+
+    def test_detects_breakout_above_upper_band(self):
+        """A jump well above the band should be flagged as a spike."""
+        prices = noisy_prices(40) + [110.0]
+        data = make_prices(prices)
+
+        anomalies = BollingerBandDetector(window=20, std_multiplier=2.0).detect(data)
+
+        assert len(anomalies) == 1
+        anomaly = anomalies[0]
+        tail = np.array(prices[-20:])
+        assert anomaly.anomaly_type == AnomalyType.PRICE_SPIKE
+        assert anomaly.price_before == pytest.approx(tail.mean())
+        assert anomaly.z_score == pytest.approx((110.0 - tail.mean()) / tail.std(ddof=1))
+
+    def test_uses_row_at_current_time(self):
+        """Bands are evaluated at current_time, ignoring later rows."""
+        prices = noisy_prices(40) + [90.0] + noisy_prices(5, seed=1)
+        data = make_prices(prices)
+        current_time = data["timestamp"].iloc[40]
+
+        anomalies = BollingerBandDetector(window=20).detect(data, current_time)
+
+        assert len(anomalies) == 1
+        assert anomalies[0].anomaly_type == AnomalyType.PRICE_DROP
+        assert anomalies[0].detected_at == current_time
+        assert anomalies[0].price_at_detection == 90.0
+
+    def test_insufficient_window_returns_empty(self):
+        """No detection when the window before current_time is too short."""
+        data = make_prices(noisy_prices(40))
+
+        anomalies = BollingerBandDetector(window=20).detect(data, data["timestamp"].iloc[5])
+
+        assert anomalies == []
+
+    def test_does_not_mutate_input(self):
+        """Detection should not add columns to the caller's DataFrame."""
+        data = make_prices(noisy_prices(40) + [110.0])
+        columns = list(data.columns)
+
+        BollingerBandDetector().detect(data)
+
+        assert list(data.columns) == columns
+
+
+class TestZScoreDetector:
+    """Test single-step return Z-score detection."""
+
+    def test_detects_return_spike(self):
+        """A +5% jump after a quiet hour should be flagged."""
+        prices = noisy_prices(70) + [0.0]
+        prices[-1] = prices[-2] * 1.05
+        data = make_prices(prices)
+
+        anomalies = ZScoreDetector(threshold=3.0).detect(data)
+
+        assert len(anomalies) == 1
+        anomaly = anomalies[0]
+        assert anomaly.anomaly_type == AnomalyType.PRICE_SPIKE
+        assert anomaly.price_change_pct == pytest.approx(5.0)
+        assert anomaly.price_before == pytest.approx(prices[-2])
+        assert anomaly.price_at_detection == pytest.approx(prices[-1])
+
+    def test_window_ends_at_current_time(self):
+        """Rows after current_time are ignored."""
+        prices = noisy_prices(70) + [0.0] + noisy_prices(5, seed=2)
+        prices[70] = prices[69] * 0.95
+        data = make_prices(prices)
+        current_time = data["timestamp"].iloc[70]
+
+        anomalies = ZScoreDetector(threshold=3.0).detect(data, current_time)
+
+        assert len(anomalies) == 1
+        assert anomalies[0].anomaly_type == AnomalyType.PRICE_DROP
+        assert anomalies[0].detected_at == current_time
+
+    def test_requires_full_window(self):
+        """Fewer than 60 points in the window should not detect."""
+        prices = noisy_prices(40) + [0.0]
+        prices[-1] = prices[-2] * 1.10
+        data = make_prices(prices)
+
+        assert ZScoreDetector().detect(data) == []
+
+
+class TestVolumeSpikeDetector:
+    """Test volume Z-score detection."""
+
+    def test_detects_volume_spike(self):
+        """A 5x volume bar should be flagged against a steady baseline."""
+        rng = np.random.default_rng(3)
+        volumes = list(rng.normal(1000.0, 20.0, 70)) + [5000.0]
+        data = make_prices(noisy_prices(71), volumes)
+
+        anomalies = VolumeSpikeDetector(threshold=2.5).detect(data)
+
+        assert len(anomalies) == 1
+        anomaly = anomalies[0]
+        baseline = np.array(volumes[-61:-1])  # 60-minute window is inclusive
+        assert anomaly.anomaly_type == AnomalyType.VOLUME_SPIKE
+        assert anomaly.volume_before == pytest.approx(baseline.mean())
+        assert anomaly.z_score == pytest.approx(
+            (5000.0 - baseline.mean()) / baseline.std(ddof=1)
+        )
+
+    def test_sparse_index_uses_positional_prices(self):
+        """Prices come from the rows around the spike, not index labels."""
+        rng = np.random.default_rng(3)
+        volumes = list(rng.normal(1000.0, 20.0, 70)) + [5000.0]
+        prices = noisy_prices(71)
+        data = make_prices(prices, volumes)
+        data.index = data.index * 2  # Non-contiguous labels, as after a filter
+
+        anomalies = VolumeSpikeDetector(threshold=2.5).detect(data)
+
+        assert len(anomalies) == 1
+        assert anomalies[0].price_before == pytest.approx(prices[-2])
+        assert anomalies[0].price_at_detection == pytest.approx(prices[-1])
+
+    def test_constant_volume_returns_empty(self):
+        """Zero baseline variance should not produce a detection."""
+        data = make_prices(noisy_prices(71), [1000.0] * 71)
+
+        assert VolumeSpikeDetector().detect(data) == []
+
+
+class TestCombinedDetector:
+    """Test fused price + volume detection."""
+
+    def make_spike(self, volume_multiplier: float) -> pd.DataFrame:
+        rng = np.random.default_rng(6)
+        prices = noisy_prices(70) + [0.0]
+        prices[-1] = prices[-2] * 1.05
+        volumes = list(rng.normal(1000.0, 20.0, 70)) + [1000.0 * volume_multiplier]
+        return make_prices(prices, volumes)
+
+    def test_price_and_volume_spike_combined(self):
+        """Price move with a volume surge yields one combined anomaly."""
+        data = self.make_spike(volume_multiplier=5.0)
+        detector = CombinedDetector(price_threshold=2.0, volume_threshold=2.0)
+
+        anomalies = detector.detect(data)
+        price_anomaly = detector.price_detector.detect(data)[0]
+        volume_anomaly = detector.volume_detector.detect(data)[0]
+
+        assert len(anomalies) == 1
+        anomaly = anomalies[0]
+        assert anomaly.anomaly_type == AnomalyType.COMBINED
+        assert anomaly.z_score == pytest.approx(price_anomaly.z_score)
+        assert anomaly.price_before == pytest.approx(price_anomaly.price_before)
+        assert anomaly.volume_change_pct == pytest.approx(volume_anomaly.volume_change_pct)
+        assert anomaly.confidence == pytest.approx(
+            min((price_anomaly.confidence + volume_anomaly.confidence) / 2 * 1.5, 1.0)
+        )
+
+    def test_price_spike_without_volume_not_combined(self):
+        """Price move on normal volume is not a combined anomaly."""
+        data = self.make_spike(volume_multiplier=1.0)
+
+        assert CombinedDetector().detect(data) == []
+
+
+class TestQuietTickPrefilter:
+    """Test the AnomalyDetector quiet-tick fast path."""
+
+    def enable_prefilter(self):
+        return patch.multiple(
+            settings.detection, min_return_prefilter=0.05, min_volume_prefilter=1.5
+        )
+
+    def test_quiet_tick_skips_single_tick_detectors(self):
+        """Small return on normal volume should not run the fallback detectors."""
+        data = make_prices(noisy_prices(71))
+        data.loc[70, "price"] = data.loc[69, "price"]
+        detector = AnomalyDetector()
+
+        with self.enable_prefilter(), patch.object(
+            detector.combined_detector, "detect"
+        ) as combined:
+            assert detector._is_quiet_tick(data, None)
+            assert detector.detect_all(data) == []
+
+        combined.assert_not_called()
+
+    def test_large_move_is_not_quiet(self):
+        """A spike must still reach the detectors with the prefilter on."""
+        prices = [100.0] * 60 + [110.0]
+        data = make_prices(prices)
+        detector = AnomalyDetector()
+
+        with self.enable_prefilter():
+            assert not detector._is_quiet_tick(data, None)
+            assert len(detector.detect_all(data)) == 1
+
+    def test_disabled_by_default(self):
+        """With default settings no tick is treated as quiet."""
+        data = make_prices([100.0] * 61)
+
+        assert not AnomalyDetector()._is_quiet_tick(data, None)
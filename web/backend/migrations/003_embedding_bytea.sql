@@ -0,0 +1,7 @@
+-- Store news article embeddings as raw float32 bytes instead of JSON arrays
+-- Existing JSON embeddings are dropped; they are only used at clustering time
+
+ALTER TABLE news_articles
+ALTER COLUMN embedding TYPE BYTEA USING NULL;
+
+COMMENT ON COLUMN news_articles.embedding IS 'Sentence-transformer embedding as little-endian float32 bytes';
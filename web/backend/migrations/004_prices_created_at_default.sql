@@ -0,0 +1,6 @@
+-- Let the database stamp prices.created_at so bulk inserts can omit the column
+-- Tables created by `mane init-db` after this change already have the default
+-- The column is naive, so stamp UTC rather than the session's local time
+
+ALTER TABLE prices
+ALTER COLUMN created_at SET DEFAULT timezone('utc', now());